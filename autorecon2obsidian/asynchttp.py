@@ -0,0 +1,73 @@
+import asyncio
+
+class AsyncHttpClient:
+
+    # Just enough HTTP/1.1 on asyncio streams for whatportis' JSON API: GET requests over keep-alive
+    # connections that are reused, at most max_connections at a time, and Content-Length, chunked or
+    # read-to-close bodies
+
+    def __init__(self, host, port, max_connections, connect_timeout, read_timeout):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.slots = asyncio.Semaphore(max_connections)
+        self.idle_connections = []
+
+    async def get(self, path):
+        async with self.slots:
+            # a pooled connection may have been closed by the server since its last use, so a request
+            # on one is retried once on a fresh connection
+            while True:
+                reused = bool(self.idle_connections)
+                if reused:
+                    reader, writer = self.idle_connections.pop()
+                else:
+                    reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.connect_timeout)
+                try:
+                    writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nAccept: application/json\r\n\r\n".encode('ascii'))
+                    await writer.drain()
+                    status_code, keep_alive, body = await asyncio.wait_for(self._read_response(reader), self.read_timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self.idle_connections.append((reader, writer))
+                else:
+                    writer.close()
+                return status_code, body.decode('utf-8', errors='replace')
+
+    async def _read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError('connection closed by server')
+        version, status_code = status_line.split(None, 2)[:2]
+        headers = {}
+        while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip().lower()
+        keep_alive = headers.get('connection') != 'close' and version != b'HTTP/1.0'
+        if headers.get('transfer-encoding') == 'chunked':
+            chunks = []
+            while (chunk_size := int((await reader.readline()).split(b';')[0], 16)):
+                chunks.append(await reader.readexactly(chunk_size))
+                await reader.readexactly(2)
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return int(status_code), keep_alive, body
+
+    def close(self):
+        for _, writer in self.idle_connections:
+            writer.close()
+        self.idle_connections = []
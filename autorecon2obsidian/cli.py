@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from .constants import DEFAULT_MAX_EMBED_SIZE, DEFAULT_SERVICE_CACHE, DEFAULT_SERVICE_INDEX, DEFAULT_SHARD_SIZE, PROTOCOLS
+
+# Only argument parsing and the entry points live here. The rest of the package is imported once the
+# arguments are known to be valid, and modules only some runs need (requests for whatportis, asyncio
+# for --pipeline, the watchers) are imported where they are used
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='autorecon2obsidian',
+        description='Automatically generate Obsidian-compatible markdown files from a given directory',
+        epilog='Examples: autorecon2obsidian /path/to/your/results/directory /path/to/your/obsidian/vault/directory',
+    )
+
+    parser.add_argument('autorecon_dir', help='Path to the directory containing your autorecon "results" directory')
+    parser.add_argument('obsidian_dir', help='Path to the root directory of your obsidian vault')
+    parser.add_argument('--platform', choices=['HTB', 'PG', 'PEN200'], help='Challenge platform, defaults to the platform stored in --from-snapshot or else HTB')
+    parser.add_argument('--name', help='Name of the target machine')
+    parser.add_argument('--address', help='IP address of the target machine, defaults to the autorecon target directory name')
+    parser.add_argument('--batch', action='store_true', help='Treat autorecon_dir as an autorecon "results" root and process every <target>/scans directory in it')
+    parser.add_argument('--name-map', help='Batch mode: JSON object or "<target> <name>" lines mapping result directory names to machine names')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Batch mode: number of targets processed in parallel')
+    parser.add_argument('--no-nmap-xml', action='store_true', help='Do not take service names and versions from the nmap XML autorecon wrote')
+    parser.add_argument('--service-index', default=str(DEFAULT_SERVICE_INDEX), help='Offline port to service name index')
+    parser.add_argument('--no-service-index', action='store_true', help='Do not use the offline service index, look every port up with whatportis')
+    parser.add_argument('--host', default='127.0.0.1', help='whatportis host')
+    parser.add_argument('--port', help='whatportis port, when set ports missing from the offline index are looked up with whatportis')
+    parser.add_argument('--patterns', help='JSON file with extra report filename patterns: [{"pattern": "_mytool.txt", "tool": "mytool", "command": "mytool {address}"}]')
+    parser.add_argument('--save-snapshot', help='Save the gathered scan data (report references, hashes and service names) to this file')
+    parser.add_argument('--from-snapshot', help='Render from a snapshot saved with --save-snapshot instead of scanning autorecon_dir, report paths are resolved against autorecon_dir')
+    parser.add_argument('--pipeline', action='store_true', help='Overlap gathering, whatportis lookups, rendering and writing of different ports in an asyncio pipeline')
+    parser.add_argument('--watch', action='store_true', help='Keep running and update notes as autorecon writes new output')
+    parser.add_argument('--watch-debounce', type=float, default=2.0, help='Watch mode: seconds the scans directory must be quiet before notes are updated')
+    parser.add_argument('--watch-poll', action='store_true', help='Watch mode: poll the scans directory instead of using inotify')
+    parser.add_argument('--watch-poll-interval', type=float, default=1.0, help='Watch mode: seconds between polls when inotify is not used')
+    parser.add_argument('--templates', help='Directory with port-note.md and master.md templates (or <platform>/port-note.md ...) overriding the built-in ones')
+    parser.add_argument('--max-embed-size', type=int, default=DEFAULT_MAX_EMBED_SIZE, help='Reports larger than this many bytes are embedded as a head/tail excerpt and copied to the attachments folder, 0 embeds everything')
+    parser.add_argument('--shard-master', choices=['none', 'family', 'range'], default='none', help='Move the port sections of the master document into sub-documents grouped by service family or port range, leaving an index with the progress table')
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help='Maximum number of port sections per master sub-document')
+    parser.add_argument('--no-dedup', action='store_true', help='Embed every report body in its port note, even when other ports have the identical output')
+    parser.add_argument('--no-report-index', action='store_true', help='Do not add reports to the full-text index in <vault>/.autorecon2obsidian/index.sqlite3')
+    parser.add_argument('--force', action='store_true', help='Rewrite every note even when its inputs are unchanged')
+    parser.add_argument('--stats', action='store_true', help='Print per-phase timings, I/O counters and the slowest lookups and ports to stderr')
+    parser.add_argument('--stats-json', help='Write the run statistics to this JSON file')
+    parser.add_argument('--profile', help='Write a cProfile dump (main thread only) to this file, view it with python -m pstats')
+    parser.add_argument('--workers', type=int, default=8, help='Number of concurrent whatportis lookups')
+    parser.add_argument('--whatportis-connect-timeout', type=float, default=2.0, help='Seconds to wait for a connection to whatportis')
+    parser.add_argument('--whatportis-read-timeout', type=float, default=5.0, help='Seconds to wait for a whatportis answer')
+    parser.add_argument('--whatportis-retries', type=int, default=2, help='Number of times a failed whatportis lookup is retried')
+    parser.add_argument('--whatportis-failures', type=int, default=5, help='Failed whatportis requests in a row after which it is not queried for a minute, remaining ports fall back to cached names or Unknown')
+    parser.add_argument('--render-workers', type=int, default=min(8, (os.cpu_count() or 1) * 2), help='Number of port notes rendered and written concurrently')
+    parser.add_argument('--service-cache', default=str(DEFAULT_SERVICE_CACHE), help='Path to the persistent whatportis lookup cache')
+    parser.add_argument('--service-cache-ttl', type=float, default=30, help='Days before a cached whatportis lookup is queried again')
+    parser.add_argument('--service-cache-size', type=int, default=20000, help='Maximum number of ports kept in the whatportis lookup cache')
+    parser.add_argument('--refresh-services', action='store_true', help='Ignore cached whatportis lookups and query every port again')
+    parser.add_argument('--no-service-cache', action='store_true', help='Do not read or write the whatportis lookup cache')
+    arguments = parser.parse_args(argv)
+    if not arguments.batch and not arguments.name and not arguments.from_snapshot:
+        parser.error('--name is required unless --batch or --from-snapshot is used')
+    if arguments.batch and (arguments.save_snapshot or arguments.from_snapshot):
+        parser.error('snapshots cannot be combined with --batch')
+    if arguments.pipeline and arguments.from_snapshot:
+        parser.error('--pipeline cannot be combined with --from-snapshot, which has nothing to gather')
+    if arguments.watch and arguments.from_snapshot:
+        parser.error('--watch cannot be combined with --from-snapshot')
+    if arguments.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if arguments.address and arguments.batch:
+        parser.error('--address cannot be combined with --batch, every target uses its own directory name')
+    if arguments.watch and arguments.batch:
+        parser.error('--watch cannot be combined with --batch')
+    if arguments.max_embed_size < 0:
+        parser.error('--max-embed-size cannot be negative')
+    if arguments.shard_size < 1:
+        parser.error('--shard-size must be at least 1')
+    if arguments.workers < 1:
+        parser.error('--workers must be at least 1')
+    if arguments.render_workers < 1:
+        parser.error('--render-workers must be at least 1')
+    if arguments.service_cache_size < 1:
+        parser.error('--service-cache-size must be at least 1')
+    if arguments.whatportis_connect_timeout <= 0 or arguments.whatportis_read_timeout <= 0:
+        parser.error('whatportis timeouts must be positive')
+    if arguments.whatportis_retries < 0:
+        parser.error('--whatportis-retries cannot be negative')
+    if arguments.whatportis_failures < 1:
+        parser.error('--whatportis-failures must be at least 1')
+    if arguments.no_service_index and arguments.port is None:
+        parser.error('--no-service-index requires a whatportis server (--port)')
+    return arguments
+
+def parse_query_arguments(argv):
+    parser = argparse.ArgumentParser(
+        prog='autorecon2obsidian query',
+        description='Search the reports of every target added to a vault',
+        epilog='Examples: autorecon2obsidian query /path/to/vault "Apache/2.4.41" --tool nikto',
+    )
+    parser.add_argument('obsidian_dir', help='Path to the root directory of your obsidian vault')
+    parser.add_argument('terms', nargs='+', help='Terms that must all appear, each one matched as a phrase')
+    parser.add_argument('--raw', action='store_true', help='Pass the terms to SQLite FTS5 as a query expression (AND, OR, NOT, prefix*, "phrases")')
+    parser.add_argument('--platform', choices=['HTB', 'PG', 'PEN200'], help='Only search this platform')
+    parser.add_argument('--target', help='Only search this target')
+    parser.add_argument('--protocol', choices=PROTOCOLS, help='Only search this protocol')
+    parser.add_argument('--port', type=int, help='Only search this port')
+    parser.add_argument('--tool', help='Only search reports of this tool')
+    parser.add_argument('--limit', type=int, default=50, help='Maximum number of matches')
+    return parser.parse_args(argv)
+
+def query_main(argv):
+    import sqlite3
+    from .index import ReportIndex, report_index_path
+    arguments = parse_query_arguments(argv)
+    index_path = report_index_path(arguments.obsidian_dir)
+    if not index_path.is_file():
+        print(f"Error: no report index at {index_path}, run autorecon2obsidian on this vault first", file=sys.stderr)
+        return 1
+    if arguments.raw:
+        query = ' '.join(arguments.terms)
+    else:
+        query = ' '.join('"' + term.replace('"', '""') + '"' for term in arguments.terms)
+    started = time.perf_counter()
+    report_index = ReportIndex(index_path)
+    try:
+        matches = report_index.search(query, arguments.platform, arguments.target, arguments.protocol, arguments.port, arguments.tool, arguments.limit)
+    except sqlite3.OperationalError as e:
+        print(f"Error while searching for {query}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        report_index.close()
+    for platform, target, protocol, port, tool, file_name, snippet in matches:
+        print(f"{platform}/{target} {protocol}/{port} {tool} {file_name}: {' '.join(snippet.split())}")
+    print(f"{len(matches)} matches in {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+def run(autorecon2obidian):
+    if autorecon2obidian.arguments.batch:
+        print(f"Adding Obsidian-compatible preformatted notes to your vault from every autorecon target in {autorecon2obidian.autorecon_results_dir}")
+        return 0 if autorecon2obidian.run_batch() else 1
+    print(f"Adding Obsidian-compatible preformatted notes to your vault from autorecon {autorecon2obidian.autorecon_results_dir}")
+    updated_notes, total_notes = autorecon2obidian.process()
+    print(f"Updated {updated_notes} of {total_notes} port notes")
+    if autorecon2obidian.arguments.watch:
+        autorecon2obidian.watch()
+    return 0
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'query':
+        sys.exit(query_main(sys.argv[2:]))
+    # Parsed before anything heavy is imported, so --help and usage errors return straight away
+    arguments = parse_arguments()
+    from .core import AutoRecon2Obsidian
+    autorecon2obidian = AutoRecon2Obsidian(arguments)
+    profiler = None
+    if arguments.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        exit_code = run(autorecon2obidian)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(arguments.profile)
+        autorecon2obidian.close()
+    if arguments.stats:
+        print(autorecon2obidian.stats.summary(), file=sys.stderr)
+    if arguments.stats_json:
+        with open(arguments.stats_json, 'w') as file_handle:
+            json.dump(autorecon2obidian.stats.to_dict(), file_handle, indent=1)
+    sys.exit(exit_code)
@@ -0,0 +1,32 @@
+import os
+import string
+from pathlib import Path
+
+REPORT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_EMBED_SIZE = 256 * 1024
+KERNEL_COPY_SIZE = 8 * 1024 * 1024
+# Report files autorecon writes: text output is embedded in the port note, images are copied to the
+# attachments folder and shown inline
+TEXT_REPORT_SUFFIXES = ('.txt', '.html')
+IMAGE_REPORT_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif')
+MANIFEST_VERSION = 1
+SNAPSHOT_FORMAT = 'autorecon2obsidian-snapshot'
+SNAPSHOT_VERSION = 1
+CHECKBOX_ID_ALPHABET = string.ascii_uppercase + string.ascii_lowercase + string.digits
+DEFAULT_SERVICE_INDEX = Path(__file__).resolve().parent / 'service-index.bin'
+DEFAULT_TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+DEFAULT_SERVICE_CACHE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'autorecon2obsidian' / 'services.sqlite3'
+PROTOCOLS = ('tcp', 'udp')
+# Sections of a sharded master document, the first family with a keyword that starts a word of the
+# service name wins. Words are split on "-", "/" and "_", so HTTPS and SSL/HTTP are Web but NNTP is not NTP
+SERVICE_FAMILIES = (
+    ('SMB and RPC', ('MSRPC', 'EPMAP', 'NCACN', 'NETBIOS', 'MICROSOFT', 'SMB', 'WSMAN', 'WINRM', 'NMF')),
+    ('Directory Services', ('LDAP', 'KERBEROS', 'KPASSWD', 'GLOBALCAT', 'ADWS')),
+    ('Web', ('HTTP', 'WWW', 'WEB')),
+    ('Databases', ('SQL', 'MYSQL', 'MSSQL', 'POSTGRES', 'ORACLE', 'MONGO', 'REDIS', 'CASSANDRA', 'MEMCACHE')),
+    ('Mail', ('SMTP', 'SUBMISSION', 'POP3', 'IMAP')),
+    ('Remote Access', ('SSH', 'TELNET', 'WBT', 'RDP', 'VNC', 'X11')),
+    ('File Sharing', ('FTP', 'TFTP', 'NFS', 'MOUNTD', 'RSYNC', 'SUNRPC', 'RPCBIND')),
+    ('Network Services', ('DOMAIN', 'DNS', 'SNMP', 'NTP', 'DHCP', 'BOOTP', 'SYSLOG')),
+)
+DEFAULT_SHARD_SIZE = 25
@@ -0,0 +1,1329 @@
+import argparse
+import base64
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from .cli import parse_arguments
+from .constants import (
+    CHECKBOX_ID_ALPHABET, DEFAULT_TEMPLATE_DIR, IMAGE_REPORT_SUFFIXES, MANIFEST_VERSION, PROTOCOLS,
+    REPORT_CHUNK_SIZE, SERVICE_FAMILIES, SNAPSHOT_FORMAT, SNAPSHOT_VERSION, TEXT_REPORT_SUFFIXES,
+)
+from .findings import FINDINGS_CLASSIFIER, FINDINGS_VERSION, extract_findings
+from .index import ReportIndex, report_index_path
+from .reports import REPORT_CLASSIFIER, Port, Report, Target
+from .services import NmapServiceIndex, OfflineServiceIndex, ServiceNameCache, WhatportisError
+from .stats import NullStats, RunStats
+from .templates import StreamedValue, Template, TemplateError
+from .vault import HashingWriter, VaultStage, copy_file_contents
+
+class AutoRecon2Obsidian:
+
+    def __init__(self, arguments=None):
+        self.arguments = arguments if arguments is not None else parse_arguments()
+        self.autorecon_results_dir = self.arguments.autorecon_dir
+        self.obsidian_vault_dir = self.arguments.obsidian_dir
+        self.target_name = self.arguments.name
+        self.whatportis_host = self.arguments.host
+        self.whatportis_port = self.arguments.port
+        self.lookup_workers = self.arguments.workers
+        self.render_workers = self.arguments.render_workers
+        self.refresh_services = self.arguments.refresh_services
+        self.service_names = {}
+        self.service_index = self._load_service_index()
+        self.nmap_services = None if self.arguments.no_nmap_xml else NmapServiceIndex()
+        if self.arguments.patterns:
+            self._load_report_patterns(self.arguments.patterns)
+        self.service_cache = None
+        self.whatportis = None
+        if self.whatportis_port is not None:
+            from .whatportis import WhatportisClient
+            self.whatportis = WhatportisClient(
+                self.whatportis_host, self.whatportis_port, self.lookup_workers, self.arguments.whatportis_connect_timeout,
+                self.arguments.whatportis_read_timeout, self.arguments.whatportis_retries, self.arguments.whatportis_failures)
+        self.report_index = None
+        self.force_rewrite = self.arguments.force
+        self.max_embed_size = self.arguments.max_embed_size
+        self.stats = RunStats() if self.arguments.stats or self.arguments.stats_json else NullStats()
+        self.snapshot_header = self._read_snapshot_header(self.arguments.from_snapshot) if self.arguments.from_snapshot else None
+        if self.snapshot_header is not None:
+            self.target_name = self.target_name or self.snapshot_header['target']
+        # An explicit --platform wins, then the platform the snapshot was saved with
+        self.challenge_platform = self.arguments.platform or (self.snapshot_header['platform'] if self.snapshot_header else None) or 'HTB'
+        self.target_address = self.arguments.address or (self.snapshot_header['address'] if self.snapshot_header else self._guess_target_address())
+        self.port_note_template = self._load_template('port-note.md', {'target', 'platform', 'address', 'port', 'identified', 'tools', 'reports'})
+        self.master_template = self._load_template('master.md', {'target', 'platform', 'address', 'ports', 'possible_msrpc_ports', 'shards'})
+        self.shard_size = self.arguments.shard_size
+        self.master_shard_template = None
+        if self.arguments.shard_master != 'none':
+            self.master_shard_template = self._load_template('master-shard.md', {'target', 'platform', 'address', 'shard', 'ports'})
+        self.manifest = None
+        self.gathered_data = None
+        self.stage = None
+        self.vault_directories_created = False
+
+    def _template_directories(self):
+        config_home = Path(os.environ.get('XDG_CONFIG_HOME') or Path.home() / '.config')
+        template_directories = [Path(self.arguments.templates)] if self.arguments.templates else []
+        template_directories += [
+            Path(self.obsidian_vault_dir) / '.autorecon2obsidian' / 'templates',
+            config_home / 'autorecon2obsidian' / 'templates',
+            DEFAULT_TEMPLATE_DIR,
+        ]
+        return template_directories
+
+    def _load_template(self, template_name, context_names):
+        # The first match wins, a platform specific template before a generic one in each directory
+        for template_directory in self._template_directories():
+            for template_path in (template_directory / self.challenge_platform / template_name, template_directory / template_name):
+                if not template_path.is_file():
+                    continue
+                try:
+                    template = Template.load(template_path)
+                    template.check_names(context_names)
+                    return template
+                except (OSError, UnicodeDecodeError, TemplateError) as e:
+                    print(f"Error while loading template {template_path}: {e}", file=sys.stderr)
+                    sys.exit(1)
+        print(f"Error: no {template_name} template found in {', '.join(str(directory) for directory in self._template_directories())}", file=sys.stderr)
+        sys.exit(1)
+
+    def _guess_target_address(self):
+        # autorecon writes to results/<address>/scans, and batch mode passes that same layout
+        scans_dir = Path(self.autorecon_results_dir).resolve()
+        if scans_dir.name == 'scans':
+            return scans_dir.parent.name
+        return '<address>'
+
+    def _load_report_patterns(self, config_path):
+        try:
+            REPORT_CLASSIFIER.load(config_path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Error while loading report patterns from {config_path}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    def _load_service_index(self):
+        if self.arguments.no_service_index:
+            return None
+        try:
+            return OfflineServiceIndex.load(self.arguments.service_index)
+        except (OSError, ValueError, zlib.error) as e:
+            print(f"Error while loading offline service index {self.arguments.service_index}: {e}", file=sys.stderr)
+            if self.whatportis_port is None:
+                sys.exit(1)
+            return None
+
+    def _open_service_cache(self):
+        if self.arguments.no_service_cache:
+            return None
+        try:
+            return ServiceNameCache(self.arguments.service_cache, self.arguments.service_cache_ttl, self.arguments.service_cache_size)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error while opening service cache {self.arguments.service_cache}, continuing without it: {e}", file=sys.stderr)
+            return None
+
+    def _open_report_index(self):
+        index_path = report_index_path(self.obsidian_vault_dir)
+        try:
+            return ReportIndex(index_path, self.max_embed_size)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error while opening report index {index_path}, continuing without it: {e}", file=sys.stderr)
+            return None
+
+    def gather_autorecon_report_data(self, port_dirs=None):
+        target = Target(self.target_name, self.challenge_platform, self.autorecon_results_dir)
+        port_dirs = self._ordered_port_dirs(port_dirs)
+        self._refresh_nmap_services()
+        self.resolve_service_names(port_dirs)
+        for port_dir in port_dirs:
+            target.add_port(self._gather_port(port_dir, self._get_service_name(port_dir)))
+        return target
+
+    def _ordered_port_dirs(self, port_dirs=None):
+        if port_dirs is None:
+            return self._get_port_dirs('tcp') + self._get_port_dirs('udp')
+        return [port_dir for port_dir in port_dirs if port_dir.name.startswith('tcp')] + [port_dir for port_dir in port_dirs if port_dir.name.startswith('udp')]
+
+    def _refresh_nmap_services(self):
+        if self.nmap_services is not None:
+            with self.stats.phase('nmap xml'):
+                self.nmap_services.refresh(self.autorecon_results_dir)
+
+    def _gather_port(self, port_dir, service_name):
+        protocol, number = self._get_port_key(port_dir)
+        port = Port(protocol, number, str(port_dir), service_name)
+        nmap_service = self.nmap_services.lookup(protocol, number) if self.nmap_services is not None else None
+        if nmap_service is not None:
+            port.product = nmap_service.product
+            port.version = nmap_service.describe()
+        for report_file in self._get_report_files(port_dir):
+            report_stat = report_file.stat()
+            tool_used, command_used = self._classify_report(report_file)
+            command = base64.b64decode(command_used).decode('utf-8') if command_used != "Unknown" else None
+            port.add_report(Report(str(report_file), report_stat.st_size, report_stat.st_mtime_ns, tool_used, command))
+        return port
+    def _classify_report(self, report_file):
+        return REPORT_CLASSIFIER.classify(report_file.name)
+    def _get_command_used(self, report_file):
+        return self._classify_report(report_file)[1]
+    def _get_tool_used(self, report_file):
+        return self._classify_report(report_file)[0]
+    def _get_port_dirs(self, protocol, results_dir=None, warn=True):
+        if protocol != 'tcp' and protocol != 'udp':
+            print(f"Invalid protocol: {protocol}. Supported protocols are 'tcp' and 'udp'.", file=sys.stderr)
+            sys.exit(1)
+        try: 
+            candidate_dirs = [x for x in Path(results_dir or self.autorecon_results_dir).iterdir() if x.is_dir() and x.name.startswith(protocol)]
+        except Exception as e:
+            print(f"Error while getting TCP port directories: {e}", file=sys.stderr)
+            sys.exit(1)
+        port_dirs = []
+        for port_dir in candidate_dirs:
+            # only <protocol><number> directories are autorecon port directories, e.g. not tcp_old
+            if port_dir.name[3:].isdigit():
+                port_dirs.append(port_dir)
+            elif warn:
+                print(f"Skipping {port_dir}, not a port directory", file=sys.stderr)
+        return port_dirs
+    def _get_report_files(self, port_dir):
+        try:
+            report_files = [x for x in Path(port_dir).iterdir() if x.is_file() and x.name.lower().endswith(TEXT_REPORT_SUFFIXES + IMAGE_REPORT_SUFFIXES)]
+        except Exception as e:
+            print(f"Error while getting report files for port {port_dir.name}: {e}", file=sys.stderr)
+            sys.exit(1)
+        return report_files
+    def _get_port_number(self, port_dir):
+        return port_dir.name.replace('tcp', '').replace('udp', '')
+    def _get_port_key(self, port_dir):
+        return port_dir.name[:3], int(self._get_port_number(port_dir))
+    def resolve_service_names(self, port_dirs):
+        whatportis_keys = self._resolve_local_service_names(port_dirs)
+        if whatportis_keys:
+            # whatportis answers per port number, so tcp80 and udp80 share one lookup
+            with self.stats.phase('whatportis'):
+                whatportis_names = self._resolve_whatportis_names(sorted({port for _, port in whatportis_keys}))
+            for port_key in whatportis_keys:
+                self.service_names[port_key] = whatportis_names[port_key[1]]
+        return self.service_names
+
+    def _resolve_local_service_names(self, port_dirs):
+        # Names every port nmap or the offline index knows, and returns the keys left for whatportis
+        whatportis_keys = set()
+        for port_dir in port_dirs:
+            port_key = self._get_port_key(port_dir)
+            # nmap's own service detection always wins, and replaces a registry guess made before
+            # autorecon finished writing its XML
+            nmap_service = self.nmap_services.lookup(*port_key) if self.nmap_services is not None else None
+            if nmap_service is not None:
+                self.service_names[port_key] = self._lookup_preferred_name(nmap_service.name)
+                continue
+            if port_key in self.service_names:
+                continue
+            service_name = self.service_index.lookup(*port_key) if self.service_index is not None else None
+            if service_name is not None:
+                self.service_names[port_key] = self._lookup_preferred_name(service_name)
+            elif self.whatportis_port is not None:
+                whatportis_keys.add(port_key)
+            else:
+                self.service_names[port_key] = "Unknown"
+        return whatportis_keys
+    def _resolve_whatportis_names(self, ports):
+        resolved = {}
+        if self.service_cache is None:
+            self.service_cache = self._open_service_cache()
+        if self.service_cache is not None and not self.refresh_services:
+            resolved.update(self.service_cache.get_many(ports))
+            ports = [port for port in ports if port not in resolved]
+        if not ports:
+            return resolved
+        cache_entries = []
+        failed_ports = []
+        with ThreadPoolExecutor(max_workers=min(self.lookup_workers, len(ports))) as executor:
+            for port, (response_text, service_name) in zip(ports, executor.map(self._timed_query_whatportis, ports)):
+                if service_name is None:
+                    failed_ports.append(port)
+                    continue
+                resolved[port] = service_name
+                if response_text is not None:
+                    cache_entries.append((port, response_text, service_name))
+        if failed_ports:
+            resolved.update(self._fallback_service_names(failed_ports))
+        if cache_entries and self.service_cache is not None:
+            try:
+                self.service_cache.put_many(cache_entries)
+            except sqlite3.Error as e:
+                print(f"Error while updating service cache: {e}", file=sys.stderr)
+        return resolved
+    def _get_service_name(self, port_dir):
+        port_key = self._get_port_key(port_dir)
+        if port_key not in self.service_names:
+            self.resolve_service_names([port_dir])
+        return self.service_names[port_key]
+    def _timed_query_whatportis(self, port):
+        started = time.perf_counter()
+        try:
+            return self._query_whatportis(port)
+        finally:
+            self.stats.record_lookup(port, time.perf_counter() - started)
+
+    def _query_whatportis(self, port):
+        # A port whatportis could not answer for comes back with no service name
+        try:
+            status_code, response_text = self.whatportis.get(f"/ports/{port}")
+            return self._parse_whatportis_response(status_code, response_text)
+        except WhatportisError:
+            return None, None
+        except (ValueError, KeyError, IndexError) as e:
+            print(f"Error while parsing the whatportis answer for port {port}: {e}", file=sys.stderr)
+            return None, None
+
+    def _fallback_service_names(self, ports):
+        # Names for ports whatportis failed to answer: an expired cache entry if there is one, else Unknown
+        self.stats.count('lookup_failures', len(ports))
+        fallback = dict.fromkeys(ports, "Unknown")
+        if self.service_cache is not None:
+            fallback.update(self.service_cache.get_many(ports, include_expired=True))
+        return fallback
+
+    def _parse_whatportis_response(self, status_code, response_text):
+        if status_code == 200:
+            response_json = json.loads(response_text)
+            if len(response_json['ports']) == 0:
+                return response_text, "Unknown"
+            service_name = response_json['ports'][0][0]
+            return response_text, self._lookup_preferred_name(service_name)
+        else:
+            return None, "Unknown"
+    def _lookup_preferred_name(self, service_name):
+        service_mappings = {
+                'domain': 'DNS',
+                'adws': 'ADWS',
+                'wsman': 'WINRM',
+                'msft-gc': 'LDAP',
+                'msft-gc-ssl': 'LDAP',
+                'http-rpc-epmap': 'MSRPC',
+                'microsoft-ds': 'SMB',
+                'epmap': 'MSRPC',
+                'kpasswd': 'KERBEROS',
+                'ldaps': 'LDAP',
+                'ms-sql-s': 'MSSQL',
+                'ldap': 'LDAP',
+                'netbios-ssn': 'SMB',
+                'http': 'HTTP',
+                'kerberos': 'KERBEROS',
+                'ntp': 'NTP',
+                'kerberos-sec': 'KERBEROS',
+                'msrpc': 'MSRPC',
+                'ncacn_http': 'MSRPC',
+                'globalcatLDAP': 'LDAP',
+                'globalcatLDAPssl': 'LDAP',
+            }
+        try:
+            preferred_name = service_mappings.get(service_name)
+            if preferred_name is None:
+                return service_name
+            return preferred_name
+        except Exception as e:
+            print(f"Error while looking up preferred name for service {service_name}: {e}", file=sys.stderr)
+            return service_name
+
+    def _vault_directories(self, target_name):
+        # Only the leaves of the tree, makedirs creates everything above them
+        target_dir = f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{target_name}"
+        return [
+            f"{target_dir}/0 - Enumeration/attachments",
+            f"{target_dir}/0 - Enumeration/logs/tcp",
+            f"{target_dir}/0 - Enumeration/logs/udp",
+            f"{target_dir}/0 - Enumeration/objects",
+            f"{target_dir}/0 - Enumeration/ports/tcp",
+            f"{target_dir}/1 - Exploitation",
+            f"{target_dir}/2 - Escalation",
+            f"{target_dir}/3 - Loot",
+        ]
+
+    def create_vault_directories(self, target_names):
+        for vault_directory in dict.fromkeys(path for target_name in target_names for path in self._vault_directories(target_name)):
+            os.makedirs(vault_directory, exist_ok=True)
+        self.vault_directories_created = True
+
+    def _staging(self):
+        # Created before any render thread starts, which then all write into the same stage
+        if self.stage is None:
+            self.stage = VaultStage(self.obsidian_vault_dir, self._staging_root() / self.challenge_platform / self.target_name)
+        return self.stage
+
+    def _staging_root(self):
+        return Path(self.obsidian_vault_dir) / '.autorecon2obsidian' / 'staging'
+
+    def publish_staged_output(self):
+        if self.stage is None:
+            return 0
+        published = self.stage.publish()
+        self.stage = None
+        return published
+
+    def generate_notes(self, target, port_keys=None):
+
+        if not self.vault_directories_created:
+            self.create_vault_directories([self.target_name])
+        self._staging()
+
+        # Each port note is an independent file, so notes are rendered and written concurrently and
+        # the manifest is updated afterwards in the same order the serial loop used. Every report is
+        # fingerprinted before anything is rendered so bodies shared between ports are known up front
+        ports = [port for port in target.ports.values() if port_keys is None or port.key in port_keys]
+        workers = min(self.render_workers, len(ports))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                port_inputs = dict(zip((port.key for port in ports), executor.map(self._fingerprint_port, ports)))
+                shared_bodies = self._shared_report_bodies(target, port_inputs)
+                results = list(executor.map(lambda port: self._update_port_note(port, port_inputs[port.key], shared_bodies), ports))
+        else:
+            port_inputs = {port.key: self._fingerprint_port(port) for port in ports}
+            shared_bodies = self._shared_report_bodies(target, port_inputs)
+            results = [self._update_port_note(port, port_inputs[port.key], shared_bodies) for port in ports]
+        updated_notes = 0
+        for manifest_key, entry, updated in results:
+            self.manifest['ports'][manifest_key] = entry
+            if updated:
+                updated_notes += 1
+        return updated_notes, len(ports)
+
+    def _fingerprint_port(self, port):
+        previous_entry = self.manifest['ports'].get(f"{port.protocol}/{port.number}", {})
+        return self._fingerprint_reports(port.reports, previous_entry.get('inputs', {}))
+
+    def _shared_report_bodies(self, target, port_inputs):
+        # Hashes of report bodies embedded by more than one report of this target. Ports that are not
+        # being rendered count with the hashes recorded in the manifest
+        if self.arguments.no_dedup:
+            return set()
+        body_counts = {}
+        for port in target.ports.values():
+            inputs = port_inputs.get(port.key)
+            if inputs is None:
+                inputs = self.manifest['ports'].get(f"{port.protocol}/{port.number}", {}).get('inputs', {})
+            for report in port.reports:
+                if report.command is None or report.is_image or self._is_oversized(report) or report.file_name not in inputs:
+                    continue
+                sha256 = inputs[report.file_name]['sha256']
+                body_counts[sha256] = body_counts.get(sha256, 0) + 1
+        return {sha256 for sha256, count in body_counts.items() if count > 1}
+
+    def _update_port_note(self, port, inputs, shared_bodies):
+        started = time.perf_counter()
+        try:
+            return self._refresh_port_note(port, inputs, shared_bodies)
+        finally:
+            self.stats.record_port(f"{port.protocol}/{port.number}", time.perf_counter() - started)
+
+    def _refresh_port_note(self, port, inputs, shared_bodies):
+        note_path = self._port_note_path(port.protocol, port.number)
+        manifest_key = f"{port.protocol}/{port.number}"
+        previous_entry = self.manifest['ports'].get(manifest_key, {})
+        report_objects = {}
+        for report in port.reports:
+            if report.command is None:
+                continue
+            if report.is_image or self._is_oversized(report):
+                self._spill_report(report, self._attachment_path(port, report))
+            elif inputs[report.file_name]['sha256'] in shared_bodies:
+                report_objects[report.file_name] = inputs[report.file_name]['sha256']
+                self._store_report_object(report, report_objects[report.file_name])
+        entry = {
+            'name': port.name,
+            'version': port.version,
+            'tools': sorted(port.tools),
+            'inputs': inputs,
+            'objects': sorted(report_objects.values()),
+            'max_embed_size': self.max_embed_size,
+            'template': self.port_note_template.sha256,
+            'findings': self._port_findings(port, inputs, previous_entry),
+            'findings_version': FINDINGS_VERSION,
+        }
+        if not self.force_rewrite and all(previous_entry.get(key) == value for key, value in entry.items()) \
+                and self._output_is_current(note_path, previous_entry.get('output')):
+            return manifest_key, previous_entry, False
+        updated, entry['output'] = self._write_if_changed(note_path, previous_entry.get('output'), lambda note_handle: self._render_port_note(port, note_handle, report_objects))
+        return manifest_key, entry, updated
+
+    def _port_note_path(self, protocol, number):
+        return Path(f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/logs/{protocol}/{number}.md")
+
+    def prune_port_notes(self, port_keys=None):
+        # Removes the note, attachments and manifest entry of every port whose directory is gone,
+        # only among the given (protocol, port) keys when there are any
+        for manifest_key in list(self.manifest['ports']):
+            protocol, number = manifest_key.split('/')
+            port_key = (protocol, int(number))
+            if port_key in self.gathered_data.ports or (port_keys is not None and port_key not in port_keys):
+                continue
+            del self.manifest['ports'][manifest_key]
+            self._port_note_path(protocol, number).unlink(missing_ok=True)
+            shutil.rmtree(Path(f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/attachments/{protocol}/{number}"), ignore_errors=True)
+
+    def _port_findings(self, port, inputs, previous_entry):
+        # Findings are kept per report against its hash, so only new or changed reports are read
+        previous_findings = previous_entry.get('findings', {}) if previous_entry.get('findings_version') == FINDINGS_VERSION else {}
+        previous_inputs = previous_entry.get('inputs', {})
+        findings = {}
+        for report in port.reports:
+            if report.command is None or report.is_image:
+                continue
+            kind, extract = FINDINGS_CLASSIFIER.classify(report.file_name)
+            if extract is None:
+                continue
+            cached = previous_findings.get(report.file_name)
+            if cached is not None and previous_inputs.get(report.file_name, {}).get('sha256') == inputs[report.file_name]['sha256']:
+                findings[report.file_name] = cached
+                continue
+            values, omitted, bytes_read = extract_findings(report.file_path, extract)
+            self.stats.count('files_read', 1)
+            self.stats.count('bytes_read', bytes_read)
+            findings[report.file_name] = {'kind': kind, 'values': values, 'omitted': omitted}
+        return findings
+
+    def _render_port_note(self, port, note_handle, report_objects):
+        reports = []
+        for report in port.reports:
+            if report.command is None:
+                continue
+            excerpt = not report.is_image and self._is_oversized(report)
+            if report.is_image:
+                output = None
+            elif excerpt:
+                output = StreamedValue(lambda output_handle, report=report: self._stream_report_excerpt(report, output_handle))
+            else:
+                output = StreamedValue(lambda output_handle, report=report: self._stream_report_contents(report.file_path, output_handle))
+            reports.append({
+                'tool': report.tool,
+                'command': report.command,
+                'file_name': report.file_name,
+                'size': self._format_size(report.size),
+                'excerpt': excerpt,
+                'image': report.is_image,
+                'attachment': f"../../attachments/{port.protocol}/{port.number}/{report.file_name}",
+                'object': self._report_object_link(report_objects[report.file_name]) if report.file_name in report_objects else '',
+                'output': output,
+            })
+        self.port_note_template.render({
+            'target': self.target_name,
+            'platform': self.challenge_platform,
+            'address': self.target_address,
+            'port': port,
+            'identified': port.name.upper() != "UNKNOWN",
+            'tools': sorted(port.tools),
+            'reports': reports,
+        }, note_handle)
+
+    def _stream_report_contents(self, report_file_path, note_handle):
+        # Copied as raw bytes so scan output is never decoded, whatever its encoding
+        with open(report_file_path, 'rb') as report_handle:
+            shutil.copyfileobj(report_handle, note_handle, REPORT_CHUNK_SIZE)
+            self.stats.count('files_read', 1)
+            self.stats.count('bytes_read', report_handle.tell())
+
+    def _is_oversized(self, report):
+        return self.max_embed_size > 0 and report.size > self.max_embed_size
+
+    def _stream_report_excerpt(self, report, note_handle):
+        # Only the first and last half of the embed limit are read, trimmed to whole lines, so the
+        # note stays within the limit however large the report is
+        excerpt_size = self.max_embed_size // 2
+        with open(report.file_path, 'rb') as report_handle:
+            head = report_handle.read(excerpt_size)
+            if b'\n' in head:
+                head = head[:head.rindex(b'\n') + 1]
+            report_handle.seek(max(report.size - excerpt_size, len(head)))
+            tail = report_handle.read(excerpt_size)
+            self.stats.count('files_read', 1)
+            self.stats.count('bytes_read', excerpt_size + len(tail))
+            if b'\n' in tail[:-1]:
+                tail = tail[tail.index(b'\n') + 1:]
+        if not head.endswith(b'\n'):
+            head += b'\n'
+        note_handle.write(head)
+        note_handle.write(f"[... {self._format_size(report.size - len(head) - len(tail))} omitted, see the attachment for the full output ...]\n".encode('utf-8'))
+        note_handle.write(tail)
+
+    def _report_object_path(self, sha256):
+        return Path(f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/objects/{sha256}.md")
+
+    def _report_object_link(self, sha256):
+        return f"03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/objects/{sha256}"
+
+    def _store_report_object(self, report, sha256):
+        # Objects are named by the hash of the report body, so one that exists is already correct.
+        # Two render threads can store the same body at once, only the first one to reserve it writes it
+        object_path = self._report_object_path(sha256)
+        if object_path.exists():
+            return
+        staging_path = self.stage.reserve(object_path, VaultStage.ASSET)
+        if staging_path is None:
+            return
+        try:
+            with open(staging_path, 'wb') as object_handle:
+                object_handle.write(b"```\n")
+                self._stream_report_contents(report.file_path, object_handle)
+                object_handle.write(b"\n\n```\n")
+                self.stats.count('files_written', 1)
+                self.stats.count('bytes_written', object_handle.tell())
+        except BaseException:
+            self.stage.release(object_path)
+            raise
+
+    def prune_report_objects(self):
+        # Removes stored bodies no port note in the manifest refers to any more
+        referenced = {sha256 for entry in self.manifest['ports'].values() for sha256 in entry.get('objects', [])}
+        objects_dir = self._report_object_path('x').parent
+        try:
+            object_paths = list(objects_dir.glob('*.md'))
+        except OSError:
+            return
+        for object_path in object_paths:
+            if object_path.stem not in referenced:
+                object_path.unlink(missing_ok=True)
+
+    def _attachment_path(self, port, report):
+        return Path(f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/attachments/{port.protocol}/{port.number}/{report.file_name}")
+
+    def _spill_report(self, report, attachment_path):
+        # The copy keeps the report's mtime, so an attachment matching the report's size and mtime
+        # is left alone and each report is only copied once. The copy itself is done by the kernel,
+        # so large reports and images never pass through Python
+        try:
+            attachment_stat = attachment_path.stat()
+            if attachment_stat.st_size == report.size and attachment_stat.st_mtime_ns == report.mtime_ns:
+                return
+        except FileNotFoundError:
+            pass
+        staging_path = self.stage.reserve(attachment_path, VaultStage.ASSET)
+        if staging_path is None:
+            return
+        try:
+            with open(report.file_path, 'rb', buffering=0) as report_handle, open(staging_path, 'wb', buffering=0) as attachment_handle:
+                copied = copy_file_contents(report_handle, attachment_handle)
+                self.stats.count('files_read', 1)
+                self.stats.count('bytes_read', copied)
+                self.stats.count('files_written', 1)
+                self.stats.count('bytes_written', copied)
+            os.utime(staging_path, ns=(report.mtime_ns, report.mtime_ns))
+        except BaseException:
+            self.stage.release(attachment_path)
+            raise
+
+    def _format_size(self, size):
+        for unit in ('bytes', 'KiB', 'MiB'):
+            if size < 1024 or unit == 'MiB':
+                return f"{size} {unit}" if unit == 'bytes' else f"{size:.1f} {unit}"
+            size /= 1024
+
+    def _hash_file(self, file_path):
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file_handle:
+            for chunk in iter(lambda: file_handle.read(REPORT_CHUNK_SIZE), b''):
+                digest.update(chunk)
+            self.stats.count('files_read', 1)
+            self.stats.count('bytes_read', file_handle.tell())
+        return digest.hexdigest()
+
+    def _fingerprint_reports(self, reports, previous_inputs):
+        # A report whose size and mtime are unchanged keeps the hash recorded last run, so an
+        # untouched port costs no reads
+        inputs = {}
+        for report in reports:
+            previous = previous_inputs.get(report.file_name)
+            if report.is_image:
+                # images are only ever copied, never read, so size and mtime are their fingerprint
+                sha256 = None
+            elif report.sha256 is not None:
+                sha256 = report.sha256
+            elif previous is not None and previous['size'] == report.size and previous['mtime_ns'] == report.mtime_ns:
+                sha256 = previous['sha256']
+            else:
+                sha256 = self._hash_file(report.file_path)
+            inputs[report.file_name] = {'size': report.size, 'mtime_ns': report.mtime_ns, 'sha256': sha256}
+        return inputs
+
+    def _output_is_current(self, output_path, recorded_output):
+        if recorded_output is None:
+            return False
+        try:
+            output_stat = os.stat(output_path)
+        except FileNotFoundError:
+            return False
+        return output_stat.st_size == recorded_output['size'] and output_stat.st_mtime_ns == recorded_output['mtime_ns']
+
+    def _write_if_changed(self, output_path, recorded_output, render, rank=VaultStage.NOTE):
+        # Renders into the stage while hashing, and only leaves the file staged for publishing when
+        # the bytes differ from what the vault already has. The rename keeps the staged file's mtime,
+        # so its stat is the one the vault will show
+        output_path = Path(output_path)
+        staging_path = self.stage.reserve(output_path, rank)
+        try:
+            with open(staging_path, 'wb') as output_handle:
+                hashing_handle = HashingWriter(output_handle)
+                render(hashing_handle)
+            sha256 = hashing_handle.hexdigest()
+            self.stats.count('bytes_written', hashing_handle.size)
+            if not self.force_rewrite:
+                if self._output_is_current(output_path, recorded_output):
+                    current_sha256 = recorded_output['sha256']
+                elif output_path.is_file() and output_path.stat().st_size == hashing_handle.size:
+                    current_sha256 = self._hash_file(output_path)
+                else:
+                    current_sha256 = None
+                if current_sha256 == sha256:
+                    self.stage.release(output_path)
+                    output_stat = output_path.stat()
+                    return False, {'sha256': sha256, 'size': output_stat.st_size, 'mtime_ns': output_stat.st_mtime_ns}
+            output_stat = staging_path.stat()
+            self.stats.count('files_written', 1)
+        except BaseException:
+            self.stage.release(output_path)
+            raise
+        return True, {'sha256': sha256, 'size': output_stat.st_size, 'mtime_ns': output_stat.st_mtime_ns}
+
+    def _manifest_path(self):
+        return Path(f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/.{self.target_name}.autorecon2obsidian.json")
+
+    def load_manifest(self):
+        manifest = {'version': MANIFEST_VERSION, 'ports': {}, 'master': None, 'shards': {}}
+        try:
+            with open(self._manifest_path()) as file_handle:
+                stored = json.load(file_handle)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            print(f"Error while reading manifest {self._manifest_path()}, regenerating every note: {e}", file=sys.stderr)
+            return manifest
+        if stored.get('version') != MANIFEST_VERSION:
+            return manifest
+        manifest.update(stored)
+        return manifest
+
+    def save_manifest(self):
+        manifest_path = self._manifest_path()
+        staging_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        with open(staging_path, 'w') as file_handle:
+            json.dump(self.manifest, file_handle, indent=1, sort_keys=True)
+        os.replace(staging_path, manifest_path)
+
+    def update_report_index(self, target, port_keys=None):
+        if self.arguments.no_report_index:
+            return
+        if self.report_index is None:
+            self.report_index = self._open_report_index()
+            if self.report_index is None:
+                self.arguments.no_report_index = True
+                return
+        reports = []
+        for port in target.ports.values():
+            if port_keys is not None and port.key not in port_keys:
+                continue
+            inputs = self.manifest['ports'][f"{port.protocol}/{port.number}"]['inputs']
+            for report in port.reports:
+                if not report.is_image:
+                    reports.append((port.protocol, port.number, report.tool, report.file_name, inputs[report.file_name]['sha256'], report.file_path))
+        try:
+            self.report_index.update_target(self.challenge_platform, self.target_name, reports, port_keys)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error while updating report index: {e}", file=sys.stderr)
+
+    def save_snapshot(self, target, snapshot_path):
+        # JSON lines: a header, then one line per port in gather order. Reports are stored as paths
+        # relative to the scans directory with their size, mtime and the hash recorded in the
+        # manifest, never their contents
+        results_dir = Path(self.autorecon_results_dir).resolve()
+        snapshot_path = Path(snapshot_path)
+        staging_path = snapshot_path.with_name(f".{snapshot_path.name}.{os.getpid()}.tmp")
+        header = {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'target': self.target_name,
+            'platform': self.challenge_platform,
+            'address': self.target_address,
+            'results_dir': str(results_dir),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        }
+        try:
+            with open(staging_path, 'w', encoding='utf-8') as file_handle:
+                file_handle.write(json.dumps(header) + '\n')
+                for port in target.ports.values():
+                    inputs = self.manifest['ports'].get(f"{port.protocol}/{port.number}", {}).get('inputs', {})
+                    reports = []
+                    for report in port.reports:
+                        recorded = inputs.get(report.file_name)
+                        sha256 = recorded['sha256'] if recorded and recorded['size'] == report.size and recorded['mtime_ns'] == report.mtime_ns else self._hash_file(report.file_path)
+                        reports.append([os.path.relpath(report.file_path, results_dir), report.size, report.mtime_ns, sha256, report.tool, report.command])
+                    file_handle.write(json.dumps({
+                        'protocol': port.protocol,
+                        'number': port.number,
+                        'name': port.name,
+                        'product': port.product,
+                        'version': port.version,
+                        'directory': os.path.relpath(port.directory, results_dir),
+                        'reports': reports,
+                    }) + '\n')
+            os.replace(staging_path, snapshot_path)
+        except OSError as e:
+            if staging_path.exists():
+                os.remove(staging_path)
+            print(f"Error while saving snapshot {snapshot_path}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    def _read_snapshot_header(self, snapshot_path):
+        try:
+            with open(snapshot_path, encoding='utf-8') as file_handle:
+                header = json.loads(file_handle.readline())
+        except (OSError, ValueError) as e:
+            print(f"Error while reading snapshot {snapshot_path}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not isinstance(header, dict) or header.get('format') != SNAPSHOT_FORMAT or header.get('version') != SNAPSHOT_VERSION:
+            print(f"Error: {snapshot_path} is not a version {SNAPSHOT_VERSION} autorecon2obsidian snapshot", file=sys.stderr)
+            sys.exit(1)
+        return header
+
+    def load_snapshot(self, snapshot_path):
+        results_dir = Path(self.autorecon_results_dir)
+        target = Target(self.target_name, self.challenge_platform, self.autorecon_results_dir)
+        try:
+            with open(snapshot_path, encoding='utf-8') as file_handle:
+                file_handle.readline()
+                for line in file_handle:
+                    stored = json.loads(line)
+                    port = Port(stored['protocol'], stored['number'], str(results_dir / stored['directory']), stored['name'], stored['product'], stored['version'])
+                    for relative_path, size, mtime_ns, sha256, tool, command in stored['reports']:
+                        port.add_report(Report(str(results_dir / relative_path), size, mtime_ns, tool, command, sha256))
+                    target.add_port(port)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error while reading snapshot {snapshot_path}: {e}", file=sys.stderr)
+            sys.exit(1)
+        return target
+
+    def make_combined_document(self, target):
+
+        if not self.vault_directories_created:
+            self.create_vault_directories([self.target_name])
+        self._staging()
+        ports = []
+        possible_msrpc_ports = []
+        for port in target.ports.values():
+            port_name = port.name.upper()
+            if port_name == "UNKNOWN" and 49500 < port.number < 50000:
+                possible_msrpc_ports.append({'number': port.number, 'checkbox_id': self._checkbox_id(f"msrpc/{port.number}")})
+                continue
+            ports.append({
+                'name': port_name,
+                'number': port.number,
+                'protocol': port.protocol,
+                'checkbox_id': self._checkbox_id(f"{port.protocol}/{port.number}"),
+                # unidentified TCP ports only get a progress row, UDP ports are always listed in full
+                'detailed': port_name != "UNKNOWN" or port.protocol == 'udp',
+                'tools': sorted(port.tools),
+                'version': port.version,
+                'findings': self._master_findings(port),
+            })
+        context = {
+            'target': self.target_name,
+            'platform': self.challenge_platform,
+            'address': self.target_address,
+            'ports': ports,
+            'possible_msrpc_ports': possible_msrpc_ports,
+            'shards': self._write_master_shards(ports) if self.master_shard_template is not None else [],
+        }
+        if self.master_shard_template is None:
+            self.manifest['shards'] = {}
+        master_path = f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/Enumeration - Master.md"
+        _, self.manifest['master'] = self._write_if_changed(master_path, self.manifest['master'], lambda file_handle: self.master_template.render(context, file_handle), VaultStage.MASTER)
+
+    def _write_master_shards(self, ports):
+        # Each shard transcludes the log and notes of at most --shard-size ports, so neither it nor
+        # the index, which only links to the shards, makes Obsidian render every port at once.
+        # Shards are published before the index that links to them
+        recorded_shards = self.manifest['shards']
+        self.manifest['shards'] = {}
+        shards = []
+        for title, shard_ports in self._master_shards(ports).items():
+            shard_context = {
+                'target': self.target_name,
+                'platform': self.challenge_platform,
+                'address': self.target_address,
+                'shard': title,
+                'ports': shard_ports,
+            }
+            _, self.manifest['shards'][title] = self._write_if_changed(
+                self._master_shard_path(title), recorded_shards.get(title),
+                lambda file_handle, shard_context=shard_context: self.master_shard_template.render(shard_context, file_handle))
+            shards.append({'title': title, 'ports': ', '.join(f"{port['number']}/{port['protocol'].upper()}" for port in shard_ports)})
+        return shards
+
+    def _master_shards(self, ports):
+        # title -> ports with a section, grouped by service family in order of first appearance or
+        # by port number, and split into groups of at most --shard-size
+        detailed_ports = [port for port in ports if port['detailed']]
+        groups = {}
+        if self.arguments.shard_master == 'family':
+            for port in detailed_ports:
+                groups.setdefault(self._service_family(port['name']), []).append(port)
+        else:
+            for protocol in PROTOCOLS:
+                groups[protocol.upper()] = sorted((port for port in detailed_ports if port['protocol'] == protocol), key=lambda port: port['number'])
+        shards = {}
+        for group, group_ports in groups.items():
+            chunks = [group_ports[start:start + self.shard_size] for start in range(0, len(group_ports), self.shard_size)]
+            for index, chunk in enumerate(chunks, 1):
+                if self.arguments.shard_master == 'range':
+                    first, last = chunk[0]['number'], chunk[-1]['number']
+                    title = f"{group} {first}" if first == last else f"{group} {first}-{last}"
+                else:
+                    title = group if len(chunks) == 1 else f"{group} {index}"
+                shards[title] = chunk
+        return shards
+
+    @staticmethod
+    def _service_family(port_name):
+        if port_name == "UNKNOWN":
+            return "Unidentified"
+        words = port_name.replace('/', '-').replace('_', '-').split('-')
+        for family, keywords in SERVICE_FAMILIES:
+            if any(word.startswith(keywords) for word in words):
+                return family
+        return "Other"
+
+    def _master_shard_path(self, title):
+        return Path(f"{self.obsidian_vault_dir}/03 - Content/Write Ups/{self.challenge_platform}/{self.target_name}/0 - Enumeration/master/{title}.md")
+
+    def prune_master_shards(self):
+        # Removes shards the last master document no longer links to, e.g. after a port was removed
+        # or --shard-master changed
+        shards_dir = self._master_shard_path('x').parent
+        try:
+            shard_paths = list(shards_dir.glob('*.md'))
+        except OSError:
+            return
+        for shard_path in shard_paths:
+            if shard_path.stem not in self.manifest['shards']:
+                shard_path.unlink(missing_ok=True)
+        if not self.manifest['shards']:
+            try:
+                shards_dir.rmdir()
+            except OSError:
+                pass
+
+    def _master_findings(self, port):
+        findings = []
+        recorded = self.manifest['ports'].get(f"{port.protocol}/{port.number}", {}).get('findings', {})
+        for report in port.reports:
+            report_findings = recorded.get(report.file_name)
+            if report_findings is None:
+                continue
+            for value in report_findings['values']:
+                findings.append({'kind': report_findings['kind'], 'value': self._table_cell(value), 'report': self._table_cell(report.file_name)})
+            if report_findings['omitted']:
+                findings.append({'kind': report_findings['kind'], 'value': f"{report_findings['omitted']} more, see the log", 'report': self._table_cell(report.file_name)})
+        return findings
+
+    def _table_cell(self, value):
+        # Scan output can hold pipes and angle brackets, which would end the cell or become HTML
+        return value.replace('|', '\\|').replace('<', '&lt;').replace('>', '&gt;')
+
+    def _checkbox_id(self, key):
+        # Stable per target and port so re-runs render identical bytes and keep checkbox state
+        digest = hashlib.sha256(f"{self.challenge_platform}/{self.target_name}/{key}".encode('utf-8')).digest()
+        return ''.join(CHECKBOX_ID_ALPHABET[byte % len(CHECKBOX_ID_ALPHABET)] for byte in digest[:6])
+
+    def sort_gathered_data(self, target):
+        # Groups ports sharing a service name together, groups ordered by first appearance
+        sorted_target = Target(target.name, target.platform, target.results_dir)
+        for protocol in PROTOCOLS:
+            ports_by_name = {}
+            for port in target.ports_for(protocol):
+                ports_by_name.setdefault(port.name, []).append(port)
+            for ports in ports_by_name.values():
+                for port in ports:
+                    sorted_target.add_port(port)
+        return sorted_target
+
+    def process(self):
+        with self.stats.phase('manifest'):
+            self.manifest = self.load_manifest()
+        if self.arguments.pipeline:
+            import asyncio
+            with self.stats.phase('pipeline'):
+                updated_notes, total_notes = asyncio.run(self._run_pipeline())
+            with self.stats.phase('sort'):
+                sorted_data = self.sort_gathered_data(self.gathered_data)
+        else:
+            with self.stats.phase('gather'):
+                if self.arguments.from_snapshot:
+                    self.gathered_data = self.load_snapshot(self.arguments.from_snapshot)
+                else:
+                    self.gathered_data = self.gather_autorecon_report_data()
+            with self.stats.phase('sort'):
+                sorted_data = self.sort_gathered_data(self.gathered_data)
+            with self.stats.phase('generate'):
+                updated_notes, total_notes = self.generate_notes(sorted_data)
+        with self.stats.phase('master'):
+            self.make_combined_document(sorted_data)
+        with self.stats.phase('publish'):
+            self.publish_staged_output()
+            self.prune_port_notes()
+            self.prune_report_objects()
+            self.prune_master_shards()
+        with self.stats.phase('index'):
+            self.update_report_index(sorted_data)
+        with self.stats.phase('manifest'):
+            self.save_manifest()
+        if self.arguments.save_snapshot:
+            with self.stats.phase('snapshot'):
+                self.save_snapshot(self.gathered_data, self.arguments.save_snapshot)
+        return updated_notes, total_notes
+
+    async def _run_pipeline(self):
+        # Port directories are gathered one at a time and passed through a bounded queue to workers
+        # that look the service name up, fingerprint the reports and hand the note to the render
+        # executor, so whatportis round trips, report reads and note writes of different ports
+        # overlap. A note is only rendered once every port has been gathered: whether a report body
+        # is shared with another port (see _shared_report_bodies) can only change where two reports
+        # have the same size, so notes without such a report are rendered right away and the rest
+        # once every fingerprint is known. The result is the same vault the staged path writes
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if not self.vault_directories_created:
+            self.create_vault_directories([self.target_name])
+        self._staging()
+        target = Target(self.target_name, self.challenge_platform, self.autorecon_results_dir)
+        self.gathered_data = target
+        port_queue = asyncio.Queue(maxsize=self.render_workers * 4)
+        gathered = asyncio.Event()
+        shared_sizes = set()
+        port_inputs = {}
+        results = {}
+        deferred_ports = []
+        render_tasks = []
+
+        with ThreadPoolExecutor(max_workers=self.render_workers) as executor:
+            port_dirs = await loop.run_in_executor(executor, self._ordered_port_dirs)
+            await loop.run_in_executor(executor, self._refresh_nmap_services)
+            whatportis_keys = self._resolve_local_service_names(port_dirs)
+            whatportis_lookups = self._start_async_whatportis_lookups(sorted({port for _, port in whatportis_keys}))
+
+            async def gather_ports():
+                for port_dir in port_dirs:
+                    port = await loop.run_in_executor(executor, self._gather_port, port_dir, self.service_names.get(self._get_port_key(port_dir)))
+                    target.add_port(port)
+                    await port_queue.put(port)
+                if not self.arguments.no_dedup:
+                    report_sizes = {}
+                    for port in target.ports.values():
+                        for report in port.reports:
+                            if report.command is not None and not report.is_image and not self._is_oversized(report):
+                                report_sizes[report.size] = report_sizes.get(report.size, 0) + 1
+                    shared_sizes.update(size for size, count in report_sizes.items() if count > 1)
+                gathered.set()
+                for _ in range(self.render_workers):
+                    await port_queue.put(None)
+
+            async def render_when_gathered(port):
+                await gathered.wait()
+                if any(report.size in shared_sizes for report in port.reports):
+                    deferred_ports.append(port)
+                    return
+                results[port.key] = await loop.run_in_executor(executor, self._update_port_note, port, port_inputs[port.key], set())
+
+            async def process_ports():
+                while (port := await port_queue.get()) is not None:
+                    if port.key in whatportis_keys:
+                        port.name = self.service_names[port.key] = await whatportis_lookups[port.number]
+                    port_inputs[port.key] = await loop.run_in_executor(executor, self._fingerprint_port, port)
+                    render_tasks.append(asyncio.create_task(render_when_gathered(port)))
+
+            try:
+                await asyncio.gather(gather_ports(), *(process_ports() for _ in range(self.render_workers)))
+                await asyncio.gather(*render_tasks)
+            finally:
+                self._finish_async_whatportis_lookups(whatportis_lookups)
+            if deferred_ports:
+                shared_bodies = self._shared_report_bodies(target, port_inputs)
+                deferred_results = await asyncio.gather(*(loop.run_in_executor(executor, self._update_port_note, port, port_inputs[port.key], shared_bodies) for port in deferred_ports))
+                results.update(zip((port.key for port in deferred_ports), deferred_results))
+
+        updated_notes = 0
+        for port in target.ports.values():
+            manifest_key, entry, updated = results[port.key]
+            self.manifest['ports'][manifest_key] = entry
+            if updated:
+                updated_notes += 1
+        return updated_notes, len(target.ports)
+
+    def _start_async_whatportis_lookups(self, ports):
+        import asyncio
+        # One task per port number, cached names resolve immediately
+        self.async_whatportis_cache_entries = []
+        cached = {}
+        if ports:
+            if self.service_cache is None:
+                self.service_cache = self._open_service_cache()
+            if self.service_cache is not None and not self.refresh_services:
+                cached = self.service_cache.get_many(ports)
+        lookups = {}
+        for port in ports:
+            if port in cached:
+                lookups[port] = asyncio.get_running_loop().create_future()
+                lookups[port].set_result(cached[port])
+            else:
+                lookups[port] = asyncio.create_task(self._async_query_whatportis(port))
+        return lookups
+
+    async def _async_query_whatportis(self, port):
+        started = time.perf_counter()
+        try:
+            status_code, response_text = await self.whatportis.async_get(f"/ports/{port}")
+            response_text, service_name = self._parse_whatportis_response(status_code, response_text)
+        except WhatportisError:
+            return self._fallback_service_names([port])[port]
+        except (ValueError, KeyError, IndexError) as e:
+            print(f"Error while parsing the whatportis answer for port {port}: {e}", file=sys.stderr)
+            return self._fallback_service_names([port])[port]
+        finally:
+            self.stats.record_lookup(port, time.perf_counter() - started)
+        if response_text is not None:
+            self.async_whatportis_cache_entries.append((port, response_text, service_name))
+        return service_name
+
+    def _finish_async_whatportis_lookups(self, lookups):
+        for lookup in lookups.values():
+            lookup.cancel()
+        if self.whatportis is not None:
+            self.whatportis.close_async()
+        if self.async_whatportis_cache_entries and self.service_cache is not None:
+            try:
+                self.service_cache.put_many(self.async_whatportis_cache_entries)
+            except sqlite3.Error as e:
+                print(f"Error while updating service cache: {e}", file=sys.stderr)
+
+    def update_ports(self, port_dirs):
+        # Re-gathers only the given port directories, merges them into the last full gather and
+        # re-renders their notes plus the master document
+        existing_port_dirs = [port_dir for port_dir in port_dirs if port_dir.is_dir()]
+        with self.stats.phase('gather'):
+            updated_data = self.gather_autorecon_report_data(existing_port_dirs)
+        port_keys = {self._get_port_key(port_dir) for port_dir in port_dirs}
+        for port_key in port_keys:
+            self.gathered_data.remove_port(port_key)
+        for port in updated_data.ports.values():
+            self.gathered_data.add_port(port)
+        with self.stats.phase('sort'):
+            sorted_data = self.sort_gathered_data(self.gathered_data)
+        with self.stats.phase('generate'):
+            updated_notes, _ = self.generate_notes(sorted_data, port_keys)
+        with self.stats.phase('master'):
+            self.make_combined_document(sorted_data)
+        with self.stats.phase('publish'):
+            self.publish_staged_output()
+            self.prune_port_notes(port_keys)
+            self.prune_report_objects()
+            self.prune_master_shards()
+        with self.stats.phase('index'):
+            self.update_report_index(sorted_data, port_keys)
+        with self.stats.phase('manifest'):
+            self.save_manifest()
+        if self.arguments.save_snapshot:
+            with self.stats.phase('snapshot'):
+                self.save_snapshot(self.gathered_data, self.arguments.save_snapshot)
+        return updated_notes, len(port_keys)
+
+    def _create_watcher(self):
+        from .watch import InotifyWatcher, PollingWatcher
+        if not self.arguments.watch_poll and sys.platform.startswith('linux'):
+            try:
+                return InotifyWatcher(self.autorecon_results_dir)
+            except (OSError, AttributeError) as e:
+                print(f"inotify is unavailable, falling back to polling: {e}", file=sys.stderr)
+        return PollingWatcher(self.autorecon_results_dir, self.arguments.watch_poll_interval)
+
+    def _changed_port_dirs(self, changed_paths):
+        results_dir = Path(self.autorecon_results_dir)
+        port_dirs = set()
+        nmap_xml_changed = False
+        for changed_path in changed_paths:
+            relative_parts = Path(changed_path).relative_to(results_dir).parts
+            if not relative_parts:
+                # the watcher lost track of events, rescan every port directory
+                port_dirs.update(self._get_port_dirs('tcp') + self._get_port_dirs('udp'))
+                continue
+            port_dir_name = relative_parts[0]
+            if port_dir_name == 'xml':
+                nmap_xml_changed = True
+            elif port_dir_name[:3] in PROTOCOLS and port_dir_name[3:].isdigit():
+                port_dirs.add(results_dir / port_dir_name)
+        if nmap_xml_changed and self.nmap_services is not None:
+            port_dirs.update(self._nmap_changed_port_dirs())
+        return sorted(port_dirs)
+
+    def _nmap_changed_port_dirs(self):
+        # The full port scans in scans/xml/ describe ports whose own directories may never change
+        # again, so every port whose nmap service differs after the refresh is updated
+        previous = {port_key: (service.name, service.describe()) for port_key, service in self.nmap_services.services.items()}
+        self._refresh_nmap_services()
+        current = {port_key: (service.name, service.describe()) for port_key, service in self.nmap_services.services.items()}
+        results_dir = Path(self.autorecon_results_dir)
+        port_dirs = []
+        for protocol, number in previous.keys() | current.keys():
+            port_dir = results_dir / f"{protocol}{number}"
+            if previous.get((protocol, number)) != current.get((protocol, number)) and port_dir.is_dir():
+                port_dirs.append(port_dir)
+        return port_dirs
+
+    def watch(self):
+        debounce = self.arguments.watch_debounce
+        watcher = self._create_watcher()
+        print(f"Watching {self.autorecon_results_dir} for new autorecon output ({type(watcher).__name__}), press Ctrl-C to stop")
+        try:
+            while True:
+                changed_paths = watcher.wait(None)
+                # Wait for the directory to go quiet so a burst of writes from one tool becomes a single
+                # update, but never hold back output from a long running tool for more than max_delay
+                first_change = time.monotonic()
+                quiet_deadline = first_change + debounce
+                max_delay = first_change + debounce * 10
+                while (remaining := min(quiet_deadline, max_delay) - time.monotonic()) > 0:
+                    more_paths = watcher.wait(remaining)
+                    if more_paths:
+                        changed_paths |= more_paths
+                        quiet_deadline = time.monotonic() + debounce
+                port_dirs = self._changed_port_dirs(changed_paths)
+                if not port_dirs:
+                    continue
+                updated_notes, changed_ports = self.update_ports(port_dirs)
+                port_list = ', '.join(f"{port_dir.name[:3]}/{port_dir.name[3:]}" for port_dir in port_dirs)
+                print(f"[{time.strftime('%H:%M:%S')}] {changed_ports} ports changed ({port_list}), updated {updated_notes} port notes")
+        except KeyboardInterrupt:
+            print("Stopped watching")
+        finally:
+            watcher.close()
+
+    def close(self):
+        if self.stage is not None:
+            # output of a run that did not finish never reaches the vault
+            self.stage.discard()
+            self.stage = None
+        # The folders above a target's stage are shared by every target, the last one done removes them
+        for staging_dir in (self._staging_root() / self.challenge_platform, self._staging_root()):
+            try:
+                staging_dir.rmdir()
+            except OSError:
+                break
+        if self.service_cache is not None:
+            self.service_cache.close()
+            self.service_cache = None
+        if self.whatportis is not None:
+            self.whatportis.close()
+            self.whatportis = None
+        if self.report_index is not None:
+            self.report_index.close()
+            self.report_index = None
+
+    def discover_targets(self):
+        targets = []
+        try:
+            for target_dir in sorted(Path(self.autorecon_results_dir).iterdir()):
+                if (target_dir / 'scans').is_dir():
+                    targets.append(target_dir)
+        except OSError as e:
+            print(f"Error while discovering targets in {self.autorecon_results_dir}: {e}", file=sys.stderr)
+            sys.exit(1)
+        return targets
+
+    def load_name_map(self):
+        if not self.arguments.name_map:
+            return {}
+        try:
+            with open(self.arguments.name_map) as file_handle:
+                contents = file_handle.read()
+        except OSError as e:
+            print(f"Error while reading name map {self.arguments.name_map}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if contents.lstrip().startswith('{'):
+            return json.loads(contents)
+        name_map = {}
+        for line in contents.splitlines():
+            fields = line.split('#', 1)[0].split()
+            if len(fields) >= 2:
+                name_map[fields[0]] = fields[1]
+        return name_map
+
+    def run_batch(self):
+        from concurrent.futures import ProcessPoolExecutor
+        targets = self.discover_targets()
+        if not targets:
+            print(f"No autorecon targets (<target>/scans) found in {self.autorecon_results_dir}", file=sys.stderr)
+            return False
+        name_map = self.load_name_map()
+        target_names = [name_map.get(target_dir.name, target_dir.name) for target_dir in targets]
+
+        # Shared passes: one service lookup across every target's ports and one directory creation pass
+        # Ports nmap already identified are left out of the shared lookup, and each target's parsed
+        # nmap XML is handed to its worker so it isn't parsed twice
+        all_port_dirs = []
+        nmap_indexes = {}
+        for target_dir in targets:
+            # each target's worker warns about what it skips
+            port_dirs = self._get_port_dirs('tcp', target_dir / 'scans', False) + self._get_port_dirs('udp', target_dir / 'scans', False)
+            if self.nmap_services is not None:
+                nmap_indexes[target_dir] = NmapServiceIndex()
+                nmap_indexes[target_dir].refresh(target_dir / 'scans')
+                port_dirs = [port_dir for port_dir in port_dirs if nmap_indexes[target_dir].lookup(*self._get_port_key(port_dir)) is None]
+            all_port_dirs += port_dirs
+        with self.stats.phase('gather'):
+            self.resolve_service_names(all_port_dirs)
+        self.create_vault_directories(target_names)
+
+        print(f"Processing {len(targets)} targets with {min(self.arguments.jobs, len(targets))} processes")
+        results = {}
+        with ProcessPoolExecutor(max_workers=min(self.arguments.jobs, len(targets))) as executor:
+            futures = {}
+            for target_dir, target_name in zip(targets, target_names):
+                target_arguments = argparse.Namespace(**vars(self.arguments))
+                target_arguments.autorecon_dir = str(target_dir / 'scans')
+                target_arguments.name = target_name
+                target_arguments.batch = False
+                futures[executor.submit(_process_batch_target, target_arguments, self.service_names, nmap_indexes.get(target_dir))] = target_name
+            for completed, future in enumerate(as_completed(futures), 1):
+                target_name = futures[future]
+                try:
+                    updated_notes, total_notes, target_stats = future.result()
+                    self.stats.merge(target_stats, target_name)
+                    results[target_name] = None
+                    print(f"[{completed}/{len(futures)}] {target_name}: updated {updated_notes} of {total_notes} port notes")
+                except Exception as e:
+                    results[target_name] = e
+                    print(f"[{completed}/{len(futures)}] {target_name}: failed: {e}", file=sys.stderr)
+
+        failed = [target_name for target_name in target_names if results[target_name] is not None]
+        print(f"Batch finished: {len(targets) - len(failed)} succeeded, {len(failed)} failed")
+        for target_name in failed:
+            print(f"  {target_name}: {results[target_name]}", file=sys.stderr)
+        return not failed
+
+def _process_batch_target(arguments, service_names, nmap_services):
+    autorecon2obidian = AutoRecon2Obsidian(arguments)
+    autorecon2obidian.service_names.update(service_names)
+    if nmap_services is not None:
+        autorecon2obidian.nmap_services = nmap_services
+    autorecon2obidian.vault_directories_created = True
+    try:
+        return autorecon2obidian.process() + (autorecon2obidian.stats.to_dict(),)
+    except SystemExit as e:
+        # the per-target code reports fatal errors with sys.exit, which must not end the batch
+        raise RuntimeError(f"exited with status {e.code}") from None
+    finally:
+        autorecon2obidian.close()
@@ -0,0 +1,104 @@
+import re
+
+from .reports import FilenameClassifier
+
+# Bumped whenever an extractor changes what it finds, so findings cached in the manifest are redone
+FINDINGS_VERSION = 1
+# Longer lines are cut at this length, so one huge line (a minified page, say) is never held whole
+MAX_LINE_LENGTH = 4096
+# Distinct findings listed per report, the rest are only counted
+MAX_FINDINGS_PER_REPORT = 25
+# Status codes of content discovery hits worth listing, everything else is noise from the wordlist
+WEB_HIT_STATUSES = frozenset(range(200, 400)) | {401}
+
+class FindingsClassifier(FilenameClassifier):
+
+    # filename fragment -> (finding kind, extractor). An extractor gets every line of a report as
+    # bytes, newline included, and returns the finding's value or None
+    UNKNOWN = (None, None)
+
+def _text(value):
+    return value.decode('utf-8', 'replace').strip()
+
+def _web_hit(pattern):
+    # pattern has status and url groups, and a redirect group where the tool prints one
+    def extract(line):
+        match = pattern.match(line)
+        if match is None or int(match.group('status')) not in WEB_HIT_STATUSES:
+            return None
+        value = f"{_text(match.group('status'))} {_text(match.group('url'))}"
+        redirect = match.groupdict().get('redirect')
+        if redirect:
+            value += f" -> {_text(redirect)}"
+        return value
+    return extract
+
+def _matched(pattern, format_value):
+    def extract(line):
+        match = pattern.match(line)
+        return format_value(match) if match is not None else None
+    return extract
+
+FEROXBUSTER_LINE = re.compile(rb'(?P<status>\d{3})\s+[A-Z]+\s+\d+l\s+\d+w\s+\d+c\s+(?P<url>\S+)(?:\s+=>\s+(?P<redirect>\S+))?')
+GOBUSTER_LINE = re.compile(rb'(?P<url>\S+)\s+\(Status:\s*(?P<status>\d{3})\)(?:.*?\[-->\s*(?P<redirect>[^\]\s]+)\])?')
+DIRSEARCH_LINE = re.compile(rb'(?P<status>\d{3})\s+\d+(?:\.\d+)?[KMG]?B\s+(?P<url>\S+)(?:\s+->\s+REDIRECTS TO:\s+(?P<redirect>\S+))?')
+FFUF_LINE = re.compile(rb'(?P<url>\S+)\s+\[Status:\s*(?P<status>\d{3}),')
+DIRB_LINE = re.compile(rb'\+\s+(?P<url>\S+)\s+\(CODE:(?P<status>\d{3})\|')
+NMAP_PORT_LINE = re.compile(rb'\d+/(?:tcp|udp)\s+open\S*\s+(\S+)(?:[ \t]+(\S[^\r\n]*?))?\s*$')
+NMAP_SERVICE_INFO_LINE = re.compile(rb'Service Info:\s*(\S[^\r\n]*?)\s*$')
+SMBMAP_SHARE_LINE = re.compile(rb'\s+(\S[^\t]*?)\s+(NO ACCESS|READ ONLY|READ, WRITE|WRITE ONLY)\b')
+SMBCLIENT_SHARE_LINE = re.compile(rb'\s+(\S+)\s+(Disk|IPC|Printer)\b')
+SNMP_USER_LINE = re.compile(rb'(?:iso|\.?1)\.3\.6\.1\.4\.1\.77\.1\.2\.25\.1\.1\.[\d.]+\s*=\s*STRING:\s*"?([^"\r\n]*)')
+
+def _nmap_service(line):
+    match = NMAP_PORT_LINE.match(line)
+    if match is not None:
+        return ' '.join(_text(group) for group in match.groups() if group)
+    match = NMAP_SERVICE_INFO_LINE.match(line)
+    return _text(match.group(1)) if match is not None else None
+
+FINDINGS_CLASSIFIER = FindingsClassifier([
+    ('_feroxbuster_', 'Web Content', _web_hit(FEROXBUSTER_LINE)),
+    ('_gobuster_', 'Web Content', _web_hit(GOBUSTER_LINE)),
+    ('_dirsearch_', 'Web Content', _web_hit(DIRSEARCH_LINE)),
+    ('_ffuf_', 'Web Content', _web_hit(FFUF_LINE)),
+    ('_vhosts_', 'Virtual Host', _web_hit(FFUF_LINE)),
+    ('_dirb_', 'Web Content', _web_hit(DIRB_LINE)),
+    ('nmap.txt', 'Service', _nmap_service),
+    ('smbmap-share-permissions.txt', 'SMB Share', _matched(SMBMAP_SHARE_LINE, lambda match: f"{_text(match.group(1))} ({_text(match.group(2))})")),
+    ('smbclient.txt', 'SMB Share', _matched(SMBCLIENT_SHARE_LINE, lambda match: f"{_text(match.group(1))} ({_text(match.group(2))})")),
+    ('_snmp_snmpwalk', 'SNMP User', _matched(SNMP_USER_LINE, lambda match: _text(match.group(1)) or None)),
+])
+
+def _read_lines(file_handle):
+    while True:
+        line = file_handle.readline(MAX_LINE_LENGTH)
+        if not line:
+            return
+        if len(line) == MAX_LINE_LENGTH and not line.endswith(b'\n'):
+            rest = line
+            while len(rest) == MAX_LINE_LENGTH and not rest.endswith(b'\n'):
+                rest = file_handle.readline(MAX_LINE_LENGTH)
+        yield line
+
+def extract_findings(file_path, extract, limit=MAX_FINDINGS_PER_REPORT):
+    # One pass in constant memory apart from the set of seen findings, which holds hashes rather
+    # than the findings themselves. Returns the first limit distinct findings, how many more
+    # distinct ones there were and the number of bytes read
+    seen = set()
+    findings = []
+    omitted = 0
+    with open(file_path, 'rb') as file_handle:
+        for line in _read_lines(file_handle):
+            value = extract(line)
+            if value is None:
+                continue
+            key = hash(value)
+            if key in seen:
+                continue
+            seen.add(key)
+            if len(findings) < limit:
+                findings.append(value)
+            else:
+                omitted += 1
+        return findings, omitted, file_handle.tell()
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+from pathlib import Path
+
+class ReportIndex:
+
+    # Full-text index of every report ingested into a vault, shared by all targets and platforms.
+    # Bodies are only re-read when a report's hash differs from the one indexed last time, and reports
+    # larger than max_body_size are indexed by the same head and tail excerpt their port note embeds
+    SCHEMA_VERSION = 2
+
+    def __init__(self, index_path, max_body_size=0):
+        self.index_path = Path(index_path)
+        self.max_body_size = max_body_size
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.index_path, timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        if self.connection.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute('DROP TABLE IF EXISTS reports')
+                self.connection.execute('DROP TABLE IF EXISTS report_text')
+                self.connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS reports (id INTEGER PRIMARY KEY, platform TEXT NOT NULL, target TEXT NOT NULL, protocol TEXT NOT NULL, '
+            'port INTEGER NOT NULL, tool TEXT NOT NULL, file_name TEXT NOT NULL, sha256 TEXT NOT NULL, UNIQUE (platform, target, protocol, port, file_name))')
+        self.connection.execute('CREATE VIRTUAL TABLE IF NOT EXISTS report_text USING fts5(body)')
+        self.connection.commit()
+
+    def update_target(self, platform, target, reports, port_keys=None):
+        # reports: (protocol, port, tool, file_name, sha256, file_path) tuples. Rows of this target that
+        # are not in reports are removed, only from the given (protocol, port) keys when there are any
+        existing = {}
+        for report_id, protocol, port, file_name, sha256 in self.connection.execute(
+                'SELECT id, protocol, port, file_name, sha256 FROM reports WHERE platform = ? AND target = ?', (platform, target)):
+            if port_keys is None or (protocol, port) in port_keys:
+                existing[(protocol, port, file_name)] = (report_id, sha256)
+        indexed = 0
+        with self.connection:
+            for protocol, port, tool, file_name, sha256, file_path in reports:
+                report_id, indexed_sha256 = existing.pop((protocol, port, file_name), (None, None))
+                if indexed_sha256 == sha256:
+                    continue
+                body = self._read_body(file_path)
+                if report_id is None:
+                    report_id = self.connection.execute(
+                        'INSERT INTO reports (platform, target, protocol, port, tool, file_name, sha256) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (platform, target, protocol, port, tool, file_name, sha256)).lastrowid
+                else:
+                    self.connection.execute('UPDATE reports SET tool = ?, sha256 = ? WHERE id = ?', (tool, sha256, report_id))
+                    self.connection.execute('DELETE FROM report_text WHERE rowid = ?', (report_id,))
+                self.connection.execute('INSERT INTO report_text (rowid, body) VALUES (?, ?)', (report_id, body))
+                indexed += 1
+            for report_id, _ in existing.values():
+                self.connection.execute('DELETE FROM reports WHERE id = ?', (report_id,))
+                self.connection.execute('DELETE FROM report_text WHERE rowid = ?', (report_id,))
+        return indexed
+
+    def _read_body(self, file_path):
+        # Only the first and last half of max_body_size are read, trimmed to whole lines, so a huge
+        # report is never held in memory whole
+        with open(file_path, 'rb') as file_handle:
+            size = os.fstat(file_handle.fileno()).st_size
+            if self.max_body_size <= 0 or size <= self.max_body_size:
+                return file_handle.read().decode('utf-8', errors='replace')
+            excerpt_size = self.max_body_size // 2
+            head = file_handle.read(excerpt_size)
+            if b'\n' in head:
+                head = head[:head.rindex(b'\n') + 1]
+            file_handle.seek(max(size - excerpt_size, len(head)))
+            tail = file_handle.read(excerpt_size)
+            if b'\n' in tail[:-1]:
+                tail = tail[tail.index(b'\n') + 1:]
+        return (head + b'\n' + tail).decode('utf-8', errors='replace')
+
+    def search(self, query, platform=None, target=None, protocol=None, port=None, tool=None, limit=50):
+        conditions = ['report_text MATCH ?']
+        parameters = [query]
+        for column, value in (('platform', platform), ('target', target), ('protocol', protocol), ('port', port), ('tool', tool)):
+            if value is not None:
+                conditions.append(f"reports.{column} = ?")
+                parameters.append(value)
+        return self.connection.execute(
+            "SELECT reports.platform, reports.target, reports.protocol, reports.port, reports.tool, reports.file_name, "
+            "snippet(report_text, 0, '[', ']', '...', 16) FROM report_text JOIN reports ON reports.id = report_text.rowid "
+            f"WHERE {' AND '.join(conditions)} ORDER BY rank LIMIT ?", [*parameters, limit]).fetchall()
+
+    def close(self):
+        self.connection.close()
+
+def report_index_path(obsidian_vault_dir):
+    return Path(obsidian_vault_dir) / '.autorecon2obsidian' / 'index.sqlite3'
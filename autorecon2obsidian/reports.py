@@ -0,0 +1,239 @@
+import base64
+import json
+import os
+
+from .constants import IMAGE_REPORT_SUFFIXES
+
+# filename fragment -> (tool, base64 encoded autorecon command)
+REPORT_PATTERNS = [
+    ('_smtp_user-enum_hydra_vrfy.txt', 'hydra', 'aHlkcmEgc210cC1lbnVtOi8ve2FkZHJlc3N2Nn06e3BvcnR9L3ZyZnkgLUwgIicgKyBzZWxmLmdldF9nbG9iYWwoJ3VzZXJuYW1lX3dvcmRsaXN0JywgZGVmYXVsdD0nL3Vzci9zaGFyZS9zZWNsaXN0cy9Vc2VybmFtZXMvdG9wLXVzZXJuYW1lcy1zaG9ydGxpc3QudHh0JykgKyAnIiAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fc210cF91c2VyLWVudW1faHlkcmFfdnJmeS50eHQnKQo='),
+    ('_smtp_user-enum_hydra_expn.txt', 'hydra', 'aHlkcmEgc210cC1lbnVtOi8ve2FkZHJlc3N2Nn06e3BvcnR9L2V4cG4gLUwgIicgKyBzZWxmLmdldF9nbG9iYWwoJ3VzZXJuYW1lX3dvcmRsaXN0JywgZGVmYXVsdD0nL3Vzci9zaGFyZS9zZWNsaXN0cy9Vc2VybmFtZXMvdG9wLXVzZXJuYW1lcy1zaG9ydGxpc3QudHh0JykgKyAnIiAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fc210cF91c2VyLWVudW1faHlkcmFfZXhwbi50eHQnKQo='),
+    ('_mysql_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChteXNxbCogb3Igc3NsKikgYW5kIG5vdCAoYnJ1dGUgb3IgYnJvYWRjYXN0IG9yIGRvcyBvciBleHRlcm5hbCBvciBmdXp6ZXIpIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9teXNxbF9ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X215c3FsX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('enum4linux.txt', 'enum4linux', 'ZW51bTRsaW51eCAtYSAtTSAtbCAtZCB7YWRkcmVzc30gMj4mMScsIG91dGZpbGU9J2VudW00bGludXgudHh0JykK'),
+    ('enum4linux-ng.txt', 'enum4linux', 'ZW51bTRsaW51eC1uZyAtQSAtZCAtdiB7YWRkcmVzc30gMj4mMScsIG91dGZpbGU9J2VudW00bGludXgtbmcudHh0JykK'),
+    ('_oracle_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChvcmFjbGUqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fb3JhY2xlX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fb3JhY2xlX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_rpc_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLG1zcnBjLWVudW0scnBjLWdyaW5kLHJwY2luZm8iIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3JwY19ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3JwY19ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_pop3_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChwb3AzKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3BvcDNfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9wb3AzX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_dns_zone-transfer-domain.txt', 'dig', 'ZGlnIEFYRlIgLXAge3BvcnR9IEB7YWRkcmVzc30gJyArIHNlbGYuZ2V0X2dsb2JhbCgnZG9tYWluJyksIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X2Ruc196b25lLXRyYW5zZmVyLWRvbWFpbi50eHQnKQo='),
+    ('_dns_zone-transfer-hostname.txt', 'dig', 'ZGlnIEFYRlIgLXAge3BvcnR9IEB7YWRkcmVzc30ge2FkZHJlc3N9Jywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fZG5zX3pvbmUtdHJhbnNmZXItaG9zdG5hbWUudHh0JykK'),
+    ('_dns_zone-transfer.txt', 'dig', 'ZGlnIEFYRlIgLXAge3BvcnR9IEB7YWRkcmVzc30nLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV9kbnNfem9uZS10cmFuc2Zlci50eHQnKQo='),
+    ('_oracle_tnscmd_ping.txt', 'tnscmd10g', 'dG5zY21kMTBnIHBpbmcgLWgge2FkZHJlc3N9IC1wIHtwb3J0fSAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fb3JhY2xlX3Ruc2NtZF9waW5nLnR4dCcpCg=='),
+    ('_oracle_tnscmd_version.txt', 'tnscmd10g', 'dG5zY21kMTBnIHZlcnNpb24gLWgge2FkZHJlc3N9IC1wIHtwb3J0fSAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fb3JhY2xlX3Ruc2NtZF92ZXJzaW9uLnR4dCcpCg=='),
+    ('_redis_info.txt', 'redis-cli', 'cmVkaXMtY2xpIC1wIHtwb3J0fSAtaCB7YWRkcmVzc30gSU5GTycsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3JlZGlzX2luZm8udHh0JykK'),
+    ('_redis_config.txt', 'redis-cli', 'cmVkaXMtY2xpIC1wIHtwb3J0fSAtaCB7YWRkcmVzc30gQ09ORklHIEdFVCBcJypcJycsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3JlZGlzX2NvbmZpZy50eHQnKQo='),
+    ('_redis_client-list.txt', 'redis-cli', 'cmVkaXMtY2xpIC1wIHtwb3J0fSAtaCB7YWRkcmVzc30gQ0xJRU5UIExJU1QnLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV9yZWRpc19jbGllbnQtbGlzdC50eHQnKQo='),
+    ('_rsync_file_list.txt', 'rsync', 'cnN5bmMgLWF2IC0tbGlzdC1vbmx5IHJzeW5jOi8ve2FkZHJlc3N2Nn06e3BvcnR9Jywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fcnN5bmNfZmlsZV9saXN0LnR4dCcpCg=='),
+    ('_vnc_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLCh2bmMqIG9yIHJlYWx2bmMqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLS1zY3JpcHQtYXJncz0idW5zYWZlPTEiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3ZuY19ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3ZuY19ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_mssql_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChtcy1zcWwqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLS1zY3JpcHQtYXJncz0ibXNzcWwuaW5zdGFuY2UtcG9ydD17cG9ydH0sbXNzcWwudXNlcm5hbWU9c2EsbXNzcWwucGFzc3dvcmQ9c2EiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X21zc3FsX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fbXNzcWxfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_mongodb_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChtb25nb2RiKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X21vbmdvZGJfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9tb25nb2RiX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_curl.html', 'curl', 'Y3VybCAtc1NpayB7aHR0cF9zY2hlbWV9Oi8ve2FkZHJlc3N2Nn06e3BvcnR9JyArIHNlbGYuZ2V0X29wdGlvbigncGF0aCcpLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV97aHR0cF9zY2hlbWV9X2N1cmwuaHRtbCcpCg=='),
+    ('_telnet-nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLHRlbG5ldC1lbmNyeXB0aW9uLHRlbG5ldC1udGxtLWluZm8iIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3RlbG5ldC1ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3RlbG5ldF9ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_smb_vulnerabilities.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0ic21iLXZ1bG4tKiIgLS1zY3JpcHQtYXJncz0idW5zYWZlPTEiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3NtYl92dWxuZXJhYmlsaXRpZXMudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fc21iX3Z1bG5lcmFiaWxpdGllcy54bWwiIHthZGRyZXNzfScpCg=='),
+    ('smbclient.txt', 'smbclient', 'c21iY2xpZW50IC1MIC8ve2FkZHJlc3N9IC1OIC1JIHthZGRyZXNzfSAyPiYxJywgb3V0ZmlsZT0nc21iY2xpZW50LnR4dCcpCg=='),
+    ('_mountd_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLG5mcyogYW5kIG5vdCAoYnJ1dGUgb3IgYnJvYWRjYXN0IG9yIGRvcyBvciBleHRlcm5hbCBvciBmdXp6ZXIpIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9tb3VudGRfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9tb3VudGRfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_ntp_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChudHAqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fbnRwX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fbnRwX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_tftp-nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLHRmdHAtZW51bSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fdGZ0cC1ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3RmdHBfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_ldap_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChsZGFwKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X2xkYXBfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9sZGFwX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_showmount.txt', 'showmount', 'c2hvd21vdW50IC1lIHthZGRyZXNzfSAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fc2hvd21vdW50LnR4dCcpCg=='),
+    ('_nikto.txt', 'nikto', 'bmlrdG8gLWFzaz1ubyAtVHVuaW5nPXg0NTY3ODkwYWMgLW5vaW50ZXJhY3RpdmUgLWhvc3Qge2h0dHBfc2NoZW1lfTovL3thZGRyZXNzfTp7cG9ydH0gMj4mMSB8IHRlZSAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3todHRwX3NjaGVtZX1fbmlrdG8udHh0IicpCg=='),
+    ('_ftp_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChmdHAqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fZnRwX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fZnRwX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_redis_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLHJlZGlzLWluZm8iIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3JlZGlzX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fcmVkaXNfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_snmp_snmpwalk.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDI+JjEnLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV9zbm1wX3NubXB3YWxrLnR4dCcpCg=='),
+    ('_snmp_snmpwalk_system_processes.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuMi4xLjI1LjEuNi4wIDI+JjEnLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV9zbm1wX3NubXB3YWxrX3N5c3RlbV9wcm9jZXNzZXMudHh0JykK'),
+    ('_snmp_snmpwalk_running_processes.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuMi4xLjI1LjQuMi4xLjIgMj4mMScsIG91dGZpbGU9J3tzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9zbm1wX3NubXB3YWxrX3J1bm5pbmdfcHJvY2Vzc2VzLnR4dCcpCg=='),
+    ('_snmp_snmpwalk_process_paths.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuMi4xLjI1LjQuMi4xLjQgMj4mMScsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3NubXBfc25tcHdhbGtfcHJvY2Vzc19wYXRocy50eHQnKQo='),
+    ('_snmp_snmpwalk_storage_units.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuMi4xLjI1LjIuMy4xLjQgMj4mMScsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3NubXBfc25tcHdhbGtfc3RvcmFnZV91bml0cy50eHQnKQo='),
+    ('_snmp_snmpwalk_software_names.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuMi4xLjI1LjIuMy4xLjQgMj4mMScsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3NubXBfc25tcHdhbGtfc29mdHdhcmVfbmFtZXMudHh0JykK'),
+    ('_snmp_snmpwalk_user_accounts.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuNC4xLjc3LjEuMi4yNSAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fc25tcF9zbm1wd2Fsa191c2VyX2FjY291bnRzLnR4dCcpCg=='),
+    ('_snmp_snmpwalk_tcp_ports.txt', 'snmpwalk', 'c25tcHdhbGsgLWMgcHVibGljIC12IDEge2FkZHJlc3N9IDEuMy42LjEuMi4xLjYuMTMuMS4zIDI+JjEnLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV9zbm1wX3NubXB3YWxrX3RjcF9wb3J0cy50eHQnKQo='),
+    ('_rpc_rpcdump.txt', 'rpcdump', 'aW1wYWNrZXQtcnBjZHVtcCAtcG9ydCB7cG9ydH0ge2FkZHJlc3N9Jywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fcnBjX3JwY2R1bXAudHh0JykK'),
+    ('_smtp_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChzbXRwKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3NtdHBfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9zbXRwX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_snmp-nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChzbm1wKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3NubXAtbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9zbm1wX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_nntp_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLG5udHAtbnRsbS1pbmZvIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9ubnRwX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fbm50cF9ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_whatweb.txt', 'whatweb', 'd2hhdHdlYiAtLWNvbG9yPW5ldmVyIC0tbm8tZXJyb3JzIC1hIDMgLXYge2h0dHBfc2NoZW1lfTovL3thZGRyZXNzfTp7cG9ydH0gMj4mMScsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3todHRwX3NjaGVtZX1fd2hhdHdlYi50eHQnKQo='),
+    ('_smb_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChuYnN0YXQgb3Igc21iKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3NtYl9ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3NtYl9ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_dns_reverse-lookup.txt', 'dig', 'ZGlnIC1wIHtwb3J0fSAteCB7YWRkcmVzc30gQHthZGRyZXNzfScsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X2Ruc19yZXZlcnNlLWxvb2t1cC50eHQnKQo='),
+    ('_oracle_scanner.txt', 'oscanner', 'b3NjYW5uZXIgLXYgLXMge2FkZHJlc3N9IC1QIHtwb3J0fSAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fb3JhY2xlX3NjYW5uZXIudHh0JykK'),
+    ('_subdomains_', 'gobuster', 'Z29idXN0ZXIgZG5zIC1kICcgKyBkb21haW4gKyAnIC1yIHthZGRyZXNzdjZ9IC13ICcgKyB3b3JkbGlzdCArICcgLW8gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV8nICsgZG9tYWluICsgJ19zdWJkb21haW5zXycgKyBuYW1lICsgJy50eHQiJykK'),
+    ('_screenshot.png', 'wkhtmltoimage', 'd2todG1sdG9pbWFnZSAtLWZvcm1hdCBwbmcge2h0dHBfc2NoZW1lfTovL3thZGRyZXNzdjZ9Ontwb3J0fS8ge3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3todHRwX3NjaGVtZX1fc2NyZWVuc2hvdC5wbmcnKQo='),
+    ('_rdp_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChyZHAqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fcmRwX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fcmRwX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('nbtscan.txt', 'nbtscan', 'bmJ0c2NhbiAtcnZoIHtpcGFkZHJlc3N9IDI+JjEnLCBvdXRmaWxlPSduYnRzY2FuLnR4dCcpCg=='),
+    ('_known-security.txt', 'curl', 'Y3VybCAtc1Npa2Yge2h0dHBfc2NoZW1lfTovL3thZGRyZXNzdjZ9Ontwb3J0fS8ud2VsbC1rbm93bi9zZWN1cml0eS50eHQnLCBmdXR1cmVfb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fe2h0dHBfc2NoZW1lfV9rbm93bi1zZWN1cml0eS50eHQnKQo='),
+    ('_rsync_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChyc3luYyogb3Igc3NsKikgYW5kIG5vdCAoYnJ1dGUgb3IgYnJvYWRjYXN0IG9yIGRvcyBvciBleHRlcm5hbCBvciBmdXp6ZXIpIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9yc3luY19ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3JzeW5jX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_imap_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChpbWFwKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X2ltYXBfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9pbWFwX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_sip_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLHNpcC1lbnVtLXVzZXJzLHNpcC1tZXRob2RzIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9zaXBfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9zaXBfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_vhosts_', 'ffuf', 'ZmZ1ZiAtdSB7aHR0cF9zY2hlbWV9Oi8vJyArIGhvc3RuYW1lICsgJzp7cG9ydH0vIC10ICcgKyBzdHIoc2VsZi5nZXRfb3B0aW9uKCd0aHJlYWRzJykpICsgJyAtdyAnICsgd29yZGxpc3QgKyAnIC1IICJIb3N0OiBGVVpaLicgKyBob3N0bmFtZSArICciIC1tYyBhbGwgLWZzICcgKyBzaXplICsgJyAtciAtbm9uaW50ZXJhY3RpdmUgLXMgfCB0ZWUgIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV97aHR0cF9zY2hlbWV9XycgKyBob3N0bmFtZSArICdfdmhvc3RzXycgKyBuYW1lICsgJy50eHQiJykK'),
+    ('_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChodHRwKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGh0dHAtc2xvd2xvcmlzKiBvciBmdXp6ZXIpIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV97aHR0cF9zY2hlbWV9X25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fe2h0dHBfc2NoZW1lfV9ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_finger_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLGZpbmdlciIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fZmluZ2VyX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fZmluZ2VyX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_dns_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChkbnMqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fZG5zX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fZG5zX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_feroxbuster_', 'feroxbuster', 'ZmVyb3hidXN0ZXIgLXUge2h0dHBfc2NoZW1lfTovL3thZGRyZXNzdjZ9Ontwb3J0fS8gLXQgJyArIHN0cihzZWxmLmdldF9vcHRpb24oJ3RocmVhZHMnKSkgKyAnIC13ICcgKyB3b3JkbGlzdCArICcgLXggIicgKyBzZWxmLmdldF9vcHRpb24oJ2V4dCcpICsgJyIgLXYgLWsgJyArICgnJyBpZiBzZWxmLmdldF9vcHRpb24oJ3JlY3Vyc2l2ZScpIGVsc2UgJy1uICcpICArICctcSAtZSAtciAtbyAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3todHRwX3NjaGVtZX1fZmVyb3hidXN0ZXJfJyArIG5hbWUgKyAnLnR4dCInICsgKCcgJyArIHNlbGYuZ2V0X29wdGlvbignZXh0cmFzJykgaWYgc2VsZi5nZXRfb3B0aW9uKCdleHRyYXMnKSBlbHNlICcnKSkK'),
+    ('_gobuster_', 'gobuster', 'Z29idXN0ZXIgZGlyIC11IHtodHRwX3NjaGVtZX06Ly97YWRkcmVzc3Y2fTp7cG9ydH0vIC10ICcgKyBzdHIoc2VsZi5nZXRfb3B0aW9uKCd0aHJlYWRzJykpICsgJyAtdyAnICsgd29yZGxpc3QgKyAnIC1lIC1rIC14ICInICsgc2VsZi5nZXRfb3B0aW9uKCdleHQnKSArICciIC16IC1yIC1vICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fe2h0dHBfc2NoZW1lfV9nb2J1c3Rlcl8nICsgbmFtZSArICcudHh0IicgKyAoJyAnICsgc2VsZi5nZXRfb3B0aW9uKCdleHRyYXMnKSBpZiBzZWxmLmdldF9vcHRpb24oJ2V4dHJhcycpIGVsc2UgJycpKQo='),
+    ('_dirsearch_', 'dirsearch', 'ZGlyc2VhcmNoIC11IHtodHRwX3NjaGVtZX06Ly97YWRkcmVzc306e3BvcnR9LyAtdCAnICsgc3RyKHNlbGYuZ2V0X29wdGlvbigndGhyZWFkcycpKSArICcgLWUgIicgKyBzZWxmLmdldF9vcHRpb24oJ2V4dCcpICsgJyIgLWYgLXEgLUYgJyArICgnLXIgJyBpZiBzZWxmLmdldF9vcHRpb24oJ3JlY3Vyc2l2ZScpIGVsc2UgJycpICsgJy13ICcgKyB3b3JkbGlzdCArICcgLS1mb3JtYXQ9cGxhaW4gLW8gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV97aHR0cF9zY2hlbWV9X2RpcnNlYXJjaF8nICsgbmFtZSArICcudHh0IicgKyAoJyAnICsgc2VsZi5nZXRfb3B0aW9uKCdleHRyYXMnKSBpZiBzZWxmLmdldF9vcHRpb24oJ2V4dHJhcycpIGVsc2UgJycpKQo='),
+    ('_ffuf_', 'ffuf', 'ZmZ1ZiAtdSB7aHR0cF9zY2hlbWV9Oi8ve2FkZHJlc3N2Nn06e3BvcnR9L0ZVWlogLXQgJyArIHN0cihzZWxmLmdldF9vcHRpb24oJ3RocmVhZHMnKSkgKyAnIC13ICcgKyB3b3JkbGlzdCArICcgLWUgIicgKyBkb3RfZXh0ZW5zaW9ucyArICciIC12IC1yICcgKyAoJy1yZWN1cnNpb24gJyBpZiBzZWxmLmdldF9vcHRpb24oJ3JlY3Vyc2l2ZScpIGVsc2UgJycpICsgJy1ub25pbnRlcmFjdGl2ZScgKyAoJyAnICsgc2VsZi5nZXRfb3B0aW9uKCdleHRyYXMnKSBpZiBzZWxmLmdldF9vcHRpb24oJ2V4dHJhcycpIGVsc2UgJycpICsgJyB8IHRlZSB7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fe2h0dHBfc2NoZW1lfV9mZnVmXycgKyBuYW1lICsgJy50eHQnKQo='),
+    ('_dirb_', 'dirb', 'ZGlyYiB7aHR0cF9zY2hlbWV9Oi8ve2FkZHJlc3N2Nn06e3BvcnR9LyAnICsgd29yZGxpc3QgKyAnIC1sICcgKyAoJycgaWYgc2VsZi5nZXRfb3B0aW9uKCdyZWN1cnNpdmUnKSBlbHNlICctciAnKSAgKyAnLVMgLVggIiwnICsgZG90X2V4dGVuc2lvbnMgKyAnIiAtZiAtbyAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3todHRwX3NjaGVtZX1fZGlyYl8nICsgbmFtZSArICcudHh0IicgKyAoJyAnICsgc2VsZi5nZXRfb3B0aW9uKCdleHRyYXMnKSBpZiBzZWxmLmdldF9vcHRpb24oJ2V4dHJhcycpIGVsc2UgJycpKQo='),
+    ('_cassandra_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChjYXNzYW5kcmEqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fY2Fzc2FuZHJhX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fY2Fzc2FuZHJhX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_curl-robots.txt', 'curl', 'Y3VybCAtc1Npa2Yge2h0dHBfc2NoZW1lfTovL3thZGRyZXNzdjZ9Ontwb3J0fS9yb2JvdHMudHh0JywgZnV0dXJlX291dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3todHRwX3NjaGVtZX1fY3VybC1yb2JvdHMudHh0JykK'),
+    ('_nfs_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChycGNpbmZvIG9yIG5mcyopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fbmZzX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fbmZzX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_multicastdns_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChkbnMqIG9yIHNzbCopIGFuZCBub3QgKGJydXRlIG9yIGJyb2FkY2FzdCBvciBkb3Mgb3IgZXh0ZXJuYWwgb3IgZnV6emVyKSIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fbXVsdGljYXN0ZG5zX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1fbXVsdGljYXN0ZG5zX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_cups_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChjdXBzKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X2N1cHNfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9jdXBzX25tYXAueG1sIiB7YWRkcmVzc30nKQo='),
+    ('_irc_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC0tc2NyaXB0IGlyYy1ib3RuZXQtY2hhbm5lbHMsaXJjLWluZm8saXJjLXVucmVhbGlyY2QtYmFja2Rvb3IgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1faXJjX25tYXAudHh0IiAtb1ggIntzY2FuZGlyfS94bWwve3Byb3RvY29sfV97cG9ydH1faXJjX25tYXAueG1sIiAtcCB7cG9ydH0ge2FkZHJlc3N9JykK'),
+    ('_distcc_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLGRpc3RjYy1jdmUyMDA0LTI2ODciIC0tc2NyaXB0LWFyZ3M9ImRpc3RjYy1jdmUyMDA0LTI2ODcuY21kPWlkIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9kaXN0Y2Nfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9kaXN0Y2Nfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_ajp_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLChhanAtKiBvciBzc2wqKSBhbmQgbm90IChicnV0ZSBvciBicm9hZGNhc3Qgb3IgZG9zIG9yIGV4dGVybmFsIG9yIGZ1enplcikiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X2FqcF9ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X2FqcF9ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('smbmap-share-permissions.txt', 'smbmap', 'c21ibWFwIC11IG51bGwgLXAgIiIgLUgge2FkZHJlc3N9IC1QIHtwb3J0fSAyPiYxJywgb3V0ZmlsZT0nc21ibWFwLXNoYXJlLXBlcm1pc3Npb25zLnR4dCcpCg=='),
+    ('smbmap-list-contents.txt', 'smbmap', 'c21ibWFwIC11IG51bGwgLXAgIiIgLUgge2FkZHJlc3N9IC1QIHtwb3J0fSAtciAyPiYxJywgb3V0ZmlsZT0nc21ibWFwLWxpc3QtY29udGVudHMudHh0JykK'),
+    ('smbmap-execute-command.txt', 'smbmap', 'c21ibWFwIC11IG51bGwgLXAgIiIgLUgge2FkZHJlc3N9IC1QIHtwb3J0fSAteCAiaXBjb25maWcgL2FsbCIgMj4mMScsIG91dGZpbGU9J3NtYm1hcC1leGVjdXRlLWNvbW1hbmQudHh0JykK'),
+    ('_kerberos_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLGtyYjUtZW51bS11c2VycyIgLW9OICJ7c2NhbmRpcn0ve3Byb3RvY29sfV97cG9ydH1fa2VyYmVyb3Nfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9rZXJiZXJvc19ubWFwLnhtbCIge2FkZHJlc3N9JykK'),
+    ('_dnsrecon_default.txt', 'dnsrecon', 'ZG5zcmVjb24gLW4ge2FkZHJlc3N9IC1kICcgKyBzZWxmLmdldF9nbG9iYWwoJ2RvbWFpbicpICsgJyAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fZG5zcmVjb25fZGVmYXVsdC50eHQnKQo='),
+    ('_ssh_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLHNzaDItZW51bS1hbGdvcyxzc2gtaG9zdGtleSxzc2gtYXV0aC1tZXRob2RzIiAtb04gIntzY2FuZGlyfS97cHJvdG9jb2x9X3twb3J0fV9zc2hfbm1hcC50eHQiIC1vWCAie3NjYW5kaXJ9L3htbC97cHJvdG9jb2x9X3twb3J0fV9zc2hfbm1hcC54bWwiIHthZGRyZXNzfScpCg=='),
+    ('_sslscan.html', 'sslscan', 'c3Nsc2NhbiAtLXNob3ctY2VydGlmaWNhdGUgLS1uby1jb2xvdXIge2FkZHJlc3N2Nn06e3BvcnR9IDI+JjEnLCBvdXRmaWxlPSd7cHJvdG9jb2x9X3twb3J0fV9zc2xzY2FuLmh0bWwnKQo='),
+    ('_rpc_architecture.txt', 'getarch', 'aW1wYWNrZXQtZ2V0QXJjaCAtdGFyZ2V0IHthZGRyZXNzfScsIG91dGZpbGU9J3twcm90b2NvbH1fe3BvcnR9X3JwY19hcmNoaXRlY3R1cmUudHh0JykK'),
+    ('_snmp_onesixtyone.txt', 'onesixtyone', 'b25lc2l4dHlvbmUgLWMgJyArIHNlbGYuZ2V0X29wdGlvbignY29tbXVuaXR5LXN0cmluZ3MnKSArICcgLWRkIHthZGRyZXNzfSAyPiYxJywgb3V0ZmlsZT0ne3Byb3RvY29sfV97cG9ydH1fc25tcF9vbmVzaXh0eW9uZS50eHQnKQo='),
+    ('_rmi_nmap.txt', 'nmap', 'bm1hcCB7bm1hcF9leHRyYX0gLXNWIC1wIHtwb3J0fSAtLXNjcmlwdD0iYmFubmVyLHJtaS12dWxuLWNsYXNzbG9hZGVyLHJtaS1kdW1wcmVnaXN0cnkiIC1vTiAie3NjYW5kaXJ9L3twcm90b2NvbH1fe3BvcnR9X3JtaV9ubWFwLnR4dCIgLW9YICJ7c2NhbmRpcn0veG1sL3twcm90b2NvbH1fe3BvcnR9X3JtaV9ubWFwLnhtbCIge2FkZHJlc3N9JykK')
+]
+
+class FilenameClassifier:
+
+    # Aho-Corasick automaton over the registered filename fragments. A filename is scanned once and
+    # the longest fragment found anywhere in it wins, so _smb_nmap.txt beats _nmap.txt regardless of
+    # registration order. Equal length matches resolve to the one that starts first.
+    UNKNOWN = ("Unknown", "Unknown")
+
+    def __init__(self, patterns=()):
+        self.patterns = {}
+        self._automaton = None
+        for pattern, tool, command in patterns:
+            self.register(pattern, tool, command)
+
+    def register(self, pattern, tool, command):
+        if not pattern:
+            raise ValueError("Report filename pattern must not be empty")
+        self.patterns[pattern] = (tool, command)
+        self._automaton = None
+
+    def load(self, config_path):
+        with open(config_path) as file_handle:
+            config = json.load(file_handle)
+        entries = config.get('patterns', []) if isinstance(config, dict) else config
+        for entry in entries:
+            command = entry.get('command')
+            command_base64 = base64.b64encode(command.encode('utf-8')).decode('ascii') if command else "Unknown"
+            self.register(entry['pattern'], entry.get('tool', "Unknown"), command_base64)
+
+    def _build(self):
+        transitions = [{}]
+        fail = [0]
+        # length of the longest pattern ending at each state, including those reached through fail links
+        match_length = [0]
+        for pattern in self.patterns:
+            state = 0
+            for character in pattern:
+                next_state = transitions[state].get(character)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions[state][character] = next_state
+                    transitions.append({})
+                    fail.append(0)
+                    match_length.append(0)
+                state = next_state
+            match_length[state] = len(pattern)
+        queue = list(transitions[0].values())
+        for state in queue:
+            for character, next_state in transitions[state].items():
+                fallback = fail[state]
+                while fallback and character not in transitions[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = transitions[fallback].get(character, 0)
+                match_length[next_state] = max(match_length[next_state], match_length[fail[next_state]])
+                queue.append(next_state)
+        self._automaton = (transitions, fail, match_length)
+
+    def classify(self, file_name):
+        if self._automaton is None:
+            self._build()
+        transitions, fail, match_length = self._automaton
+        state = 0
+        best_start = best_length = 0
+        for position, character in enumerate(file_name):
+            while state and character not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(character, 0)
+            length = match_length[state]
+            if length > best_length:
+                best_length = length
+                best_start = position + 1 - length
+        if not best_length:
+            return self.UNKNOWN
+        return self.patterns[file_name[best_start:best_start + best_length]]
+
+REPORT_CLASSIFIER = FilenameClassifier(REPORT_PATTERNS)
+
+class Report:
+
+    __slots__ = ('file_name', 'file_path', 'size', 'mtime_ns', 'tool', 'command', 'sha256')
+
+    def __init__(self, file_path, size, mtime_ns, tool, command, sha256=None):
+        self.file_name = os.path.basename(file_path)
+        self.file_path = file_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.tool = tool
+        # the autorecon command that produced the report, None when the file was not recognised
+        self.command = command
+        # known up front only when the report comes from a snapshot
+        self.sha256 = sha256
+
+    @property
+    def is_image(self):
+        return self.file_name.lower().endswith(IMAGE_REPORT_SUFFIXES)
+
+    def __repr__(self):
+        return f"Report({self.file_name!r}, tool={self.tool!r}, size={self.size})"
+
+class Port:
+
+    __slots__ = ('protocol', 'number', 'directory', 'name', 'product', 'version', 'tools', 'reports')
+
+    def __init__(self, protocol, number, directory, name, product='', version=''):
+        self.protocol = protocol
+        self.number = number
+        self.directory = directory
+        self.name = name
+        self.product = product
+        self.version = version
+        self.tools = set()
+        self.reports = []
+
+    @property
+    def key(self):
+        return self.protocol, self.number
+
+    def add_report(self, report):
+        self.reports.append(report)
+        if report.tool != "Unknown":
+            self.tools.add(report.tool)
+
+    def __repr__(self):
+        return f"Port({self.protocol}/{self.number}, name={self.name!r}, reports={len(self.reports)})"
+
+class Target:
+
+    __slots__ = ('name', 'platform', 'results_dir', 'ports')
+
+    def __init__(self, name, platform, results_dir):
+        self.name = name
+        self.platform = platform
+        self.results_dir = results_dir
+        # (protocol, port number) -> Port, in gather or sort order
+        self.ports = {}
+
+    def add_port(self, port):
+        self.ports[port.key] = port
+
+    def remove_port(self, port_key):
+        return self.ports.pop(port_key, None)
+
+    def ports_for(self, protocol):
+        return [port for port in self.ports.values() if port.protocol == protocol]
+
+    def __repr__(self):
+        return f"Target({self.name!r}, platform={self.platform!r}, ports={len(self.ports)})"
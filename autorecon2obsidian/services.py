@@ -0,0 +1,206 @@
+import sqlite3
+import struct
+import sys
+import time
+import zlib
+import xml.etree.ElementTree as ElementTree
+from array import array
+from pathlib import Path
+
+from .constants import PROTOCOLS
+
+class OfflineServiceIndex:
+
+    # Layout written by tools/generate_service_index.py: magic, then a zlib payload holding the
+    # newline-joined service names followed by one uint16 name id per port for tcp and for udp.
+    MAGIC = b'A2OSIDX1'
+    PORT_COUNT = 65536
+
+    def __init__(self, names, tcp_table, udp_table):
+        self.names = names
+        self.tables = {'tcp': tcp_table, 'udp': udp_table}
+
+    @classmethod
+    def load(cls, index_path):
+        data = Path(index_path).read_bytes()
+        if not data.startswith(cls.MAGIC):
+            raise ValueError(f"{index_path} is not a service index file")
+        payload = zlib.decompress(data[len(cls.MAGIC):])
+        name_count, names_length = struct.unpack_from('<II', payload)
+        offset = struct.calcsize('<II')
+        names = payload[offset:offset + names_length].decode('utf-8').split('\n')
+        if len(names) != name_count:
+            raise ValueError(f"{index_path} is corrupt: expected {name_count} service names, found {len(names)}")
+        offset += names_length
+        tables = []
+        for _ in range(2):
+            table = array('H')
+            table.frombytes(payload[offset:offset + 2 * cls.PORT_COUNT])
+            if sys.byteorder != 'little':
+                table.byteswap()
+            if len(table) != cls.PORT_COUNT:
+                raise ValueError(f"{index_path} is truncated")
+            tables.append(table)
+            offset += 2 * cls.PORT_COUNT
+        return cls(names, *tables)
+
+    def lookup(self, protocol, port):
+        port = int(port)
+        if not 0 <= port < self.PORT_COUNT:
+            return None
+        name_id = self.tables[protocol][port]
+        if name_id == 0:
+            return None
+        return self.names[name_id]
+
+class NmapService:
+
+    __slots__ = ('name', 'product', 'version', 'extrainfo', 'tunnel', 'probed', 'confidence')
+
+    def __init__(self, name, product, version, extrainfo, tunnel, probed, confidence):
+        self.name = name
+        self.product = product
+        self.version = version
+        self.extrainfo = extrainfo
+        self.tunnel = tunnel
+        self.probed = probed
+        self.confidence = confidence
+
+    @property
+    def rank(self):
+        # A service nmap actually probed beats one guessed from its port table, then higher confidence
+        return self.probed, self.confidence
+
+    def describe(self):
+        return ' '.join(part for part in (self.product, self.version, f"({self.extrainfo})" if self.extrainfo else '') if part)
+
+    def __repr__(self):
+        return f"NmapService({self.name!r}, {self.describe()!r})"
+
+class NmapServiceIndex:
+
+    # Service detection results from the nmap XML autorecon writes to scans/xml/ and
+    # scans/<protocol><port>/xml/. Every file is parsed with iterparse and each port is dropped from
+    # the tree once it has been read, so memory stays flat however many ports a host has, and only
+    # files whose size or mtime changed are parsed again on refresh
+    IGNORED_NAMES = ('', 'unknown', 'tcpwrapped')
+
+    def __init__(self):
+        self.files = {}
+        self.services = {}
+
+    def refresh(self, scans_dir):
+        scans_dir = Path(scans_dir)
+        xml_paths = sorted(scans_dir.glob('xml/*.xml')) + sorted(scans_dir.glob('*/xml/*.xml'))
+        changed = False
+        seen = set()
+        for xml_path in xml_paths:
+            try:
+                xml_stat = xml_path.stat()
+            except FileNotFoundError:
+                continue
+            seen.add(str(xml_path))
+            previous = self.files.get(str(xml_path))
+            if previous is not None and previous[0] == xml_stat.st_size and previous[1] == xml_stat.st_mtime_ns:
+                continue
+            self.files[str(xml_path)] = (xml_stat.st_size, xml_stat.st_mtime_ns, self.parse(xml_path))
+            changed = True
+        for removed_path in set(self.files) - seen:
+            del self.files[removed_path]
+            changed = True
+        if changed:
+            self.services = {}
+            for _, _, file_services in self.files.values():
+                for port_key, service in file_services.items():
+                    current = self.services.get(port_key)
+                    if current is None or service.rank > current.rank:
+                        self.services[port_key] = service
+        return self.services
+
+    def parse(self, xml_path):
+        services = {}
+        try:
+            context = ElementTree.iterparse(xml_path, events=('start', 'end'))
+            _, root = next(context)
+            ports = None
+            for event, element in context:
+                if event == 'start':
+                    if element.tag == 'ports':
+                        ports = element
+                elif element.tag == 'port':
+                    self._add_port(services, element)
+                    element.clear()
+                    if ports is not None:
+                        ports.clear()
+                elif element.tag == 'host':
+                    ports = None
+                    root.clear()
+        except (ElementTree.ParseError, StopIteration):
+            # nmap is still writing the file, keep the ports that are complete so far
+            pass
+        except OSError as e:
+            print(f"Error while reading nmap XML {xml_path}: {e}", file=sys.stderr)
+        return services
+
+    def _add_port(self, services, port_element):
+        protocol = port_element.get('protocol')
+        port = port_element.get('portid', '')
+        state = port_element.find('state')
+        service = port_element.find('service')
+        if protocol not in PROTOCOLS or not port.isdigit() or service is None:
+            return
+        if state is None or not state.get('state', '').startswith('open'):
+            return
+        name = service.get('name', '')
+        if name in self.IGNORED_NAMES:
+            return
+        nmap_service = NmapService(
+            name, service.get('product', ''), service.get('version', ''), service.get('extrainfo', ''),
+            service.get('tunnel', ''), service.get('method') == 'probed', int(service.get('conf', '0')) if service.get('conf', '0').isdigit() else 0,
+        )
+        port_key = (protocol, int(port))
+        current = services.get(port_key)
+        if current is None or nmap_service.rank > current.rank:
+            services[port_key] = nmap_service
+
+    def lookup(self, protocol, port):
+        return self.services.get((protocol, port))
+
+class ServiceNameCache:
+
+    def __init__(self, cache_path, ttl_days, max_entries):
+        self.cache_path = Path(cache_path)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.cache_path, timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS services (port TEXT PRIMARY KEY, response TEXT NOT NULL, preferred_name TEXT NOT NULL, fetched_at REAL NOT NULL)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS services_fetched_at ON services (fetched_at)')
+        self.connection.commit()
+
+    def get_many(self, ports, include_expired=False):
+        oldest_fresh = 0 if include_expired else time.time() - self.ttl_seconds
+        cached = {}
+        for port, preferred_name in self.connection.execute(
+                f"SELECT port, preferred_name FROM services WHERE fetched_at >= ? AND port IN ({','.join('?' * len(ports))})",
+                [oldest_fresh, *map(str, ports)]):
+            cached[int(port)] = preferred_name
+        return cached
+
+    def put_many(self, entries):
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO services (port, response, preferred_name, fetched_at) VALUES (?, ?, ?, ?)',
+                [(str(port), response, preferred_name, now) for port, response, preferred_name in entries])
+            self.connection.execute('DELETE FROM services WHERE fetched_at < ?', (now - self.ttl_seconds,))
+            self.connection.execute(
+                'DELETE FROM services WHERE port NOT IN (SELECT port FROM services ORDER BY fetched_at DESC LIMIT ?)',
+                (self.max_entries,))
+
+    def close(self):
+        self.connection.close()
+
+class WhatportisError(Exception):
+    pass
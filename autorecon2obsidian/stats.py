@@ -0,0 +1,119 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+class RunStats:
+
+    # Collected from the render threads as well as the main thread, so every update takes the lock
+    COUNTERS = ('files_read', 'bytes_read', 'files_written', 'bytes_written', 'lookup_failures')
+
+    def __init__(self, slowest_count=10):
+        self.slowest_count = slowest_count
+        self.lock = threading.Lock()
+        self.phases = {}
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.lookups = []
+        self.port_times = []
+
+    @contextmanager
+    def phase(self, name):
+        # Registered on entry so the summary lists nested phases after the phase containing them
+        with self.lock:
+            self.phases.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0})
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            with self.lock:
+                phase = self.phases[name]
+                phase['calls'] += 1
+                phase['wall'] += wall
+                phase['cpu'] += cpu
+
+    def count(self, counter, amount):
+        with self.lock:
+            self.counters[counter] += amount
+
+    def record_lookup(self, port, seconds):
+        with self.lock:
+            self.lookups.append((seconds, port))
+
+    def record_port(self, port_key, seconds):
+        with self.lock:
+            self.port_times.append((seconds, port_key))
+
+    def to_dict(self):
+        latencies = sorted(seconds for seconds, _ in self.lookups)
+        lookups = {'count': len(latencies)}
+        if latencies:
+            lookups.update({
+                'total': sum(latencies),
+                'min': latencies[0],
+                'p50': latencies[len(latencies) // 2],
+                'p90': latencies[int(len(latencies) * 0.9)],
+                'p99': latencies[int(len(latencies) * 0.99)],
+                'max': latencies[-1],
+                'slowest': [[port, seconds] for seconds, port in sorted(self.lookups, reverse=True)[:self.slowest_count]],
+            })
+        return {
+            'phases': self.phases,
+            'counters': self.counters,
+            'whatportis_lookups': lookups,
+            'slowest_ports': [[port_key, seconds] for seconds, port_key in sorted(self.port_times, reverse=True)[:self.slowest_count]],
+        }
+
+    def merge(self, stats, target_name):
+        # Folds in the to_dict() of a batch worker
+        if stats is None:
+            return
+        with self.lock:
+            for name, phase in stats['phases'].items():
+                merged = self.phases.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0})
+                for key in merged:
+                    merged[key] += phase[key]
+            for counter, amount in stats['counters'].items():
+                self.counters[counter] += amount
+            self.lookups += [(seconds, port) for port, seconds in stats['whatportis_lookups'].get('slowest', [])]
+            self.port_times += [(seconds, f"{target_name} {port_key}") for port_key, seconds in stats['slowest_ports']]
+
+    def summary(self):
+        stats = self.to_dict()
+        lines = ['Run statistics:', f"  {'phase':<16}{'calls':>7}{'wall s':>10}{'cpu s':>10}"]
+        for name, phase in stats['phases'].items():
+            lines.append(f"  {name:<16}{phase['calls']:>7}{phase['wall']:>10.3f}{phase['cpu']:>10.3f}")
+        counters = stats['counters']
+        lines.append(f"  read {counters['files_read']} files ({counters['bytes_read']} bytes), wrote {counters['files_written']} files ({counters['bytes_written']} bytes)")
+        if counters['lookup_failures']:
+            lines.append(f"  whatportis lookups failed for {counters['lookup_failures']} ports")
+        lookups = stats['whatportis_lookups']
+        if lookups['count']:
+            lines.append(f"  whatportis lookups: {lookups['count']}, p50 {lookups['p50'] * 1000:.1f} ms, p90 {lookups['p90'] * 1000:.1f} ms, p99 {lookups['p99'] * 1000:.1f} ms, max {lookups['max'] * 1000:.1f} ms")
+            lines.append('  slowest lookups: ' + ', '.join(f"{port} ({seconds * 1000:.1f} ms)" for port, seconds in lookups['slowest']))
+        if stats['slowest_ports']:
+            lines.append('  slowest port notes: ' + ', '.join(f"{port_key} ({seconds * 1000:.1f} ms)" for port_key, seconds in stats['slowest_ports']))
+        return '\n'.join(lines)
+
+class NullStats:
+
+    # Used unless --stats or --stats-json is given, every hook is a no-op
+
+    def phase(self, name):
+        return nullcontext()
+
+    def count(self, counter, amount):
+        pass
+
+    def record_lookup(self, port, seconds):
+        pass
+
+    def record_port(self, port_key, seconds):
+        pass
+
+    def to_dict(self):
+        return None
+
+    def merge(self, stats, target_name):
+        pass
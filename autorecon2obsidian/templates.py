@@ -0,0 +1,137 @@
+import hashlib
+import re
+
+class TemplateError(ValueError):
+    pass
+
+class StreamedValue:
+
+    # Template value that writes itself to the output, used for report contents so they are copied
+    # straight from disk instead of being read into a string
+    __slots__ = ('write_to',)
+
+    def __init__(self, write_to):
+        self.write_to = write_to
+
+class Template:
+
+    # {{ name.attribute | filter }} writes a value, {% for item in name %}...{% endfor %} and
+    # {% if [not] name %}...{% else %}...{% endif %} are the only blocks. A block tag on a line of its
+    # own takes the whole line with it, so templates can be laid out like the notes they produce.
+    # Templates are parsed once into a node tree and literal text is kept pre-encoded, so rendering
+    # is a walk over the tree writing bytes to the output
+    # a tag body never contains %}, so a line-taking tag cannot swallow the tags after it on its line
+    TOKEN_PATTERN = re.compile(r'^[ \t]*(\{%(?:(?!%\}).)*%\})[ \t]*(?:\n|\Z)|(\{%.*?%\})|(\{\{.*?\}\})', re.MULTILINE)
+    FILTERS = {
+        'upper': lambda value: str(value).upper(),
+        'lower': lambda value: str(value).lower(),
+        'join': lambda value: ', '.join(str(item) for item in value),
+    }
+    TEXT, VALUE, FOR, IF = range(4)
+
+    def __init__(self, source, name='<template>'):
+        self.name = name
+        self.sha256 = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        self.nodes = self._parse(source)
+
+    @classmethod
+    def load(cls, template_path):
+        with open(template_path, encoding='utf-8') as file_handle:
+            return cls(file_handle.read(), str(template_path))
+
+    def _parse(self, source):
+        root = []
+        stack = [('root', root, 0)]
+        position = 0
+        for match in self.TOKEN_PATTERN.finditer(source):
+            line = source.count('\n', 0, match.start()) + 1
+            if match.start() > position:
+                stack[-1][1].append((self.TEXT, source[position:match.start()].encode('utf-8')))
+            position = match.end()
+            if match.group(3):
+                stack[-1][1].append(self._parse_value(match.group(3)[2:-2], line))
+                continue
+            words = (match.group(1) or match.group(2))[2:-2].split()
+            if not words:
+                raise TemplateError(f"{self.name}:{line}: empty block tag")
+            tag = words[0]
+            if tag == 'for' and len(words) == 4 and words[2] == 'in':
+                body = []
+                stack[-1][1].append((self.FOR, words[1], self._parse_path(words[3], line), body))
+                stack.append(('for', body, line))
+            elif tag == 'if' and len(words) in (2, 3) and (len(words) == 2 or words[1] == 'not'):
+                body, else_body = [], []
+                stack[-1][1].append((self.IF, len(words) == 3, self._parse_path(words[-1], line), body, else_body))
+                stack.append(('if', body, line, else_body))
+            elif tag == 'else' and len(words) == 1 and stack[-1][0] == 'if':
+                stack[-1] = ('else', stack[-1][3], stack[-1][2])
+            elif tag in ('endfor', 'endif') and len(words) == 1 and stack[-1][0] in (('for',) if tag == 'endfor' else ('if', 'else')):
+                stack.pop()
+            else:
+                raise TemplateError(f"{self.name}:{line}: unexpected block tag {match.group(0).strip()}")
+        if len(stack) > 1:
+            raise TemplateError(f"{self.name}:{stack[-1][2]}: {stack[-1][0]} block is never closed")
+        if position < len(source):
+            root.append((self.TEXT, source[position:].encode('utf-8')))
+        return root
+
+    def _parse_value(self, expression, line):
+        path, *filters = [part.strip() for part in expression.split('|')]
+        for filter_name in filters:
+            if filter_name not in self.FILTERS:
+                raise TemplateError(f"{self.name}:{line}: unknown filter {filter_name!r}")
+        return (self.VALUE, self._parse_path(path, line), tuple(self.FILTERS[filter_name] for filter_name in filters))
+
+    def _parse_path(self, path, line):
+        parts = tuple(path.split('.'))
+        if not all(part.isidentifier() for part in parts):
+            raise TemplateError(f"{self.name}:{line}: invalid name {path!r}")
+        return parts
+
+    def check_names(self, names, nodes=None):
+        # Catches misspelled names when the template is loaded rather than halfway through a render
+        for node in self.nodes if nodes is None else nodes:
+            if node[0] == self.VALUE and node[1][0] not in names:
+                raise TemplateError(f"{self.name}: undefined name {node[1][0]!r}")
+            if node[0] in (self.FOR, self.IF) and node[2][0] not in names:
+                raise TemplateError(f"{self.name}: undefined name {node[2][0]!r}")
+            if node[0] == self.FOR:
+                self.check_names(names | {node[1]}, node[3])
+            elif node[0] == self.IF:
+                self.check_names(names, node[3])
+                self.check_names(names, node[4])
+
+    def render(self, context, output_handle):
+        self._render_nodes(self.nodes, [context], output_handle)
+
+    def _render_nodes(self, nodes, scopes, output_handle):
+        for node in nodes:
+            kind = node[0]
+            if kind == self.TEXT:
+                output_handle.write(node[1])
+            elif kind == self.VALUE:
+                value = self._resolve(node[1], scopes)
+                for value_filter in node[2]:
+                    value = value_filter(value)
+                if isinstance(value, StreamedValue):
+                    value.write_to(output_handle)
+                else:
+                    output_handle.write(str(value).encode('utf-8'))
+            elif kind == self.FOR:
+                for item in self._resolve(node[2], scopes):
+                    self._render_nodes(node[3], scopes + [{node[1]: item}], output_handle)
+            elif bool(self._resolve(node[2], scopes)) != node[1]:
+                self._render_nodes(node[3], scopes, output_handle)
+            else:
+                self._render_nodes(node[4], scopes, output_handle)
+
+    def _resolve(self, path, scopes):
+        for scope in reversed(scopes):
+            if path[0] in scope:
+                value = scope[path[0]]
+                break
+        else:
+            raise TemplateError(f"{self.name}: undefined name {path[0]!r}")
+        for part in path[1:]:
+            value = value[part] if isinstance(value, dict) else getattr(value, part)
+        return value
@@ -0,0 +1,133 @@
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+from .constants import KERNEL_COPY_SIZE, REPORT_CHUNK_SIZE
+
+class HashingWriter:
+
+    def __init__(self, file_handle):
+        self.file_handle = file_handle
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.digest.update(data)
+        self.size += len(data)
+        return self.file_handle.write(data)
+
+    def hexdigest(self):
+        return self.digest.hexdigest()
+
+class VaultStage:
+
+    # Every file a run changes is written below a staging directory on the vault's filesystem first.
+    # publish() flushes them to disk in one go and renames them into the vault, so Obsidian (and an
+    # interrupted run) never sees a half-written file, and no note changes before all of them have
+    # rendered. Attachments and report objects are published before the port notes linking to them
+    # and the master document last
+    ASSET, NOTE, MASTER = range(3)
+
+    def __init__(self, vault_dir, staging_dir):
+        self.vault_dir = Path(vault_dir)
+        self.staging_dir = Path(staging_dir)
+        # left behind by an interrupted run
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.lock = threading.Lock()
+        self.staged_dirs = set()
+        self.reserved = {}
+
+    def reserve(self, output_path, rank):
+        # The staging path to write output_path to, None when another thread already reserved it
+        output_path = Path(output_path)
+        staging_path = self.staging_dir / output_path.relative_to(self.vault_dir)
+        with self.lock:
+            if output_path in self.reserved:
+                return None
+            self.reserved[output_path] = rank
+            if staging_path.parent not in self.staged_dirs:
+                staging_path.parent.mkdir(parents=True, exist_ok=True)
+                self.staged_dirs.add(staging_path.parent)
+        return staging_path
+
+    def release(self, output_path):
+        output_path = Path(output_path)
+        with self.lock:
+            self.reserved.pop(output_path, None)
+        (self.staging_dir / output_path.relative_to(self.vault_dir)).unlink(missing_ok=True)
+
+    def publish(self):
+        # Returns the number of files moved into the vault
+        outputs = sorted(self.reserved, key=lambda output_path: self.reserved[output_path])
+        if outputs:
+            self._flush([self.staging_dir / output_path.relative_to(self.vault_dir) for output_path in outputs])
+            output_dirs = list(dict.fromkeys(output_path.parent for output_path in outputs))
+            for output_dir in output_dirs:
+                os.makedirs(output_dir, exist_ok=True)
+            for output_path in outputs:
+                os.replace(self.staging_dir / output_path.relative_to(self.vault_dir), output_path)
+            # the renames themselves are only durable once the directories holding them are synced
+            for output_dir in output_dirs:
+                directory_fd = os.open(output_dir, os.O_RDONLY)
+                try:
+                    os.fsync(directory_fd)
+                finally:
+                    os.close(directory_fd)
+        self.discard()
+        return len(outputs)
+
+    def _flush(self, staging_paths):
+        # A single syncfs flushes every staged file, file by file fsync where it is unavailable
+        if sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                staging_fd = os.open(self.staging_dir, os.O_RDONLY)
+                try:
+                    if libc.syncfs(staging_fd) == 0:
+                        return
+                finally:
+                    os.close(staging_fd)
+            except (OSError, AttributeError):
+                pass
+        for staging_path in staging_paths:
+            file_fd = os.open(staging_path, os.O_RDONLY)
+            try:
+                os.fsync(file_fd)
+            finally:
+                os.close(file_fd)
+
+    def discard(self):
+        self.reserved = {}
+        self.staged_dirs = set()
+        # only this target's folder, batch workers stage the other targets next to it
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+def copy_file_contents(source_handle, destination_handle):
+    # Copies from the current position of source_handle to destination_handle inside the kernel:
+    # copy_file_range (which reflink capable filesystems turn into a shared extent), then sendfile,
+    # then a plain read/write loop where neither is supported. Returns the number of bytes copied
+    source_fd = source_handle.fileno()
+    destination_fd = destination_handle.fileno()
+    start = os.lseek(destination_fd, 0, os.SEEK_CUR)
+    kernel_copies = []
+    if hasattr(os, 'copy_file_range'):
+        kernel_copies.append(lambda: os.copy_file_range(source_fd, destination_fd, KERNEL_COPY_SIZE))
+    if hasattr(os, 'sendfile'):
+        kernel_copies.append(lambda: os.sendfile(destination_fd, source_fd, None, KERNEL_COPY_SIZE))
+    for kernel_copy in kernel_copies:
+        try:
+            while kernel_copy():
+                pass
+            return os.lseek(destination_fd, 0, os.SEEK_CUR) - start
+        except OSError as e:
+            # only fall back when nothing was copied yet, anything else is a real I/O error
+            if os.lseek(destination_fd, 0, os.SEEK_CUR) != start or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF):
+                raise
+    shutil.copyfileobj(source_handle, destination_handle, REPORT_CHUNK_SIZE)
+    return os.lseek(destination_fd, 0, os.SEEK_CUR) - start
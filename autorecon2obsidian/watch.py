@@ -0,0 +1,104 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+class InotifyWatcher:
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, root):
+        self.root = str(root)
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self.watches = {}
+        self._watch_tree(self.root)
+
+    def _watch_tree(self, directory):
+        for dirpath, _, _ in os.walk(directory):
+            watch_descriptor = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.WATCH_MASK)
+            if watch_descriptor >= 0:
+                self.watches[watch_descriptor] = dirpath
+
+    def wait(self, timeout):
+        changed_paths = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed_paths
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed_paths
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, name_length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_length].rstrip(b'\0'))
+            offset += name_length
+            if mask & self.IN_Q_OVERFLOW:
+                changed_paths.add(self.root)
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(watch_descriptor, None)
+                continue
+            directory = self.watches.get(watch_descriptor)
+            if directory is None:
+                continue
+            changed_path = os.path.join(directory, name) if name else directory
+            changed_paths.add(changed_path)
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                # files created before the new watch was added are picked up by re-gathering the whole port
+                self._watch_tree(changed_path)
+        return changed_paths
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+
+    def __init__(self, root, interval):
+        self.root = str(root)
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                file_path = os.path.join(dirpath, name)
+                try:
+                    file_stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                snapshot[file_path] = (file_stat.st_size, file_stat.st_mtime_ns)
+            snapshot.setdefault(dirpath, None)
+        return snapshot
+
+    def wait(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            sleep_for = self.interval if deadline is None else min(self.interval, max(0, deadline - time.monotonic()))
+            time.sleep(sleep_for)
+            snapshot = self._scan()
+            changed_paths = {path for path in snapshot.keys() | self.snapshot.keys() if snapshot.get(path, False) != self.snapshot.get(path, False)}
+            self.snapshot = snapshot
+            if changed_paths or (deadline is not None and time.monotonic() >= deadline):
+                return changed_paths
+
+    def close(self):
+        pass
@@ -0,0 +1,134 @@
+import random
+import sys
+import threading
+import time
+
+from .services import WhatportisError
+
+class WhatportisClient:
+
+    # Talks to whatportis --server with connect and read timeouts. Failed requests (no connection,
+    # a timeout, a 5xx answer) are retried with jittered exponential backoff, and once failure_threshold
+    # requests in a row have failed the circuit opens: lookups fail straight away without touching the
+    # server until BREAKER_COOLDOWN has passed. Then the circuit is half open: the first request is
+    # let through to probe the server and every other one keeps failing until the probe succeeds
+    # (closing the circuit) or fails (opening it for another cooldown).
+    # Shared by the lookup threads and the --pipeline event loop, so the breaker state takes the lock
+    RETRY_BACKOFF = 0.25
+    BREAKER_COOLDOWN = 60
+
+    def __init__(self, host, port, max_connections, connect_timeout, read_timeout, retries, failure_threshold):
+        self.host = host
+        self.port = int(port)
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.failure_threshold = failure_threshold
+        self.lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.retry_at = 0.0
+        self.probing = False
+        self.session = None
+        self.async_client = None
+
+    def get(self, path):
+        # requests (and its urllib3 chain) is only imported by runs that actually query whatportis
+        import requests
+        with self.lock:
+            if self.session is None:
+                self.session = requests.Session()
+                self.session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections))
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._backoff(attempt))
+            probe = self._check_circuit(error)
+            try:
+                response = self.session.get(f"http://{self.host}:{self.port}{path}", timeout=(self.connect_timeout, self.read_timeout))
+                self._check_status(response.status_code)
+            except (requests.RequestException, WhatportisError) as e:
+                error = e
+                self._record_failure(e)
+                continue
+            except BaseException:
+                if probe:
+                    self._abandon_probe()
+                raise
+            self._record_success()
+            return response.status_code, response.text
+        raise WhatportisError(f"GET {path} failed: {error}")
+
+    async def async_get(self, path):
+        import asyncio
+        from .asynchttp import AsyncHttpClient
+        if self.async_client is None:
+            self.async_client = AsyncHttpClient(self.host, self.port, self.max_connections, self.connect_timeout, self.read_timeout)
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self._backoff(attempt))
+            probe = self._check_circuit(error)
+            try:
+                status_code, response_text = await self.async_client.get(path)
+                self._check_status(status_code)
+            except (OSError, EOFError, ValueError, asyncio.TimeoutError, WhatportisError) as e:
+                error = str(e) or type(e).__name__
+                self._record_failure(e)
+                continue
+            except BaseException:
+                # e.g. the lookup task was cancelled, which says nothing about the server
+                if probe:
+                    self._abandon_probe()
+                raise
+            self._record_success()
+            return status_code, response_text
+        raise WhatportisError(f"GET {path} failed: {error}")
+
+    def _backoff(self, attempt):
+        return random.uniform(0, self.RETRY_BACKOFF * 2 ** attempt)
+
+    def _check_status(self, status_code):
+        if status_code >= 500:
+            raise WhatportisError(f"HTTP {status_code}")
+
+    def _check_circuit(self, error):
+        # Returns True when the caller is the half-open probe
+        with self.lock:
+            if self.consecutive_failures < self.failure_threshold:
+                return False
+            if self.probing or time.monotonic() < self.retry_at:
+                raise WhatportisError(f"not queried after {self.consecutive_failures} failed requests" + (f", last error: {error}" if error else ''))
+            self.probing = True
+            return True
+
+    def _abandon_probe(self):
+        with self.lock:
+            self.probing = False
+
+    def _record_success(self):
+        with self.lock:
+            self.consecutive_failures = 0
+            self.probing = False
+
+    def _record_failure(self, error):
+        error = str(error) or type(error).__name__
+        with self.lock:
+            self.consecutive_failures += 1
+            self.probing = False
+            if self.consecutive_failures >= self.failure_threshold:
+                if self.consecutive_failures == self.failure_threshold:
+                    print(f"whatportis at {self.host}:{self.port} failed {self.consecutive_failures} requests in a row ({error}), "
+                          f"not querying it for {self.BREAKER_COOLDOWN} seconds", file=sys.stderr)
+                self.retry_at = time.monotonic() + self.BREAKER_COOLDOWN
+
+    def close_async(self):
+        if self.async_client is not None:
+            self.async_client.close()
+            self.async_client = None
+
+    def close(self):
+        self.close_async()
+        if self.session is not None:
+            self.session.close()
+            self.session = None
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Generates a synthetic autorecon "scans" directory for benchmarking autorecon-helper.py.
+#
+# Usage:
+#   benchmarks/generate_tree.py /tmp/bench-target --ports 2000 --reports-per-port 4 --report-size 8192
+#
+# Port numbers, report names and report contents are drawn from a seeded random generator, so the
+# same arguments always produce the same tree.
+
+import argparse
+import os
+import random
+from pathlib import Path
+
+PORT_COUNT = 65535
+PROTOCOLS = ('tcp', 'udp')
+
+# Report filenames autorecon writes for a port, {protocol} and {port} are filled in per port
+REPORT_TEMPLATES = [
+    '{protocol}_{port}_nmap.txt',
+    '{protocol}_{port}_http_nmap.txt',
+    '{protocol}_{port}_http_nikto.txt',
+    '{protocol}_{port}_http_whatweb.txt',
+    '{protocol}_{port}_http_feroxbuster_dirbuster.txt',
+    '{protocol}_{port}_http_curl-robots.txt',
+    '{protocol}_{port}_http_curl.html',
+    '{protocol}_{port}_smb_nmap.txt',
+    '{protocol}_{port}_smb_vulnerabilities.txt',
+    '{protocol}_{port}_rpc_nmap.txt',
+    '{protocol}_{port}_ldap_nmap.txt',
+    '{protocol}_{port}_snmp_snmpwalk.txt',
+    '{protocol}_{port}_sslscan.html',
+    'enum4linux.txt',
+    'smbclient.txt',
+    'smbmap-share-permissions.txt',
+]
+
+ASCII_LINES = [
+    '200      GET       10l       20w      300c http://10.10.10.5/{token}',
+    '|_http-title: {token} login page',
+    '+ /{token}/: Directory indexing found.',
+    'iso.3.6.1.2.1.25.4.2.1.2.{number} = STRING: "{token}.exe"',
+    '{number}/tcp open  {token}  Product {number}.0',
+    '        {token}$          Disk      Remote {token}',
+]
+
+NON_ASCII_LINES = [
+    '+ Server: Apache/2.4.41 (Ubuntu) — “{token}” ñ',
+    '|_http-title: Connexion — {token} réseau',
+    'iso.3.6.1.4.1.77.1.2.25.1.1.{number} = STRING: "Пользователь {token}"',
+    '        {token}          Disk      共享文件夹 {token}',
+]
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Generate a synthetic autorecon scans directory')
+    parser.add_argument('output', help='Target directory to create, the tree is written to <output>/scans')
+    parser.add_argument('--ports', type=int, default=100, help=f'Number of port directories, at most {PORT_COUNT} per protocol')
+    parser.add_argument('--udp-ratio', type=float, default=0.1, help='Fraction of port directories that are udp')
+    parser.add_argument('--reports-per-port', type=int, default=4, help='Number of report files in every port directory')
+    parser.add_argument('--report-size', type=int, default=4096, help='Approximate size in bytes of every report')
+    parser.add_argument('--non-ascii-ratio', type=float, default=0.05, help='Fraction of report lines containing non-ASCII text')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    return parser.parse_args()
+
+
+def choose_ports(generator, ports, udp_ratio):
+    udp_count = min(int(ports * udp_ratio), PORT_COUNT)
+    tcp_count = min(ports - udp_count, PORT_COUNT)
+    return {
+        'tcp': sorted(generator.sample(range(1, PORT_COUNT + 1), tcp_count)),
+        'udp': sorted(generator.sample(range(1, PORT_COUNT + 1), udp_count)),
+    }
+
+
+def report_contents(generator, report_size, non_ascii_ratio):
+    lines = []
+    size = 0
+    while size < report_size:
+        templates = NON_ASCII_LINES if generator.random() < non_ascii_ratio else ASCII_LINES
+        line = generator.choice(templates).format(token=f"x{generator.randrange(1 << 20):05x}", number=generator.randrange(1, 65536))
+        lines.append(line)
+        size += len(line.encode('utf-8')) + 1
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def generate_tree(output, ports=100, udp_ratio=0.1, reports_per_port=4, report_size=4096, non_ascii_ratio=0.05, seed=0):
+    generator = random.Random(seed)
+    scans_dir = Path(output) / 'scans'
+    total_files = 0
+    total_bytes = 0
+    for protocol, port_numbers in choose_ports(generator, ports, udp_ratio).items():
+        for port in port_numbers:
+            port_dir = scans_dir / f"{protocol}{port}"
+            os.makedirs(port_dir, exist_ok=True)
+            for template in generator.sample(REPORT_TEMPLATES, min(reports_per_port, len(REPORT_TEMPLATES))):
+                contents = report_contents(generator, report_size, non_ascii_ratio)
+                (port_dir / template.format(protocol=protocol, port=port)).write_bytes(contents)
+                total_files += 1
+                total_bytes += len(contents)
+    os.makedirs(scans_dir / 'xml', exist_ok=True)
+    return scans_dir, total_files, total_bytes
+
+
+def main():
+    arguments = parse_arguments()
+    scans_dir, total_files, total_bytes = generate_tree(
+        arguments.output, arguments.ports, arguments.udp_ratio, arguments.reports_per_port,
+        arguments.report_size, arguments.non_ascii_ratio, arguments.seed,
+    )
+    print(f"Wrote {scans_dir}: {arguments.ports} ports, {total_files} reports, {total_bytes} bytes")
+
+
+if __name__ == '__main__':
+    main()
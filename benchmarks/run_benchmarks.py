@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+# Times each phase of autorecon-helper.py against synthetic autorecon trees and writes the results
+# as JSON.
+#
+# Usage:
+#   benchmarks/run_benchmarks.py --ports 100,1000,10000 --repeat 3 -o bench.json
+#
+# Every size in --ports gets its own generated tree. Service names come from a stub whatportis
+# server started in a child process, so no network access or real whatportis install is needed, and
+# every run writes into a fresh vault so generate_notes always renders every note.
+
+import argparse
+import http.server
+import importlib.util
+import json
+import multiprocessing
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from generate_tree import generate_tree
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / 'autorecon-helper.py'
+PHASES = ('gather', 'sort', 'generate', 'master', 'publish')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark the phases of autorecon-helper.py')
+    parser.add_argument('--ports', default='100,1000', help='Comma separated list of port counts to benchmark')
+    parser.add_argument('--udp-ratio', type=float, default=0.1, help='Fraction of port directories that are udp')
+    parser.add_argument('--reports-per-port', type=int, default=4, help='Number of report files in every port directory')
+    parser.add_argument('--report-size', type=int, default=4096, help='Approximate size in bytes of every report')
+    parser.add_argument('--non-ascii-ratio', type=float, default=0.05, help='Fraction of report lines containing non-ASCII text')
+    parser.add_argument('--service-names', type=int, default=200, help='Number of distinct service names the stub whatportis server returns')
+    parser.add_argument('--offline-index', action='store_true', help='Resolve service names with the offline index instead of the stub whatportis server')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs per port count')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the generated trees')
+    parser.add_argument('--work-dir', help='Directory for generated trees and vaults, a temporary directory by default')
+    parser.add_argument('--script', default=str(SCRIPT_PATH), help='autorecon-helper.py to benchmark')
+    parser.add_argument('-o', '--output', help='JSON file to write, stdout by default')
+    return parser.parse_args()
+
+
+def load_script(script_path):
+    # the script imports the autorecon2obsidian package next to it
+    sys.path.insert(0, str(Path(script_path).resolve().parent))
+    spec = importlib.util.spec_from_file_location('autorecon_helper', script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class StubWhatportisHandler(http.server.BaseHTTPRequestHandler):
+    # Answers /ports/<port> the way whatportis --server does, every tenth port is unassigned.
+    # Responses are buffered and sent in one write so Nagle's algorithm doesn't add a delayed-ACK
+    # stall to every lookup
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+    service_names = 200
+
+    def do_GET(self):
+        port = int(self.path.rsplit('/', 1)[1])
+        ports = [] if port % 10 == 0 else [[f"service-{port % self.service_names}", str(port), 'tcp', 'synthetic service']]
+        body = json.dumps({'ports': ports}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *arguments):
+        pass
+
+
+def serve_stub_whatportis(service_names, address_queue):
+    StubWhatportisHandler.service_names = service_names
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubWhatportisHandler)
+    address_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_stub_whatportis(service_names):
+    # The stub runs in its own process so serving lookups doesn't compete with the benchmarked
+    # code for the GIL
+    address_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=serve_stub_whatportis, args=(service_names, address_queue), daemon=True)
+    process.start()
+    return process, address_queue.get(timeout=30)
+
+
+def make_helper(module, scans_dir, vault_dir, arguments, whatportis_port):
+    argv = ['autorecon-helper.py', str(scans_dir), str(vault_dir), '--name', 'Bench', '--no-service-cache']
+    if not arguments.offline_index:
+        argv += ['--no-service-index', '--port', str(whatportis_port)]
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        return module.AutoRecon2Obsidian()
+    finally:
+        sys.argv = saved_argv
+
+
+def time_phase(timings, phase, function, *function_arguments):
+    started = time.perf_counter()
+    result = function(*function_arguments)
+    timings[phase] = time.perf_counter() - started
+    return result
+
+
+def run_once(module, scans_dir, vault_dir, arguments, whatportis_port):
+    helper = make_helper(module, scans_dir, vault_dir, arguments, whatportis_port)
+    helper.create_vault_directories([helper.target_name])
+    helper.manifest = helper.load_manifest()
+    timings = {}
+    try:
+        target = time_phase(timings, 'gather', helper.gather_autorecon_report_data)
+        sorted_target = time_phase(timings, 'sort', helper.sort_gathered_data, target)
+        time_phase(timings, 'generate', helper.generate_notes, sorted_target)
+        time_phase(timings, 'master', helper.make_combined_document, sorted_target)
+        time_phase(timings, 'publish', helper.publish_staged_output)
+    finally:
+        helper.close()
+    return timings
+
+
+def summarize(runs):
+    return {'min': min(runs), 'median': statistics.median(runs), 'max': max(runs), 'runs': runs}
+
+
+def benchmark_size(module, work_dir, ports, arguments, whatportis_port):
+    tree_dir = work_dir / f"tree-{ports}"
+    shutil.rmtree(tree_dir, ignore_errors=True)
+    scans_dir, total_files, total_bytes = generate_tree(
+        tree_dir, ports, arguments.udp_ratio, arguments.reports_per_port,
+        arguments.report_size, arguments.non_ascii_ratio, arguments.seed,
+    )
+    phase_runs = {phase: [] for phase in PHASES}
+    for run in range(arguments.repeat):
+        vault_dir = work_dir / f"vault-{ports}-{run}"
+        shutil.rmtree(vault_dir, ignore_errors=True)
+        timings = run_once(module, scans_dir, vault_dir, arguments, whatportis_port)
+        shutil.rmtree(vault_dir, ignore_errors=True)
+        for phase in PHASES:
+            phase_runs[phase].append(timings[phase])
+    shutil.rmtree(tree_dir, ignore_errors=True)
+    phases = {phase: summarize(runs) for phase, runs in phase_runs.items()}
+    for phase in phases.values():
+        phase['per_port_us'] = phase['median'] / ports * 1e6
+    return {'ports': ports, 'reports': total_files, 'report_bytes': total_bytes, 'phases': phases}
+
+
+def main():
+    arguments = parse_arguments()
+    port_counts = [int(ports) for ports in arguments.ports.split(',')]
+    module = load_script(arguments.script)
+    stub_process, whatportis_port = (None, None) if arguments.offline_index else start_stub_whatportis(arguments.service_names)
+    temporary_dir = None
+    if arguments.work_dir:
+        work_dir = Path(arguments.work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        temporary_dir = tempfile.TemporaryDirectory(prefix='autorecon2obsidian-bench-')
+        work_dir = Path(temporary_dir.name)
+    try:
+        results = []
+        for ports in port_counts:
+            result = benchmark_size(module, work_dir, ports, arguments, whatportis_port)
+            print(f"{ports} ports: " + ', '.join(f"{phase} {result['phases'][phase]['median']:.3f}s" for phase in PHASES), file=sys.stderr)
+            results.append(result)
+    finally:
+        if stub_process is not None:
+            stub_process.terminate()
+        if temporary_dir is not None:
+            temporary_dir.cleanup()
+    report = {
+        'script': str(Path(arguments.script).resolve()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'parameters': {
+            'udp_ratio': arguments.udp_ratio,
+            'reports_per_port': arguments.reports_per_port,
+            'report_size': arguments.report_size,
+            'non_ascii_ratio': arguments.non_ascii_ratio,
+            'service_names': arguments.service_names,
+            'offline_index': arguments.offline_index,
+            'repeat': arguments.repeat,
+            'seed': arguments.seed,
+        },
+        'results': results,
+    }
+    if arguments.output:
+        with open(arguments.output, 'w') as file_handle:
+            json.dump(report, file_handle, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+
+
+if __name__ == '__main__':
+    main()
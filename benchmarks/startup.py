@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# Measures how long autorecon2obsidian takes to start and which heavy modules each kind of run
+# imports, and fails when a run goes over its time budget or imports a module it should not.
+#
+# Usage:
+#   benchmarks/startup.py --repeat 20 --budget help=40 --budget render=150 -o startup.json
+#
+# Every scenario runs in a fresh interpreter. Budgets are in milliseconds on top of starting a bare
+# "python -c pass", so they mean roughly the same on faster and slower machines.
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from generate_tree import generate_tree
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / 'autorecon-helper.py'
+# Modules that cost tens of milliseconds to import and that these runs never use
+HEAVY_MODULES = ('requests', 'urllib3', 'asyncio', 'multiprocessing')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark the start-up time of autorecon2obsidian')
+    parser.add_argument('--repeat', type=int, default=10, help='Number of timed runs per scenario')
+    parser.add_argument('--ports', type=int, default=20, help='Number of port directories in the tree the render scenario uses')
+    parser.add_argument('--budget', action='append', default=[], help='<scenario>=<milliseconds> over a bare interpreter start, can be repeated')
+    parser.add_argument('--script', default=str(SCRIPT_PATH), help='autorecon-helper.py to benchmark')
+    parser.add_argument('-o', '--output', help='JSON file to write, stdout by default')
+    return parser.parse_args()
+
+
+def scenarios(script, work_dir, ports):
+    # name -> command line, render re-renders an unchanged tree the way a shell loop or an editor
+    # hook would, with the offline service index only
+    scans_dir, _, _ = generate_tree(work_dir / 'tree', ports)
+    vault_dir = work_dir / 'vault'
+    return {
+        'bare': ['-c', 'pass'],
+        'help': [script, '--help'],
+        'render': [script, str(scans_dir), str(vault_dir), '--name', 'Bench', '--no-service-cache', '--no-report-index'],
+    }
+
+
+def run_scenario(command):
+    started = time.perf_counter()
+    subprocess.run([sys.executable, *command], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def imported_modules(command):
+    result = subprocess.run([sys.executable, '-X', 'importtime', *command], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return {line.rsplit('|', 1)[1].strip() for line in result.stderr.splitlines() if line.startswith('import time:') and '|' in line}
+
+
+def main():
+    arguments = parse_arguments()
+    budgets = {}
+    for budget in arguments.budget:
+        name, _, milliseconds = budget.partition('=')
+        budgets[name] = float(milliseconds)
+    work_dir = Path(tempfile.mkdtemp(prefix='autorecon2obsidian-startup-'))
+    try:
+        commands = scenarios(arguments.script, work_dir, arguments.ports)
+        unknown = set(budgets) - set(commands)
+        if unknown:
+            print(f"Unknown scenarios: {', '.join(sorted(unknown))}", file=sys.stderr)
+            sys.exit(2)
+        # the first run writes the bytecode caches and the render scenario's vault
+        for command in commands.values():
+            run_scenario(command)
+        results = {}
+        for name, command in commands.items():
+            runs = [run_scenario(command) for _ in range(arguments.repeat)]
+            results[name] = {'min': min(runs), 'median': statistics.median(runs), 'max': max(runs), 'runs': runs}
+            if name != 'bare':
+                results[name]['heavy_modules'] = sorted(module for module in HEAVY_MODULES if module in imported_modules(command))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    failures = []
+    bare = results['bare']['median']
+    for name, result in results.items():
+        if name == 'bare':
+            continue
+        result['overhead_ms'] = (result['median'] - bare) * 1000
+        print(f"{name}: median {result['median'] * 1000:.1f} ms, {result['overhead_ms']:.1f} ms over a bare interpreter"
+              + (f", imports {', '.join(result['heavy_modules'])}" if result['heavy_modules'] else ''), file=sys.stderr)
+        if result['heavy_modules']:
+            failures.append(f"{name} imports {', '.join(result['heavy_modules'])}")
+        if name in budgets and result['overhead_ms'] > budgets[name]:
+            failures.append(f"{name} took {result['overhead_ms']:.1f} ms, budget {budgets[name]:.1f} ms")
+
+    report = {
+        'script': str(Path(arguments.script).resolve()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'parameters': {'repeat': arguments.repeat, 'ports': arguments.ports, 'budgets': budgets},
+        'results': results,
+        'failures': failures,
+    }
+    if arguments.output:
+        with open(arguments.output, 'w') as file_handle:
+            json.dump(report, file_handle, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from autorecon2obsidian.asynchttp import AsyncHttpClient
+
+RESPONSES = {
+    '/length': b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 13\r\n\r\n{"ports": []}',
+    '/chunked': b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n4;ext=1\r\n{"po\r\n9\r\nrts": []}\r\n0\r\nX-Trailer: 1\r\n\r\n',
+    '/close': b'HTTP/1.1 503 Service Unavailable\r\nConnection: close\r\n\r\nread until the server closes',
+    '/http10': b'HTTP/1.0 404 Not Found\r\nContent-Length: 2\r\n\r\n{}',
+}
+
+
+class StubServer:
+
+    # Answers every request with RESPONSES[path]. /stall never answers, and with close_after_response
+    # the server drops each connection after one response without announcing it
+    def __init__(self, close_after_response=False):
+        self.close_after_response = close_after_response
+        self.connections = 0
+        self.requests = []
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while await reader.readline() not in (b'\r\n', b''):
+                    pass
+                path = request_line.split()[1].decode('ascii')
+                self.requests.append(path)
+                if path == '/stall':
+                    # until the client gives up and closes the connection
+                    await reader.read()
+                    break
+                writer.write(RESPONSES[path])
+                await writer.drain()
+                if path in ('/close', '/http10') or self.close_after_response:
+                    break
+        finally:
+            writer.close()
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_content_length_responses_reuse_one_connection():
+    async def scenario():
+        async with StubServer() as server:
+            client = AsyncHttpClient('127.0.0.1', server.port, 4, 1.0, 1.0)
+            results = [await client.get('/length') for _ in range(3)]
+            client.close()
+            return results, server.connections
+    results, connections = run(scenario())
+    assert results == [(200, '{"ports": []}')] * 3
+    assert connections == 1
+
+
+def test_chunked_response_with_extension_and_trailer():
+    async def scenario():
+        async with StubServer() as server:
+            client = AsyncHttpClient('127.0.0.1', server.port, 4, 1.0, 1.0)
+            results = [await client.get('/chunked'), await client.get('/length')]
+            client.close()
+            return results, server.connections
+    results, connections = run(scenario())
+    assert results == [(200, '{"ports": []}'), (200, '{"ports": []}')]
+    # the chunked body and its trailer were consumed exactly, so the connection stayed usable
+    assert connections == 1
+
+
+def test_connection_close_response_is_read_to_end_and_not_pooled():
+    async def scenario():
+        async with StubServer() as server:
+            client = AsyncHttpClient('127.0.0.1', server.port, 4, 1.0, 1.0)
+            results = [await client.get('/close'), await client.get('/http10'), await client.get('/length')]
+            pooled = len(client.idle_connections)
+            client.close()
+            return results, server.connections, pooled
+    results, connections, pooled = run(scenario())
+    assert results == [(503, 'read until the server closes'), (404, '{}'), (200, '{"ports": []}')]
+    assert connections == 3
+    assert pooled == 1
+
+
+def test_request_on_a_connection_the_server_dropped_is_retried():
+    async def scenario():
+        async with StubServer(close_after_response=True) as server:
+            client = AsyncHttpClient('127.0.0.1', server.port, 4, 1.0, 1.0)
+            first = await client.get('/length')
+            # give the server time to close the pooled connection
+            await asyncio.sleep(0.05)
+            second = await client.get('/length')
+            client.close()
+            return first, second, server.connections
+    first, second, connections = run(scenario())
+    assert first == second == (200, '{"ports": []}')
+    assert connections == 2
+
+
+def test_read_timeout():
+    async def scenario():
+        async with StubServer() as server:
+            client = AsyncHttpClient('127.0.0.1', server.port, 4, 1.0, 0.2)
+            try:
+                await client.get('/stall')
+            finally:
+                client.close()
+    with pytest.raises(asyncio.TimeoutError):
+        run(scenario())
+
+
+def test_connection_refused():
+    async def scenario():
+        server = await asyncio.start_server(lambda reader, writer: None, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+        await AsyncHttpClient('127.0.0.1', port, 4, 1.0, 1.0).get('/length')
+    with pytest.raises(ConnectionError):
+        run(scenario())
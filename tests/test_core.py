@@ -0,0 +1,431 @@
+import hashlib
+import json
+import os
+import shutil
+
+import pytest
+
+from autorecon2obsidian.cli import parse_arguments
+from autorecon2obsidian import core
+from autorecon2obsidian.core import AutoRecon2Obsidian
+
+
+NMAP_XML = '''<?xml version="1.0"?>
+<nmaprun><host><ports>
+{ports}
+</ports></host></nmaprun>
+'''
+NMAP_XML_PORT = '<port protocol="tcp" portid="{port}"><state state="open"/><service name="{name}" product="{product}" method="probed" conf="10"/></port>'
+
+
+def write_scans(scans_dir, port_reports):
+    for port_dir, reports in port_reports.items():
+        (scans_dir / port_dir).mkdir(parents=True, exist_ok=True)
+        for file_name, contents in reports.items():
+            (scans_dir / port_dir / file_name).write_text(contents)
+
+
+def write_nmap_xml(xml_path, services):
+    xml_path.parent.mkdir(parents=True, exist_ok=True)
+    xml_path.write_text(NMAP_XML.format(ports='\n'.join(NMAP_XML_PORT.format(port=port, name=name, product=product) for port, name, product in services)))
+
+
+def target_dir(tmp_path, vault='vault', platform='HTB'):
+    return tmp_path / vault / '03 - Content' / 'Write Ups' / platform / 'Box'
+
+
+@pytest.fixture
+def make_autorecon2obsidian(tmp_path):
+    instances = []
+
+    def make(*options, vault='vault', name='Box'):
+        name_options = ['--name', name] if name else []
+        arguments = parse_arguments([str(tmp_path / 'scans'), str(tmp_path / vault), *name_options, '--no-service-cache', *options])
+        instances.append(AutoRecon2Obsidian(arguments))
+        return instances[-1]
+
+    yield make
+    for instance in instances:
+        instance.close()
+
+
+@pytest.mark.parametrize('port_name, family', [
+    ('MSRPC', 'SMB and RPC'),
+    ('NCACN_HTTP', 'SMB and RPC'),
+    ('MICROSOFT-DS', 'SMB and RPC'),
+    ('NETBIOS-SSN', 'SMB and RPC'),
+    ('MC-NMF', 'SMB and RPC'),
+    ('WINRM', 'SMB and RPC'),
+    ('ADWS', 'Directory Services'),
+    ('GLOBALCATLDAPSSL', 'Directory Services'),
+    ('KERBEROS-SEC', 'Directory Services'),
+    ('HTTPS', 'Web'),
+    ('HTTP-PROXY', 'Web'),
+    ('SSL/HTTP', 'Web'),
+    ('MS-SQL-S', 'Databases'),
+    ('MYSQL', 'Databases'),
+    ('POSTGRESQL', 'Databases'),
+    ('IMAPS', 'Mail'),
+    ('MS-WBT-SERVER', 'Remote Access'),
+    ('SSL/MS-WBT-SERVER', 'Remote Access'),
+    ('FTP-DATA', 'File Sharing'),
+    ('TFTP', 'File Sharing'),
+    ('NTP', 'Network Services'),
+    ('DOMAIN', 'Network Services'),
+    ('NNTP', 'Other'),
+    ('NNTPS', 'Other'),
+    ('GOPHER', 'Other'),
+    ('UNKNOWN', 'Unidentified'),
+])
+def test_service_family_matches_keywords_at_the_start_of_a_word(port_name, family):
+    assert AutoRecon2Obsidian._service_family(port_name) == family
+
+
+@pytest.mark.parametrize('service_name', ['adws', 'wsman', 'msft-gc', 'http-rpc-epmap', 'microsoft-ds', 'kpasswd', 'ms-sql-s', 'ncacn_http', 'globalcatLDAPssl'])
+def test_mapped_service_names_belong_to_a_family(service_name, make_autorecon2obsidian):
+    preferred_name = make_autorecon2obsidian()._lookup_preferred_name(service_name)
+    assert AutoRecon2Obsidian._service_family(preferred_name.upper()) != 'Other'
+
+
+def test_watch_updates_ports_whose_nmap_service_changed_in_the_full_scan_xml(tmp_path, make_autorecon2obsidian):
+    scans_dir = tmp_path / 'scans'
+    write_scans(scans_dir, {
+        'tcp22': {'tcp_22_ssh_nmap.txt': '22/tcp open ssh\n'},
+        'tcp80': {'tcp_80_http_nmap.txt': '80/tcp open http\n'},
+    })
+    write_nmap_xml(scans_dir / 'xml' / '_full_tcp_nmap.xml', [(22, 'ssh', 'OpenSSH'), (80, 'http', 'Apache httpd')])
+    autorecon2obsidian = make_autorecon2obsidian()
+    autorecon2obsidian.process()
+    write_nmap_xml(scans_dir / 'xml' / '_full_tcp_nmap.xml', [(22, 'ssh', 'OpenSSH'), (80, 'http', 'nginx'), (443, 'https', 'nginx')])
+    port_dirs = autorecon2obsidian._changed_port_dirs({str(scans_dir / 'xml' / '_full_tcp_nmap.xml')})
+    assert port_dirs == [scans_dir / 'tcp80']
+    autorecon2obsidian.update_ports(port_dirs)
+    master = (target_dir(tmp_path) / '0 - Enumeration' / 'Enumeration - Master.md').read_text()
+    assert 'nginx' in master and 'Apache httpd' not in master
+
+
+def test_ports_whose_directory_is_gone_lose_their_note_and_manifest_entry(tmp_path, make_autorecon2obsidian):
+    scans_dir = tmp_path / 'scans'
+    write_scans(scans_dir, {
+        'tcp22': {'tcp_22_ssh_nmap.txt': '22/tcp open ssh\n'},
+        'tcp80': {'tcp_80_http_nmap.txt': '80/tcp open http\n', 'tcp_80_http_screenshot.png': 'png'},
+        'udp53': {'udp_53_dns_nmap.txt': '53/udp open domain\n'},
+    })
+    logs_dir = target_dir(tmp_path) / '0 - Enumeration' / 'logs'
+    autorecon2obsidian = make_autorecon2obsidian()
+    autorecon2obsidian.process()
+    assert (logs_dir / 'udp' / '53.md').is_file()
+    shutil.rmtree(scans_dir / 'udp53')
+    autorecon2obsidian.update_ports([scans_dir / 'udp53'])
+    assert not (logs_dir / 'udp' / '53.md').exists()
+    assert 'udp/53' not in autorecon2obsidian.manifest['ports']
+    assert (logs_dir / 'tcp' / '22.md').is_file()
+
+    shutil.rmtree(scans_dir / 'tcp80')
+    autorecon2obsidian = make_autorecon2obsidian()
+    autorecon2obsidian.process()
+    assert not (logs_dir / 'tcp' / '80.md').exists()
+    assert not (target_dir(tmp_path) / '0 - Enumeration' / 'attachments' / 'tcp' / '80').exists()
+    manifest = json.loads((target_dir(tmp_path).parent / '.Box.autorecon2obsidian.json').read_text())
+    assert sorted(manifest['ports']) == ['tcp/22']
+
+
+def test_batch_warns_once_per_skipped_directory_and_leaves_no_staging_folder(tmp_path, capfd):
+    for target in ('10.10.10.1', '10.10.10.2'):
+        write_scans(tmp_path / 'results' / target / 'scans', {
+            'tcp22': {'tcp_22_ssh_nmap.txt': '22/tcp open ssh\n'},
+            'tcp_old': {},
+        })
+    arguments = parse_arguments([str(tmp_path / 'results'), str(tmp_path / 'vault'), '--batch', '--jobs', '2', '--no-service-cache'])
+    autorecon2obsidian = AutoRecon2Obsidian(arguments)
+    try:
+        assert autorecon2obsidian.run_batch()
+    finally:
+        autorecon2obsidian.close()
+    stderr = capfd.readouterr().err
+    for target in ('10.10.10.1', '10.10.10.2'):
+        assert stderr.count(f"{target}/scans/tcp_old, not a port directory") == 1
+        assert (tmp_path / 'vault' / '03 - Content' / 'Write Ups' / 'HTB' / target / '0 - Enumeration' / 'logs' / 'tcp' / '22.md').is_file()
+    assert not (tmp_path / 'vault' / '.autorecon2obsidian' / 'staging').exists()
+
+
+def render_counter(autorecon2obsidian, monkeypatch):
+    rendered = []
+    render_port_note = autorecon2obsidian._render_port_note
+
+    def render(port, *arguments):
+        rendered.append(port.key)
+        return render_port_note(port, *arguments)
+
+    monkeypatch.setattr(autorecon2obsidian, '_render_port_note', render)
+    return rendered
+
+
+def write_web_and_ssh_ports(scans_dir):
+    write_scans(scans_dir, {
+        'tcp22': {'tcp_22_ssh_nmap.txt': '22/tcp open ssh\n'},
+        'tcp80': {'tcp_80_http_nmap.txt': '80/tcp open http\n', 'tcp_80_http_nikto.txt': '+ Server: Apache\n'},
+    })
+
+
+def test_unchanged_ports_are_not_rendered_again(tmp_path, make_autorecon2obsidian, monkeypatch):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    assert make_autorecon2obsidian().process() == (2, 2)
+    autorecon2obsidian = make_autorecon2obsidian()
+    rendered = render_counter(autorecon2obsidian, monkeypatch)
+    assert autorecon2obsidian.process() == (0, 2)
+    assert rendered == []
+
+
+def test_only_ports_with_changed_reports_are_rendered(tmp_path, make_autorecon2obsidian, monkeypatch):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    make_autorecon2obsidian().process()
+    (tmp_path / 'scans' / 'tcp80' / 'tcp_80_http_nikto.txt').write_text('+ Server: nginx\n')
+    autorecon2obsidian = make_autorecon2obsidian()
+    rendered = render_counter(autorecon2obsidian, monkeypatch)
+    assert autorecon2obsidian.process() == (1, 2)
+    assert rendered == [('tcp', 80)]
+    assert 'nginx' in (target_dir(tmp_path) / '0 - Enumeration' / 'logs' / 'tcp' / '80.md').read_text()
+
+
+def test_a_touched_report_with_the_same_contents_leaves_the_note_alone(tmp_path, make_autorecon2obsidian):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    make_autorecon2obsidian().process()
+    note_path = target_dir(tmp_path) / '0 - Enumeration' / 'logs' / 'tcp' / '80.md'
+    note_mtime_ns = note_path.stat().st_mtime_ns
+    report_path = tmp_path / 'scans' / 'tcp80' / 'tcp_80_http_nikto.txt'
+    os.utime(report_path, ns=(report_path.stat().st_atime_ns, report_path.stat().st_mtime_ns + 10**9))
+    assert make_autorecon2obsidian().process() == (0, 2)
+    assert note_path.stat().st_mtime_ns == note_mtime_ns
+
+
+def test_a_note_changed_in_the_vault_is_rewritten(tmp_path, make_autorecon2obsidian):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    make_autorecon2obsidian().process()
+    note_path = target_dir(tmp_path) / '0 - Enumeration' / 'logs' / 'tcp' / '22.md'
+    rendered_note = note_path.read_text()
+    note_path.write_text('edited\n')
+    assert make_autorecon2obsidian().process() == (1, 2)
+    assert note_path.read_text() == rendered_note
+
+
+def test_force_renders_every_port(tmp_path, make_autorecon2obsidian, monkeypatch):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    make_autorecon2obsidian().process()
+    autorecon2obsidian = make_autorecon2obsidian('--force')
+    rendered = render_counter(autorecon2obsidian, monkeypatch)
+    autorecon2obsidian.process()
+    assert sorted(rendered) == [('tcp', 22), ('tcp', 80)]
+
+
+def vault_notes(target_path):
+    return {str(note_path.relative_to(target_path)): note_path.read_bytes() for note_path in sorted(target_path.rglob('*.md'))}
+
+
+def test_a_snapshot_renders_the_same_vault_without_gathering(tmp_path, make_autorecon2obsidian, monkeypatch):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    write_nmap_xml(tmp_path / 'scans' / 'xml' / '_full_tcp_nmap.xml', [(80, 'http', 'Apache httpd')])
+    snapshot_path = tmp_path / 'scan.jsonl'
+    make_autorecon2obsidian('--platform', 'PG', '--address', '10.10.10.5', '--save-snapshot', str(snapshot_path)).process()
+
+    autorecon2obsidian = make_autorecon2obsidian('--from-snapshot', str(snapshot_path), vault='copy', name=None)
+    monkeypatch.setattr(autorecon2obsidian, 'gather_autorecon_report_data', lambda *arguments: pytest.fail('gathered from the scans directory'))
+    monkeypatch.setattr(autorecon2obsidian, 'resolve_service_names', lambda *arguments: pytest.fail('looked up service names'))
+    assert autorecon2obsidian.process() == (2, 2)
+    # the name, platform and address all come from the snapshot
+    assert vault_notes(target_dir(tmp_path, 'copy', 'PG')) == vault_notes(target_dir(tmp_path, 'vault', 'PG'))
+    assert '10.10.10.5' in (target_dir(tmp_path, 'copy', 'PG') / '0 - Enumeration' / 'Enumeration - Master.md').read_text()
+
+
+def test_an_explicit_platform_overrides_the_snapshot(tmp_path, make_autorecon2obsidian):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    snapshot_path = tmp_path / 'scan.jsonl'
+    make_autorecon2obsidian('--platform', 'PG', '--save-snapshot', str(snapshot_path)).process()
+    make_autorecon2obsidian('--from-snapshot', str(snapshot_path), '--platform', 'PEN200', vault='copy', name=None).process()
+    assert (target_dir(tmp_path, 'copy', 'PEN200') / '0 - Enumeration' / 'logs' / 'tcp' / '80.md').is_file()
+
+
+def test_a_file_that_is_not_a_snapshot_is_rejected(tmp_path, make_autorecon2obsidian, capsys):
+    write_web_and_ssh_ports(tmp_path / 'scans')
+    (tmp_path / 'scan.jsonl').write_text('{"format": "something else"}\n')
+    with pytest.raises(SystemExit):
+        make_autorecon2obsidian('--from-snapshot', str(tmp_path / 'scan.jsonl'), name=None)
+    assert 'is not a version' in capsys.readouterr().err
+
+
+SHARED_OUTPUT = 'Sharename       Type      Comment\nADMIN$          Disk      Remote Admin\n'
+
+
+def write_smb_ports(scans_dir, tcp445_output=SHARED_OUTPUT):
+    write_scans(scans_dir, {
+        'tcp139': {'smbclient.txt': SHARED_OUTPUT, 'tcp_139_smb_nmap.txt': '139/tcp open netbios-ssn\n'},
+        'tcp445': {'smbclient.txt': tcp445_output, 'tcp_445_smb_nmap.txt': '445/tcp open microsoft-ds\n'},
+    })
+
+
+def test_report_bodies_shared_between_ports_are_stored_once(tmp_path, make_autorecon2obsidian):
+    write_smb_ports(tmp_path / 'scans')
+    make_autorecon2obsidian().process()
+    sha256 = hashlib.sha256(SHARED_OUTPUT.encode()).hexdigest()
+    objects_dir = target_dir(tmp_path) / '0 - Enumeration' / 'objects'
+    assert [object_path.name for object_path in objects_dir.iterdir()] == [f"{sha256}.md"]
+    assert 'ADMIN$' in (objects_dir / f"{sha256}.md").read_text()
+    for port in (139, 445):
+        note = (target_dir(tmp_path) / '0 - Enumeration' / 'logs' / 'tcp' / f"{port}.md").read_text()
+        assert f"![[03 - Content/Write Ups/HTB/Box/0 - Enumeration/objects/{sha256}]]" in note
+        assert 'ADMIN$' not in note
+        assert f"{port}/tcp open" in note
+
+
+def test_no_dedup_embeds_every_report(tmp_path, make_autorecon2obsidian):
+    write_smb_ports(tmp_path / 'scans')
+    make_autorecon2obsidian('--no-dedup').process()
+    assert not any((target_dir(tmp_path) / '0 - Enumeration' / 'objects').glob('*.md'))
+    for port in (139, 445):
+        assert 'ADMIN$' in (target_dir(tmp_path) / '0 - Enumeration' / 'logs' / 'tcp' / f"{port}.md").read_text()
+
+
+def test_objects_no_note_refers_to_are_pruned(tmp_path, make_autorecon2obsidian):
+    write_smb_ports(tmp_path / 'scans')
+    make_autorecon2obsidian().process()
+    write_smb_ports(tmp_path / 'scans', tcp445_output=SHARED_OUTPUT + 'IPC$            IPC       Remote IPC\n')
+    make_autorecon2obsidian().process()
+    assert not any((target_dir(tmp_path) / '0 - Enumeration' / 'objects').glob('*.md'))
+    # the port whose report did not change embeds the body it no longer shares
+    for port in (139, 445):
+        note = (target_dir(tmp_path) / '0 - Enumeration' / 'logs' / 'tcp' / f"{port}.md").read_text()
+        assert 'ADMIN$' in note and 'objects/' not in note
+
+
+def test_key_findings_are_listed_in_the_master_document_and_only_extracted_once(tmp_path, make_autorecon2obsidian, monkeypatch):
+    write_scans(tmp_path / 'scans', {'tcp80': {
+        'tcp_80_http_nmap.txt': '80/tcp open  http    Apache httpd 2.4.41\n',
+        'tcp_80_http_feroxbuster_dirbuster.txt': '200      GET       10l       20w      300c http://10.10.10.5/backup.zip\n',
+    }})
+    make_autorecon2obsidian().process()
+    master = (target_dir(tmp_path) / '0 - Enumeration' / 'Enumeration - Master.md').read_text()
+    assert '|Web Content|200 http://10.10.10.5/backup.zip|tcp_80_http_feroxbuster_dirbuster.txt|' in master
+    assert '|Service|http Apache httpd 2.4.41|tcp_80_http_nmap.txt|' in master
+    monkeypatch.setattr(core, 'extract_findings', lambda *arguments: pytest.fail('read a report whose findings are in the manifest'))
+    make_autorecon2obsidian('--force').process()
+    assert (target_dir(tmp_path) / '0 - Enumeration' / 'Enumeration - Master.md').read_text() == master
+
+
+def write_batch_results(results_dir, targets):
+    for target in targets:
+        write_scans(results_dir / target / 'scans', {'tcp22': {'tcp_22_ssh_nmap.txt': f"22/tcp open ssh {target}\n"}})
+
+
+def run_batch(tmp_path, *options):
+    arguments = parse_arguments([str(tmp_path / 'results'), str(tmp_path / 'vault'), '--batch', '--jobs', '2', '--no-service-cache', *options])
+    autorecon2obsidian = AutoRecon2Obsidian(arguments)
+    try:
+        return autorecon2obsidian.run_batch()
+    finally:
+        autorecon2obsidian.close()
+
+
+@pytest.mark.parametrize('name_map', [
+    '# result directory, machine name\n10.10.10.1 Lame\n10.10.10.2 Legacy\n',
+    '{"10.10.10.1": "Lame", "10.10.10.2": "Legacy"}',
+])
+def test_batch_processes_every_target_under_its_mapped_name(tmp_path, name_map):
+    write_batch_results(tmp_path / 'results', ['10.10.10.1', '10.10.10.2', '10.10.10.3'])
+    (tmp_path / 'names.txt').write_text(name_map)
+    assert run_batch(tmp_path, '--name-map', str(tmp_path / 'names.txt'), '--platform', 'PG')
+    write_ups_dir = tmp_path / 'vault' / '03 - Content' / 'Write Ups' / 'PG'
+    for target, name in (('10.10.10.1', 'Lame'), ('10.10.10.2', 'Legacy'), ('10.10.10.3', '10.10.10.3')):
+        assert target in (write_ups_dir / name / '0 - Enumeration' / 'logs' / 'tcp' / '22.md').read_text()
+        # the address comes from each target's own directory
+        assert target in (write_ups_dir / name / '0 - Enumeration' / 'Enumeration - Master.md').read_text()
+
+
+def fail_broken_target(arguments, *rest):
+    if arguments.name == 'broken':
+        raise RuntimeError('exited with status 1')
+    return process_batch_target(arguments, *rest)
+
+
+process_batch_target = core._process_batch_target
+
+
+def test_a_failed_target_does_not_stop_the_batch(tmp_path, monkeypatch, capfd):
+    write_batch_results(tmp_path / 'results', ['broken', 'working'])
+    monkeypatch.setattr(core, '_process_batch_target', fail_broken_target)
+    assert not run_batch(tmp_path)
+    output = capfd.readouterr()
+    assert 'broken: failed: exited with status 1' in output.err
+    assert 'Batch finished: 1 succeeded, 1 failed' in output.out
+    assert (tmp_path / 'vault' / '03 - Content' / 'Write Ups' / 'HTB' / 'working' / '0 - Enumeration' / 'logs' / 'tcp' / '22.md').is_file()
+
+
+def test_a_batch_target_that_exits_raises_instead(tmp_path, capsys):
+    arguments = parse_arguments([str(tmp_path / 'results' / 'gone' / 'scans'), str(tmp_path / 'vault'), '--name', 'gone', '--no-service-cache'])
+    with pytest.raises(RuntimeError, match='exited with status 1'):
+        core._process_batch_target(arguments, {}, None)
+    assert 'Error while getting TCP port directories' in capsys.readouterr().err
+
+
+class ScriptedWatcher:
+
+    # Hands out one batch of changed paths per wait(None) and nothing while debouncing, then stops
+    # the watch loop the way Ctrl-C does
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.closed = False
+
+    def wait(self, timeout):
+        if timeout is not None:
+            return set()
+        if not self.batches:
+            raise KeyboardInterrupt
+        return self.batches.pop(0)()
+
+    def close(self):
+        self.closed = True
+
+
+def test_changed_port_dirs_maps_paths_to_their_port_directory(tmp_path, make_autorecon2obsidian):
+    scans_dir = tmp_path / 'scans'
+    write_web_and_ssh_ports(scans_dir)
+    autorecon2obsidian = make_autorecon2obsidian('--no-nmap-xml')
+    assert autorecon2obsidian._changed_port_dirs({
+        str(scans_dir / 'tcp80' / 'tcp_80_http_nikto.txt'),
+        str(scans_dir / 'tcp80' / 'xml' / 'tcp_80_http_nmap.xml'),
+        str(scans_dir / 'udp161'),
+        str(scans_dir / '_full_tcp_nmap.txt'),
+        str(scans_dir / 'tcp_old' / 'notes.txt'),
+    }) == [scans_dir / 'tcp80', scans_dir / 'udp161']
+    # the watcher lost track of events
+    assert autorecon2obsidian._changed_port_dirs({str(scans_dir)}) == [scans_dir / 'tcp22', scans_dir / 'tcp80']
+
+
+def test_watch_renders_new_and_changed_ports(tmp_path, make_autorecon2obsidian, monkeypatch, capsys):
+    scans_dir = tmp_path / 'scans'
+    write_web_and_ssh_ports(scans_dir)
+    logs_dir = target_dir(tmp_path) / '0 - Enumeration' / 'logs'
+
+    def add_port():
+        write_scans(scans_dir, {'tcp445': {'tcp_445_smb_nmap.txt': '445/tcp open microsoft-ds\n'}})
+        return {str(scans_dir / 'tcp445'), str(scans_dir / 'tcp445' / 'tcp_445_smb_nmap.txt')}
+
+    def change_report():
+        (scans_dir / 'tcp80' / 'tcp_80_http_nikto.txt').write_text('+ Server: nginx\n')
+        return {str(scans_dir / 'tcp80' / 'tcp_80_http_nikto.txt')}
+
+    watcher = ScriptedWatcher([add_port, lambda: {str(scans_dir / '_full_tcp_nmap.txt')}, change_report])
+    autorecon2obsidian = make_autorecon2obsidian('--watch-debounce', '0.01')
+    monkeypatch.setattr(autorecon2obsidian, '_create_watcher', lambda: watcher)
+    autorecon2obsidian.process()
+    autorecon2obsidian.watch()
+    assert watcher.closed
+    output = capsys.readouterr().out
+    assert '1 ports changed (tcp/445), updated 1 port notes' in output
+    assert '1 ports changed (tcp/80), updated 1 port notes' in output
+    # a change outside every port directory updates nothing
+    assert output.count('ports changed') == 2
+    assert output.rstrip().endswith('Stopped watching')
+    assert (logs_dir / 'tcp' / '445.md').is_file()
+    assert 'nginx' in (logs_dir / 'tcp' / '80.md').read_text()
+    master = (target_dir(tmp_path) / '0 - Enumeration' / 'Enumeration - Master.md').read_text()
+    assert '(445 TCP)' in master
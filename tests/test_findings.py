@@ -0,0 +1,88 @@
+import pytest
+
+from autorecon2obsidian.findings import FINDINGS_CLASSIFIER, MAX_LINE_LENGTH, extract_findings
+
+
+def findings_of(file_name, lines):
+    kind, extract = FINDINGS_CLASSIFIER.classify(file_name)
+    return kind, [value for value in map(extract, lines) if value is not None]
+
+
+@pytest.mark.parametrize('file_name, lines, kind, expected', [
+    ('tcp_80_http_feroxbuster_dirbuster.txt', [
+        b'200      GET       10l       20w      300c http://10.10.10.5/index.php\n',
+        b'301      GET        9l       28w      312c http://10.10.10.5/admin => http://10.10.10.5/admin/\n',
+        b'404      GET        9l       31w      275c http://10.10.10.5/missing\n',
+        b'401      GET        1l        2w       10c http://10.10.10.5/private\n',
+        b'Scanning: http://10.10.10.5\n',
+    ], 'Web Content', ['200 http://10.10.10.5/index.php', '301 http://10.10.10.5/admin -> http://10.10.10.5/admin/', '401 http://10.10.10.5/private']),
+    ('tcp_80_http_gobuster_dirbuster.txt', [
+        b'/index.php            (Status: 200) [Size: 1024]\n',
+        b'/uploads              (Status: 301) [Size: 316] [--> http://10.10.10.5/uploads/]\n',
+        b'/server-status        (Status: 403) [Size: 277]\n',
+    ], 'Web Content', ['200 /index.php', '301 /uploads -> http://10.10.10.5/uploads/']),
+    ('tcp_80_http_dirsearch_dirbuster.txt', [
+        b'200   1KB  http://10.10.10.5/robots.txt\n',
+        b'302    0B  http://10.10.10.5/login    -> REDIRECTS TO: /login.php\n',
+        b'500   12B  http://10.10.10.5/cgi-bin/\n',
+    ], 'Web Content', ['200 http://10.10.10.5/robots.txt', '302 http://10.10.10.5/login -> /login.php']),
+    ('tcp_80_http_ffuf_dirbuster.txt', [
+        b'admin                   [Status: 200, Size: 1234, Words: 10, Lines: 5]\n',
+        b'.htaccess               [Status: 403, Size: 277, Words: 20, Lines: 10]\n',
+    ], 'Web Content', ['200 admin']),
+    ('tcp_80_http_vhosts_subdomains.txt', [
+        b'dev                     [Status: 200, Size: 4321, Words: 100, Lines: 20]\n',
+    ], 'Virtual Host', ['200 dev']),
+    ('tcp_80_http_dirb_dirbuster.txt', [
+        b'+ http://10.10.10.5/index.html (CODE:200|SIZE:10918)\n',
+        b'+ http://10.10.10.5/server-status (CODE:403|SIZE:277)\n',
+    ], 'Web Content', ['200 http://10.10.10.5/index.html']),
+    ('tcp_22_ssh_nmap.txt', [
+        b'PORT   STATE SERVICE VERSION\n',
+        b'22/tcp open  ssh     OpenSSH 8.2p1 Ubuntu 4ubuntu0.5 (Ubuntu Linux; protocol 2.0)\n',
+        b'23/tcp closed telnet\n',
+        b'Service Info: OS: Linux; CPE: cpe:/o:linux:linux_kernel\n',
+    ], 'Service', ['ssh OpenSSH 8.2p1 Ubuntu 4ubuntu0.5 (Ubuntu Linux; protocol 2.0)', 'OS: Linux; CPE: cpe:/o:linux:linux_kernel']),
+    ('smbmap-share-permissions.txt', [
+        b'\tDisk                                                  \tPermissions\tComment\n',
+        b'\tADMIN$                                            \tNO ACCESS\tRemote Admin\n',
+        b'\tUsers                                             \tREAD ONLY\t\n',
+    ], 'SMB Share', ['ADMIN$ (NO ACCESS)', 'Users (READ ONLY)']),
+    ('smbclient.txt', [
+        b'\tSharename       Type      Comment\n',
+        b'\tIPC$            IPC       IPC Service\n',
+        b'\tbackups         Disk      \n',
+    ], 'SMB Share', ['IPC$ (IPC)', 'backups (Disk)']),
+    ('udp_161_snmp_snmpwalk_user_accounts.txt', [
+        b'iso.3.6.1.4.1.77.1.2.25.1.1.5.71.117.101.115.116 = STRING: "Guest"\n',
+        b'iso.3.6.1.4.1.77.1.2.25.1.1.13.65 = STRING: ""\n',
+        b'iso.3.6.1.2.1.1.5.0 = STRING: "HOST"\n',
+    ], 'SNMP User', ['Guest']),
+])
+def test_extractors(file_name, lines, kind, expected):
+    assert findings_of(file_name, lines) == (kind, expected)
+
+
+def test_reports_without_an_extractor_are_not_read():
+    assert FINDINGS_CLASSIFIER.classify('tcp_80_http_nikto.txt') == (None, None)
+
+
+def test_extract_findings_deduplicates_and_counts_the_rest(tmp_path):
+    report_path = tmp_path / 'tcp_80_http_gobuster_dirbuster.txt'
+    report_path.write_bytes(b''.join(f"/page{number % 40}  (Status: 200) [Size: 10]\n".encode() for number in range(1000)))
+    _, extract = FINDINGS_CLASSIFIER.classify(report_path.name)
+    findings, omitted, bytes_read = extract_findings(report_path, extract, limit=25)
+    assert findings == [f"200 /page{number}" for number in range(25)]
+    assert omitted == 15
+    assert bytes_read == report_path.stat().st_size
+
+
+def test_extract_findings_cuts_overlong_lines(tmp_path):
+    report_path = tmp_path / 'tcp_80_http_gobuster_dirbuster.txt'
+    overlong_url = '/' + 'a' * (3 * MAX_LINE_LENGTH)
+    report_path.write_bytes(f"{overlong_url} (Status: 200)\n/after (Status: 200)\n".encode())
+    _, extract = FINDINGS_CLASSIFIER.classify(report_path.name)
+    findings, omitted, _ = extract_findings(report_path, extract)
+    # the cut line has no status left to match, and the rest of it is not read as separate lines
+    assert findings == ['200 /after']
+    assert omitted == 0
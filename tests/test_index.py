@@ -0,0 +1,36 @@
+from autorecon2obsidian.index import ReportIndex
+
+
+def write_report(tmp_path, lines):
+    report_path = tmp_path / 'tcp_80_http_nmap.txt'
+    report_path.write_text(''.join(f"{line}\n" for line in lines))
+    return report_path
+
+
+def search_words(report_index, *words):
+    return {word for word in words if report_index.search(word)}
+
+
+def test_reports_within_the_limit_are_indexed_whole(tmp_path):
+    report_path = write_report(tmp_path, ['first', 'middle', 'last'])
+    report_index = ReportIndex(tmp_path / 'index.sqlite3', 4096)
+    assert report_index.update_target('HTB', 'Box', [('tcp', 80, 'nmap', report_path.name, 'a', report_path)]) == 1
+    assert search_words(report_index, 'first', 'middle', 'last') == {'first', 'middle', 'last'}
+
+
+def test_oversized_reports_are_indexed_by_their_head_and_tail(tmp_path):
+    report_path = write_report(tmp_path, ['first'] + [f"filler{number:05}" for number in range(10000)] + ['last'])
+    report_index = ReportIndex(tmp_path / 'index.sqlite3', 1024)
+    report_index.update_target('HTB', 'Box', [('tcp', 80, 'nmap', report_path.name, 'a', report_path)])
+    assert search_words(report_index, 'first', 'filler05000', 'last') == {'first', 'last'}
+    # Lines cut by the excerpt are dropped rather than indexed as partial words
+    body = report_index._read_body(report_path)
+    assert len(body) <= 1024 + 1
+    assert all(line in ('first', 'last') or len(line) == len('filler00000') for line in body.splitlines() if line)
+
+
+def test_a_limit_of_zero_indexes_everything(tmp_path):
+    report_path = write_report(tmp_path, ['first'] + [f"filler{number:05}" for number in range(10000)] + ['last'])
+    report_index = ReportIndex(tmp_path / 'index.sqlite3')
+    report_index.update_target('HTB', 'Box', [('tcp', 80, 'nmap', report_path.name, 'a', report_path)])
+    assert search_words(report_index, 'first', 'filler05000', 'last') == {'first', 'filler05000', 'last'}
@@ -0,0 +1,62 @@
+import itertools
+
+from autorecon2obsidian.reports import REPORT_PATTERNS, FilenameClassifier
+
+# A fragment registered on top of the shipped ones that overlaps smbmap-share-permissions.txt and
+# the other smbmap fragments
+EXTRA_PATTERNS = [('smbmap', 'smbmap-generic', 'Unknown')]
+
+
+def longest_key_scan(file_name, patterns):
+    # The substring loop the classifier replaced: every key found in the name is a candidate, the
+    # longest wins and equal lengths go to the one starting first
+    best = None
+    for pattern, value in patterns.items():
+        start = file_name.find(pattern)
+        if start < 0:
+            continue
+        if best is None or len(pattern) > len(best[0]) or (len(pattern) == len(best[0]) and start < best[1]):
+            best = (pattern, start)
+    return patterns[best[0]] if best else FilenameClassifier.UNKNOWN
+
+
+def file_names(patterns):
+    for pattern in patterns:
+        yield pattern
+        yield f"tcp_445{pattern}"
+        yield f"udp_161_{pattern}"
+        yield f"{pattern}.bak"
+    # two fragments in one name, so every overlap between keys is exercised
+    for first, second in itertools.permutations(list(patterns)[:40], 2):
+        yield f"tcp_80{first}{second}"
+    yield 'notes.txt'
+    yield ''
+
+
+def test_classify_matches_longest_key_scan_for_shipped_patterns():
+    classifier = FilenameClassifier(REPORT_PATTERNS)
+    patterns = {pattern: (tool, command) for pattern, tool, command in REPORT_PATTERNS}
+    for file_name in file_names(patterns):
+        assert classifier.classify(file_name) == longest_key_scan(file_name, patterns), file_name
+
+
+def test_classify_matches_longest_key_scan_with_overlapping_extra_pattern():
+    classifier = FilenameClassifier(REPORT_PATTERNS + EXTRA_PATTERNS)
+    patterns = {pattern: (tool, command) for pattern, tool, command in REPORT_PATTERNS + EXTRA_PATTERNS}
+    for file_name in file_names(patterns):
+        assert classifier.classify(file_name) == longest_key_scan(file_name, patterns), file_name
+
+
+def test_longer_fragment_wins_regardless_of_registration_order():
+    classifier = FilenameClassifier(REPORT_PATTERNS + EXTRA_PATTERNS)
+    assert classifier.classify('smbmap-share-permissions.txt')[0] == 'smbmap'
+    assert classifier.classify('smbmap-other.txt')[0] == 'smbmap-generic'
+    assert classifier.classify('tcp_445_smb_nmap.txt') == classifier.patterns['_smb_nmap.txt']
+    assert classifier.classify('udp_161_snmp_snmpwalk_user_accounts.txt') == classifier.patterns['_snmp_snmpwalk_user_accounts.txt']
+
+
+def test_registering_a_pattern_rebuilds_the_automaton():
+    classifier = FilenameClassifier(REPORT_PATTERNS)
+    assert classifier.classify('tcp_80_mytool.txt') == FilenameClassifier.UNKNOWN
+    classifier.register('_mytool.txt', 'mytool', 'Unknown')
+    assert classifier.classify('tcp_80_mytool.txt') == ('mytool', 'Unknown')
@@ -0,0 +1,142 @@
+import time
+import tracemalloc
+
+import pytest
+
+from autorecon2obsidian.constants import DEFAULT_SERVICE_INDEX
+from autorecon2obsidian.services import NmapServiceIndex, OfflineServiceIndex, ServiceNameCache
+
+
+NMAP_PORT = (
+    '<port protocol="{protocol}" portid="{port}"><state state="{state}" reason="syn-ack"/>'
+    '<service name="{name}" product="Product" version="1.0" method="{method}" conf="{confidence}"/>'
+    '<script id="banner" output="{output}"/></port>\n'
+)
+
+
+def write_nmap_xml(xml_path, ports, complete=True):
+    with open(xml_path, 'w') as file_handle:
+        file_handle.write('<?xml version="1.0"?>\n<nmaprun><host><address addr="10.10.10.10"/><ports>\n')
+        for port in ports:
+            file_handle.write(NMAP_PORT.format(**{'protocol': 'tcp', 'state': 'open', 'method': 'probed', 'confidence': 10, 'output': '', **port}))
+        if complete:
+            file_handle.write('</ports></host></nmaprun>\n')
+
+
+@pytest.mark.parametrize('protocol, port, name', [
+    ('tcp', 22, 'ssh'),
+    ('tcp', 445, 'microsoft-ds'),
+    ('tcp', 3306, 'mysql'),
+    ('tcp', 5985, 'wsman'),
+    ('tcp', 9389, 'adws'),
+    ('tcp', 47001, 'winrm'),
+    ('udp', 161, 'snmp'),
+    ('tcp', 49667, None),
+])
+def test_bundled_service_index_covers_the_registry(protocol, port, name):
+    service_index = OfflineServiceIndex.load(DEFAULT_SERVICE_INDEX)
+    assert service_index.lookup(protocol, port) == name
+
+
+def test_parse_keeps_open_identified_ports(tmp_path):
+    write_nmap_xml(tmp_path / 'scan.xml', [
+        {'port': 22, 'name': 'ssh'},
+        {'port': 23, 'name': 'telnet', 'state': 'closed'},
+        {'port': 53, 'name': 'domain', 'protocol': 'udp', 'state': 'open|filtered'},
+        {'port': 80, 'name': 'tcpwrapped'},
+        {'port': 81, 'name': 'unknown'},
+    ])
+    services = NmapServiceIndex().parse(tmp_path / 'scan.xml')
+    assert sorted(services) == [('tcp', 22), ('udp', 53)]
+    assert services[('tcp', 22)].describe() == 'Product 1.0'
+
+
+def test_parse_keeps_the_complete_ports_of_a_file_being_written(tmp_path):
+    write_nmap_xml(tmp_path / 'scan.xml', [{'port': 22, 'name': 'ssh'}, {'port': 80, 'name': 'http'}], complete=False)
+    with open(tmp_path / 'scan.xml', 'a') as file_handle:
+        file_handle.write('<port protocol="tcp" portid="443"><state state="op')
+    assert sorted(NmapServiceIndex().parse(tmp_path / 'scan.xml')) == [('tcp', 22), ('tcp', 80)]
+
+
+def test_refresh_prefers_probed_services_across_files(tmp_path):
+    (tmp_path / 'xml').mkdir()
+    (tmp_path / 'tcp80' / 'xml').mkdir(parents=True)
+    write_nmap_xml(tmp_path / 'xml' / '_full_tcp_nmap.xml', [{'port': 80, 'name': 'http', 'method': 'table', 'confidence': 3}])
+    write_nmap_xml(tmp_path / 'tcp80' / 'xml' / 'tcp_80_http_nmap.xml', [{'port': 80, 'name': 'http-proxy'}])
+    service_index = NmapServiceIndex()
+    assert service_index.refresh(tmp_path)[('tcp', 80)].name == 'http-proxy'
+    (tmp_path / 'tcp80' / 'xml' / 'tcp_80_http_nmap.xml').unlink()
+    assert service_index.refresh(tmp_path)[('tcp', 80)].name == 'http'
+
+
+def test_parse_of_a_large_single_host_file_stays_in_constant_memory(tmp_path):
+    # One host with every port open and a long script output per port, the shape of an autorecon
+    # full port scan. Nothing but the parsed services may outlive its port element
+    ports = [{'port': port, 'name': 'http', 'output': 'x' * 2000} for port in range(1, 10001)]
+    write_nmap_xml(tmp_path / 'scan.xml', ports)
+    xml_size = (tmp_path / 'scan.xml').stat().st_size
+    tracemalloc.start()
+    try:
+        services = NmapServiceIndex().parse(tmp_path / 'scan.xml')
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert len(services) == 10000
+    assert peak < xml_size / 4
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time, 'time', fake_clock)
+    return fake_clock
+
+
+def test_service_cache_entries_expire_after_the_ttl(tmp_path, clock):
+    service_cache = ServiceNameCache(tmp_path / 'services.sqlite3', 1, 100)
+    service_cache.put_many([(80, '[]', 'HTTP'), (445, '[]', 'SMB')])
+    clock.now += 86400 - 1
+    assert service_cache.get_many([80, 445, 8080]) == {80: 'HTTP', 445: 'SMB'}
+    clock.now += 2
+    assert service_cache.get_many([80, 445]) == {}
+    # whatportis being down falls back to expired names
+    assert service_cache.get_many([80, 445], include_expired=True) == {80: 'HTTP', 445: 'SMB'}
+    service_cache.close()
+
+
+def test_service_cache_drops_expired_entries_when_it_is_written(tmp_path, clock):
+    service_cache = ServiceNameCache(tmp_path / 'services.sqlite3', 1, 100)
+    service_cache.put_many([(80, '[]', 'HTTP')])
+    clock.now += 2 * 86400
+    service_cache.put_many([(22, '[]', 'SSH')])
+    assert service_cache.get_many([22, 80], include_expired=True) == {22: 'SSH'}
+    service_cache.close()
+
+
+def test_service_cache_keeps_the_most_recent_entries_up_to_its_size(tmp_path, clock):
+    service_cache = ServiceNameCache(tmp_path / 'services.sqlite3', 30, 2)
+    for port, name in ((21, 'FTP'), (22, 'SSH'), (80, 'HTTP')):
+        service_cache.put_many([(port, '[]', name)])
+        clock.now += 1
+    assert service_cache.get_many([21, 22, 80]) == {22: 'SSH', 80: 'HTTP'}
+    service_cache.put_many([(21, '[]', 'FTP')])
+    assert service_cache.get_many([21, 22, 80]) == {21: 'FTP', 80: 'HTTP'}
+    service_cache.close()
+
+
+def test_service_cache_persists_between_runs(tmp_path, clock):
+    service_cache = ServiceNameCache(tmp_path / 'cache' / 'services.sqlite3', 30, 100)
+    service_cache.put_many([(3389, '[]', 'RDP')])
+    service_cache.close()
+    service_cache = ServiceNameCache(tmp_path / 'cache' / 'services.sqlite3', 30, 100)
+    assert service_cache.get_many([3389]) == {3389: 'RDP'}
+    service_cache.close()
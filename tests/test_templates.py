@@ -0,0 +1,100 @@
+import io
+import shutil
+
+import pytest
+
+from autorecon2obsidian.templates import StreamedValue, Template, TemplateError
+
+
+def render(source, context):
+    output = io.BytesIO()
+    Template(source).render(context, output)
+    return output.getvalue().decode('utf-8')
+
+
+class RecordingOutput:
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+
+def test_values_attributes_and_filters():
+    assert render('{{ port.name | upper }} {{ tools | join }}', {'port': {'name': 'http'}, 'tools': ['nmap', 'nikto']}) == 'HTTP nmap, nikto'
+
+
+def test_nested_for_and_if():
+    source = (
+        '{% for port in ports %}\n'
+        '{% if port.detailed %}\n'
+        '{{ port.number }}:{% for tool in port.tools %} {{ tool }}{% endfor %}\n'
+        '{% else %}\n'
+        '{{ port.number }} skipped\n'
+        '{% endif %}\n'
+        '{% endfor %}\n'
+    )
+    ports = [
+        {'number': 80, 'detailed': True, 'tools': ['nmap', 'nikto']},
+        {'number': 49667, 'detailed': False, 'tools': []},
+        {'number': 22, 'detailed': True, 'tools': []},
+    ]
+    assert render(source, {'ports': ports}) == '80: nmap nikto\n49667 skipped\n22:\n'
+
+
+def test_if_not():
+    source = '{% if not identified %}unknown{% else %}known{% endif %}'
+    assert render(source, {'identified': False}) == 'unknown'
+    assert render(source, {'identified': True}) == 'known'
+
+
+def test_block_tag_lines_are_removed_whole():
+    assert render('a\n  {% if flag %}  \nb\n{% endif %}\nc', {'flag': True}) == 'a\nb\nc'
+
+
+def test_loop_variable_shadows_context():
+    assert render('{% for name in names %}{{ name }}{% endfor %}{{ name }}', {'names': ['a', 'b'], 'name': 'x'}) == 'abx'
+
+
+def test_unknown_names_are_rejected_at_load_time():
+    template = Template('{% for port in ports %}{{ prot.number }}{% endfor %}')
+    with pytest.raises(TemplateError, match="'prot'"):
+        template.check_names({'ports'})
+    with pytest.raises(TemplateError, match="'tagret'"):
+        Template('{% if tagret %}x{% endif %}').check_names({'target'})
+    with pytest.raises(TemplateError, match="'missing'"):
+        Template('{% if target %}{% else %}{{ missing }}{% endif %}').check_names({'target'})
+    Template('{% for port in ports %}{{ port.number }}{% endfor %}').check_names({'ports'})
+
+
+@pytest.mark.parametrize('source', [
+    '{% for port in ports %}',
+    '{% endif %}',
+    '{% if a %}{% endfor %}',
+    '{% else %}',
+    '{% while x %}{% endwhile %}',
+    '{{ port | shout }}',
+    '{{ port.1x }}',
+    '{%  %}',
+])
+def test_malformed_templates_are_rejected(source):
+    with pytest.raises(TemplateError):
+        Template(source)
+
+
+def test_streamed_value_is_written_in_chunks(tmp_path):
+    report_path = tmp_path / 'report.txt'
+    report_path.write_bytes(b'x' * 65536 + b'\xff\xfe not utf-8\n')
+    chunk_size = 4096
+
+    def copy_report(output_handle):
+        with open(report_path, 'rb') as report_handle:
+            shutil.copyfileobj(report_handle, output_handle, chunk_size)
+
+    output = RecordingOutput()
+    Template('<{{ report.output }}>').render({'report': {'output': StreamedValue(copy_report)}}, output)
+    assert b''.join(output.writes) == b'<' + report_path.read_bytes() + b'>'
+    # the body reached the output in bounded pieces, never as one string built from the whole file
+    assert max(len(write) for write in output.writes) <= chunk_size
+    assert len(output.writes) > 65536 // chunk_size
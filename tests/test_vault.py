@@ -0,0 +1,112 @@
+import errno
+import hashlib
+import io
+import os
+
+import pytest
+
+from autorecon2obsidian.vault import HashingWriter, VaultStage, copy_file_contents
+
+
+@pytest.fixture
+def stage(tmp_path):
+    (tmp_path / 'vault').mkdir()
+    return VaultStage(tmp_path / 'vault', tmp_path / 'vault' / '.autorecon2obsidian' / 'staging' / 'HTB' / 'Box')
+
+
+def stage_file(stage, output_path, contents, rank):
+    staging_path = stage.reserve(output_path, rank)
+    staging_path.write_text(contents)
+    return staging_path
+
+
+def test_nothing_reaches_the_vault_before_publish(tmp_path, stage):
+    note_path = tmp_path / 'vault' / 'notes' / 'note.md'
+    staging_path = stage_file(stage, note_path, 'note', VaultStage.NOTE)
+    assert staging_path.is_file() and not note_path.exists()
+    assert stage.publish() == 1
+    assert note_path.read_text() == 'note'
+    assert not stage.staging_dir.exists()
+
+
+def test_publish_moves_assets_then_notes_then_the_master_document(tmp_path, stage, monkeypatch):
+    vault_dir = tmp_path / 'vault'
+    stage_file(stage, vault_dir / 'Master.md', 'master', VaultStage.MASTER)
+    stage_file(stage, vault_dir / 'logs' / 'tcp' / '80.md', 'note', VaultStage.NOTE)
+    stage_file(stage, vault_dir / 'objects' / 'body.md', 'object', VaultStage.ASSET)
+    stage_file(stage, vault_dir / 'logs' / 'tcp' / '22.md', 'note', VaultStage.NOTE)
+    published = []
+    replace = os.replace
+
+    def record_replace(source, destination):
+        published.append(os.path.relpath(destination, vault_dir))
+        replace(source, destination)
+
+    monkeypatch.setattr(os, 'replace', record_replace)
+    assert stage.publish() == 4
+    assert published[0] == os.path.join('objects', 'body.md')
+    assert sorted(published[1:3]) == [os.path.join('logs', 'tcp', '22.md'), os.path.join('logs', 'tcp', '80.md')]
+    assert published[3] == 'Master.md'
+
+
+def test_an_output_is_only_reserved_once(tmp_path, stage):
+    note_path = tmp_path / 'vault' / 'note.md'
+    assert stage.reserve(note_path, VaultStage.NOTE) is not None
+    assert stage.reserve(note_path, VaultStage.NOTE) is None
+
+
+def test_a_released_output_is_not_published(tmp_path, stage):
+    kept_path = tmp_path / 'vault' / 'kept.md'
+    kept_path.write_text('unchanged')
+    staging_path = stage_file(stage, kept_path, 'unchanged', VaultStage.NOTE)
+    kept_mtime_ns = kept_path.stat().st_mtime_ns
+    stage.release(kept_path)
+    assert not staging_path.exists()
+    assert stage.publish() == 0
+    assert kept_path.stat().st_mtime_ns == kept_mtime_ns
+    # released outputs can be reserved again
+    assert stage.reserve(kept_path, VaultStage.NOTE) is not None
+
+
+def test_discard_leaves_the_vault_as_it_was(tmp_path, stage):
+    note_path = tmp_path / 'vault' / 'note.md'
+    note_path.write_text('old')
+    stage_file(stage, note_path, 'new', VaultStage.NOTE)
+    stage.discard()
+    assert note_path.read_text() == 'old'
+    assert not stage.staging_dir.exists()
+    assert stage.publish() == 0
+
+
+def test_a_stage_left_by_an_interrupted_run_is_cleared(tmp_path, stage):
+    stage_file(stage, tmp_path / 'vault' / 'note.md', 'half written', VaultStage.NOTE)
+    stage = VaultStage(stage.vault_dir, stage.staging_dir)
+    assert not stage.staging_dir.exists()
+    assert stage.publish() == 0
+    assert not (tmp_path / 'vault' / 'note.md').exists()
+
+
+def test_hashing_writer_hashes_what_it_writes():
+    output = io.BytesIO()
+    hashing_writer = HashingWriter(output)
+    hashing_writer.write(b'first ')
+    hashing_writer.write(b'second')
+    assert output.getvalue() == b'first second'
+    assert hashing_writer.size == 12
+    assert hashing_writer.hexdigest() == hashlib.sha256(b'first second').hexdigest()
+
+
+@pytest.mark.parametrize('kernel_copies', ['available', 'unsupported'])
+def test_copy_file_contents_copies_from_the_current_position(tmp_path, monkeypatch, kernel_copies):
+    if kernel_copies == 'unsupported':
+        def unsupported(*arguments):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        monkeypatch.setattr(os, 'copy_file_range', unsupported, raising=False)
+        monkeypatch.setattr(os, 'sendfile', unsupported, raising=False)
+    contents = os.urandom(300000)
+    (tmp_path / 'source').write_bytes(b'header' + contents)
+    with open(tmp_path / 'source', 'rb', buffering=0) as source_handle, open(tmp_path / 'copy', 'wb', buffering=0) as destination_handle:
+        source_handle.seek(len(b'header'))
+        destination_handle.write(b'prefix')
+        assert copy_file_contents(source_handle, destination_handle) == len(contents)
+    assert (tmp_path / 'copy').read_bytes() == b'prefix' + contents
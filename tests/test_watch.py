@@ -0,0 +1,74 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+from autorecon2obsidian.watch import InotifyWatcher, PollingWatcher
+
+
+@pytest.fixture(params=['inotify', 'polling'])
+def make_watcher(request):
+    watchers = []
+
+    def make(root):
+        if request.param == 'polling':
+            watchers.append(PollingWatcher(root, 0.01))
+        else:
+            if not sys.platform.startswith('linux'):
+                pytest.skip('inotify is only available on Linux')
+            watchers.append(InotifyWatcher(root))
+        return watchers[-1]
+
+    yield make
+    for watcher in watchers:
+        watcher.close()
+
+
+def wait_for(watcher, expected_path):
+    # inotify reports a burst of writes over several reads, polling in one snapshot
+    changed_paths = set()
+    for _ in range(50):
+        changed_paths |= watcher.wait(0.1)
+        if str(expected_path) in changed_paths:
+            return changed_paths
+    pytest.fail(f"{expected_path} was not reported, only {sorted(changed_paths)}")
+
+
+def test_nothing_changed_returns_no_paths_after_the_timeout(tmp_path, make_watcher):
+    (tmp_path / 'tcp80').mkdir()
+    watcher = make_watcher(tmp_path)
+    assert watcher.wait(0.05) == set()
+
+
+def test_a_report_written_to_a_port_directory_is_reported(tmp_path, make_watcher):
+    (tmp_path / 'tcp80').mkdir()
+    watcher = make_watcher(tmp_path)
+    (tmp_path / 'tcp80' / 'tcp_80_http_nikto.txt').write_text('+ Server: Apache\n')
+    wait_for(watcher, tmp_path / 'tcp80' / 'tcp_80_http_nikto.txt')
+
+
+def test_reports_in_a_new_port_directory_are_reported(tmp_path, make_watcher):
+    watcher = make_watcher(tmp_path)
+    (tmp_path / 'tcp8080' / 'xml').mkdir(parents=True)
+    wait_for(watcher, tmp_path / 'tcp8080')
+    # the new directory is watched from now on
+    (tmp_path / 'tcp8080' / 'xml' / 'tcp_8080_http_nmap.xml').write_text('<nmaprun/>')
+    wait_for(watcher, tmp_path / 'tcp8080' / 'xml' / 'tcp_8080_http_nmap.xml')
+
+
+def test_a_removed_port_directory_is_reported(tmp_path, make_watcher):
+    (tmp_path / 'udp53').mkdir()
+    (tmp_path / 'udp53' / 'udp_53_dns_nmap.txt').write_text('53/udp open domain\n')
+    watcher = make_watcher(tmp_path)
+    shutil.rmtree(tmp_path / 'udp53')
+    wait_for(watcher, tmp_path / 'udp53')
+
+
+def test_a_report_replaced_by_a_rename_is_reported(tmp_path, make_watcher):
+    (tmp_path / 'tcp22').mkdir()
+    (tmp_path / 'tcp22' / 'tcp_22_ssh_nmap.txt').write_text('22/tcp open ssh\n')
+    watcher = make_watcher(tmp_path)
+    (tmp_path / 'partial').write_text('22/tcp open ssh OpenSSH 8.2p1\n')
+    os.replace(tmp_path / 'partial', tmp_path / 'tcp22' / 'tcp_22_ssh_nmap.txt')
+    wait_for(watcher, tmp_path / 'tcp22' / 'tcp_22_ssh_nmap.txt')
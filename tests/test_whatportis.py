@@ -0,0 +1,97 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from autorecon2obsidian.services import WhatportisError
+from autorecon2obsidian.whatportis import WhatportisClient
+
+
+def open_circuit(client):
+    for _ in range(client.failure_threshold):
+        client._record_failure(OSError('connection refused'))
+
+
+def make_client():
+    return WhatportisClient('127.0.0.1', 9, 4, 1.0, 1.0, 0, 2)
+
+
+def test_open_circuit_fails_lookups_until_the_cooldown_has_passed(capsys):
+    client = make_client()
+    open_circuit(client)
+    assert 'failed 2 requests in a row' in capsys.readouterr().err
+    with pytest.raises(WhatportisError):
+        client._check_circuit(None)
+
+
+def test_half_open_circuit_lets_exactly_one_probe_through():
+    client = make_client()
+    open_circuit(client)
+    client.retry_at = time.monotonic() - 1
+    passed = []
+    failed = []
+    barrier = threading.Barrier(8)
+
+    def lookup():
+        barrier.wait()
+        try:
+            passed.append(client._check_circuit(None))
+        except WhatportisError:
+            failed.append(True)
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert passed == [True]
+    assert len(failed) == 7
+
+
+def test_successful_probe_closes_the_circuit():
+    client = make_client()
+    open_circuit(client)
+    client.retry_at = time.monotonic() - 1
+    assert client._check_circuit(None) is True
+    client._record_success()
+    assert client._check_circuit(None) is False
+    assert client._check_circuit(None) is False
+
+
+def test_failed_probe_opens_the_circuit_for_another_cooldown():
+    client = make_client()
+    open_circuit(client)
+    client.retry_at = time.monotonic() - 1
+    assert client._check_circuit(None) is True
+    client._record_failure(OSError('connection refused'))
+    assert client.retry_at > time.monotonic() + client.BREAKER_COOLDOWN - 5
+    with pytest.raises(WhatportisError):
+        client._check_circuit(None)
+
+
+def test_abandoned_probe_lets_the_next_lookup_probe():
+    client = make_client()
+    open_circuit(client)
+    client.retry_at = time.monotonic() - 1
+    assert client._check_circuit(None) is True
+    client._abandon_probe()
+    assert client._check_circuit(None) is True
+
+
+def test_lookups_fail_fast_against_a_refused_port():
+    pytest.importorskip('requests')
+    with socket.socket() as listener:
+        listener.bind(('127.0.0.1', 0))
+        refused_port = listener.getsockname()[1]
+    client = WhatportisClient('127.0.0.1', refused_port, 4, 1.0, 1.0, 0, 2)
+    try:
+        for _ in range(2):
+            with pytest.raises(WhatportisError, match='failed'):
+                client.get('/ports/80')
+        started = time.monotonic()
+        with pytest.raises(WhatportisError, match='not queried'):
+            client.get('/ports/80')
+        assert time.monotonic() - started < 0.5
+    finally:
+        client.close()
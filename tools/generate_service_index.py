@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Builds the offline port -> service name index shipped in the autorecon2obsidian package.
+#
+# Usage:
+#   curl -O https://www.iana.org/assignments/service-names-port-numbers/service-names-port-numbers.csv
+#   tools/generate_service_index.py tools/service-index-overrides.csv service-names-port-numbers.csv
+#
+# Sources are read in order and the first name seen for a port/protocol wins, which matches the
+# first row whatportis returns for a port. Each source is either the IANA registry CSV (or a CSV
+# with the same header) or a services(5) style file such as /etc/services.
+
+import argparse
+import csv
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+
+INDEX_MAGIC = b'A2OSIDX1'
+PORT_COUNT = 65536
+PROTOCOLS = ('tcp', 'udp')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Generate the offline port to service name index')
+    parser.add_argument('sources', nargs='+', help='IANA service-names-port-numbers.csv or services(5) files, highest priority first')
+    parser.add_argument('-o', '--output', default=str(Path(__file__).resolve().parent.parent / 'autorecon2obsidian' / 'service-index.bin'), help='Index file to write')
+    return parser.parse_args()
+
+
+def _expand_ports(port_field):
+    if '-' in port_field:
+        first, last = port_field.split('-', 1)
+        return range(int(first), int(last) + 1)
+    return range(int(port_field), int(port_field) + 1)
+
+
+def read_iana_csv(source):
+    with open(source, newline='', encoding='utf-8') as file_handle:
+        for row in csv.DictReader(file_handle):
+            service_name = (row.get('Service Name') or '').strip()
+            port_field = (row.get('Port Number') or '').strip()
+            protocol = (row.get('Transport Protocol') or '').strip().lower()
+            if not service_name or not port_field or protocol not in PROTOCOLS:
+                continue
+            for port in _expand_ports(port_field):
+                yield protocol, port, service_name
+
+
+def read_services_file(source):
+    with open(source, encoding='utf-8') as file_handle:
+        for line in file_handle:
+            fields = line.split('#', 1)[0].split()
+            if len(fields) < 2 or '/' not in fields[1]:
+                continue
+            port, protocol = fields[1].split('/', 1)
+            if protocol in PROTOCOLS and port.isdigit():
+                yield protocol, int(port), fields[0]
+
+
+def read_source(source):
+    with open(source, encoding='utf-8') as file_handle:
+        first_line = file_handle.readline()
+    if first_line.startswith('Service Name,'):
+        return read_iana_csv(source)
+    return read_services_file(source)
+
+
+def build_index(sources):
+    names = ['']
+    name_ids = {}
+    tables = {protocol: array('H', bytes(2 * PORT_COUNT)) for protocol in PROTOCOLS}
+    for source in sources:
+        for protocol, port, service_name in read_source(source):
+            if port >= PORT_COUNT or tables[protocol][port]:
+                continue
+            if service_name not in name_ids:
+                name_ids[service_name] = len(names)
+                names.append(service_name)
+            tables[protocol][port] = name_ids[service_name]
+    if len(names) > 0xFFFF:
+        raise ValueError(f"Too many distinct service names for a 16-bit index: {len(names)}")
+    return names, tables
+
+
+def encode_index(names, tables):
+    names_blob = '\n'.join(names).encode('utf-8')
+    payload = [struct.pack('<II', len(names), len(names_blob)), names_blob]
+    for protocol in PROTOCOLS:
+        table = array('H', tables[protocol])
+        if sys.byteorder != 'little':
+            table.byteswap()
+        payload.append(table.tobytes())
+    return INDEX_MAGIC + zlib.compress(b''.join(payload), 9)
+
+
+def main():
+    arguments = parse_arguments()
+    names, tables = build_index(arguments.sources)
+    Path(arguments.output).write_bytes(encode_index(names, tables))
+    assigned = {protocol: sum(1 for entry in tables[protocol] if entry) for protocol in PROTOCOLS}
+    print(f"Wrote {arguments.output}: {len(names) - 1} service names, {assigned['tcp']} tcp and {assigned['udp']} udp ports")
+
+
+if __name__ == '__main__':
+    main()